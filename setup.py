@@ -11,7 +11,8 @@ setup(
     name="tibber.py",
     long_description=long_description,
     long_description_content_type='text/markdown',
-    packages=["tibber", "tibber.networking", "tibber.exceptions", "tibber.types"],
+    packages=["tibber", "tibber.live", "tibber.networking", "tibber.exceptions", "tibber.types"],
+    package_data={"tibber.networking": ["tibber_schema.graphql"]},
     install_requires=[
         "gql>=3.4.0",
         "gql[aiohttp]>=3.4.0",
@@ -20,6 +21,10 @@ setup(
         "backoff>=2.2.1",
         "asyncio-atexit>=1.0.1",
     ],
+    extras_require={
+        "numpy": ["numpy>=1.21"],
+        "pandas": ["numpy>=1.21", "pandas>=1.3"],
+    },
     license="MIT",
     version=__version__,
     description="A python wrapper for the Tibber API.",
@@ -50,3 +50,17 @@ def test_set_token(account):
 def test_setting_token_to_non_string_raises_error(account):
     with pytest.raises(TypeError):
         account.token = 105020
+
+def test_async_account_does_not_connect_on_initialization():
+    account = tibber.AsyncAccount(tibber.DEMO_TOKEN)
+    assert account.session is None
+    assert account.name == None
+
+def test_async_account_rejects_immediate_update():
+    with pytest.raises(ValueError):
+        tibber.AsyncAccount(tibber.DEMO_TOKEN, immediate_update=True)
+
+def test_async_account_rejects_blocking_calls():
+    account = tibber.AsyncAccount(tibber.DEMO_TOKEN)
+    with pytest.raises(RuntimeError):
+        account.fetch_all()
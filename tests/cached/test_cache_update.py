@@ -0,0 +1,94 @@
+"""Tests for merging partial API responses into the cache of a tibber.Account."""
+import json
+
+import pytest
+
+import tibber
+
+
+@pytest.fixture
+def cached_account():
+    account = tibber.Account(tibber.DEMO_TOKEN, immediate_update=False)
+    with open("./tests/backup_demo_data.json", "r") as f:
+        account.update_cache(json.load(f))
+    return account
+
+
+def test_partial_refresh_keeps_fields_that_were_not_requested(cached_account):
+    home = cached_account.cache["viewer"]["homes"][0]
+    cached_account.update_cache({
+        "viewer": {
+            "homes": [{
+                "id": home["id"],
+                "currentSubscription": {
+                    "id": home["currentSubscription"]["id"],
+                    "priceInfo": {"current": {"total": 9.99}},
+                },
+            }]
+        }
+    })
+
+    home = cached_account.homes[0]
+    assert home.current_subscription.price_info.current.total == 9.99
+    assert home.app_nickname == "Vitahuset"
+    assert home.current_subscription.price_rating.hourly.currency is not None
+
+def test_cache_update_is_logged_as_a_summary(cached_account, caplog):
+    with caplog.at_level("DEBUG", logger="tibber.account"):
+        cached_account.update_cache({"viewer": {"name": "Sansa Stark"}})
+
+    record, = [record for record in caplog.records if getattr(record, "tibber_event", None) == "cache_updated"]
+    assert record.changed_paths == 1
+    assert record.cached_homes == 1
+    assert "Winterfell" not in caplog.text
+
+def test_homes_keep_their_identity_across_updates(cached_account):
+    home = cached_account.homes[0]
+
+    @home.event("live_measurement")
+    async def callback(data):
+        pass
+
+    cached_account.update_cache({"viewer": {"homes": [{"id": home.id, "size": 250}]}})
+
+    assert cached_account.homes[0] is home
+    assert cached_account.viewer.homes[0] is home
+    assert cached_account.home(home.id) is home
+    assert home.size == 250
+    assert home._callbacks["live_measurement"] == [callback]
+
+def test_removed_homes_are_dropped_on_a_full_refresh():
+    account = tibber.Account(tibber.DEMO_TOKEN, immediate_update=False)
+    account.update_cache({"viewer": {"homes": [{"id": "a"}, {"id": "b"}]}})
+    first_home = account.home("a")
+
+    account.update_home_cache({"id": "c"})
+    assert [home.id for home in account.homes] == ["a", "b", "c"]
+
+    account.update_cache({"viewer": {"homes": [{"id": "a"}]}})
+    assert [home.id for home in account.homes] == ["a"]
+    assert account.home("a") is first_home
+    assert account.home("b") is None
+
+    account.update_cache({"viewer": {"homes": []}})
+    assert account.homes == []
+
+def test_looking_up_an_unknown_home_returns_none(cached_account):
+    assert cached_account.home("not-a-home-id") is None
+
+def test_views_are_reused_until_the_cache_changes(cached_account):
+    home = cached_account.homes[0]
+    subscription = home.current_subscription
+    assert home.current_subscription is subscription
+
+    version = cached_account.cache_version
+    cached_account.update_cache({"viewer": {"homes": [{"id": home.id, "size": home.size}]}})
+    assert cached_account.cache_version == version
+    assert home.current_subscription is subscription
+
+    cached_account.update_cache({
+        "viewer": {"homes": [{"id": home.id, "currentSubscription": {"id": subscription.id, "status": "ended"}}]}
+    })
+    assert cached_account.cache_version == version + 1
+    assert home.current_subscription is not subscription
+    assert home.current_subscription.status == "ended"
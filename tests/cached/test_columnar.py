@@ -0,0 +1,57 @@
+"""Tests for converting connections into NumPy arrays and pandas dataframes."""
+import pytest
+
+from tibber.types.columnar import parse_timestamps
+from tibber.types.home_consumption_connection import HomeConsumptionConnection
+from tibber.types.subscription_price_connection import SubscriptionPriceConnection
+
+np = pytest.importorskip("numpy")
+
+
+CONSUMPTION = {
+    "nodes": [
+        {"from": "2023-02-06T01:00:00.000+01:00", "to": "2023-02-06T02:00:00.000+01:00", "consumption": 3.2, "cost": 1.1},
+        {"from": "2023-02-06T02:00:00.000+01:00", "to": "2023-02-06T03:00:00.000+01:00", "consumption": None, "cost": None},
+    ]
+}
+
+
+def test_timestamps_are_parsed_to_utc():
+    parsed = parse_timestamps(["2023-02-06T01:00:00.000+01:00", "2023-10-29T02:30:15.250-02:30"])
+
+    assert parsed.dtype == np.dtype("datetime64[ms]")
+    assert parsed[0] == np.datetime64("2023-02-06T00:00:00.000")
+    assert parsed[1] == np.datetime64("2023-10-29T05:00:15.250")
+
+def test_timestamps_in_other_formats_are_parsed_separately():
+    parsed = parse_timestamps(["2023-02-06T01:00:00Z", None])
+
+    assert parsed[0] == np.datetime64("2023-02-06T01:00:00.000")
+    assert np.isnat(parsed[1])
+
+def test_consumption_to_arrays():
+    arrays = HomeConsumptionConnection("HOURLY", CONSUMPTION, None).to_arrays()
+
+    assert arrays["from_time"][0] == np.datetime64("2023-02-06T00:00:00.000")
+    assert arrays["to_time"][1] == np.datetime64("2023-02-06T02:00:00.000")
+    assert arrays["consumption"][0] == 3.2
+    assert np.isnan(arrays["cost"][1])
+
+def test_consumption_to_numpy():
+    records = HomeConsumptionConnection("HOURLY", CONSUMPTION, None).to_numpy()
+
+    assert len(records) == 2
+    assert records["consumption"][0] == 3.2
+
+def test_empty_price_connection_to_arrays():
+    arrays = SubscriptionPriceConnection({"nodes": []}, None).to_arrays()
+
+    assert set(arrays) == {"starts_at", "total", "energy", "tax"}
+    assert len(arrays["starts_at"]) == 0
+
+def test_consumption_to_dataframe():
+    pytest.importorskip("pandas")
+    frame = HomeConsumptionConnection("HOURLY", CONSUMPTION, None).to_dataframe()
+
+    assert str(frame.index.tz) == "UTC"
+    assert frame["consumption"].iloc[0] == 3.2
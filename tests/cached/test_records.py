@@ -0,0 +1,58 @@
+"""Tests for the compact record types (Consumption, Production, Price and LiveMeasurement)."""
+import inspect
+import pickle
+
+import pytest
+
+from tibber.types.consumption import Consumption
+from tibber.types.live_measurement import LiveMeasurement
+from tibber.types.production import Production
+from tibber.types import Price
+
+
+NODE = {
+    "from": "2023-02-06T01:00:00.000+01:00",
+    "to": "2023-02-06T02:00:00.000+01:00",
+    "unitPrice": 1.5,
+    "consumption": 3.2,
+    "currency": "SEK",
+}
+
+
+def test_record_fields_are_read_from_the_response():
+    consumption = Consumption(NODE)
+
+    assert consumption.from_time == "2023-02-06T01:00:00.000+01:00"
+    assert consumption.unit_price == 1.5
+    assert consumption.consumption == 3.2
+    assert consumption.cost is None
+
+def test_records_have_no_instance_dict():
+    consumption = Consumption(NODE)
+
+    assert not hasattr(consumption, "__dict__")
+    with pytest.raises(AttributeError):
+        consumption.consumption = 0
+
+def test_records_compare_by_value_and_can_be_pickled():
+    consumption = Consumption(NODE, tibber_client=object())
+
+    assert consumption == Consumption(dict(NODE))
+    unpickled = pickle.loads(pickle.dumps(consumption))
+    assert unpickled == consumption
+    assert unpickled.tibber_client is None
+    assert consumption.cache["unitPrice"] == 1.5
+
+@pytest.mark.parametrize("record_type", [Consumption, Production, Price, LiveMeasurement])
+def test_record_attributes_are_documented(record_type):
+    for attribute, _, doc in record_type.FIELDS:
+        assert inspect.getdoc(getattr(record_type, attribute)) == doc
+
+    assert inspect.getdoc(LiveMeasurement.power) == "Consumption at the moment (Watt)"
+
+def test_cached_prices_are_records(home):
+    price = home.current_subscription.price_info.current
+
+    assert isinstance(price, Price)
+    assert price.currency == "SEK"
+    assert price.tibber_client is home.tibber_client
@@ -0,0 +1,53 @@
+"""Tests for merging API responses into a cache with the CacheMerger."""
+from tibber.networking import CacheMerger
+
+
+def test_homes_are_merged_by_id():
+    cache = {"viewer": {"homes": [{"id": "a", "size": 1}, {"id": "b", "size": 2}]}}
+    first_home = cache["viewer"]["homes"][0]
+
+    changes = CacheMerger.merge(cache, {"viewer": {"homes": [{"id": "a", "size": 10}]}}, partial=True)
+
+    assert cache["viewer"]["homes"] == [{"id": "a", "size": 10}, {"id": "b", "size": 2}]
+    assert cache["viewer"]["homes"][0] is first_home
+    assert changes == {("viewer", "homes", "a", "size")}
+
+def test_new_homes_are_appended():
+    cache = {"viewer": {"homes": [{"id": "a"}]}}
+    changes = CacheMerger.merge(cache, {"viewer": {"homes": [{"id": "b"}]}}, partial=True)
+
+    assert [home["id"] for home in cache["viewer"]["homes"]] == ["a", "b"]
+    assert changes == {("viewer", "homes", "b")}
+
+def test_full_merge_removes_homes_missing_from_the_response():
+    cache = {"viewer": {"homes": [{"id": "a", "size": 1}, {"id": "b", "size": 2}]}}
+    first_home = cache["viewer"]["homes"][0]
+
+    changes = CacheMerger.merge(cache, {"viewer": {"homes": [{"id": "a"}]}})
+
+    assert cache["viewer"]["homes"] == [{"id": "a", "size": 1}]
+    assert cache["viewer"]["homes"][0] is first_home
+    assert changes == {("viewer", "homes", "b")}
+
+def test_prices_are_matched_by_start_time_and_stale_prices_dropped():
+    cache = {"today": [{"startsAt": "00", "total": 1}, {"startsAt": "01", "total": 2}]}
+    kept_price = cache["today"][1]
+
+    changes = CacheMerger.merge(cache, {"today": [{"startsAt": "01", "total": 2}, {"startsAt": "02", "total": 3}]})
+
+    assert cache["today"] == [{"startsAt": "01", "total": 2}, {"startsAt": "02", "total": 3}]
+    assert cache["today"][0] is kept_price
+    assert changes == {("today", "00"), ("today", "02")}
+
+def test_merging_identical_data_reports_no_changes():
+    cache = {"viewer": {"name": "Arya", "accountType": ["tibber"], "homes": [{"id": "a", "address": None}]}}
+    data = {"viewer": {"name": "Arya", "accountType": ["tibber"], "homes": [{"id": "a", "address": None}]}}
+
+    assert CacheMerger.merge(cache, data) == set()
+
+def test_values_replaced_by_null_are_reported():
+    cache = {"address": {"city": "Winterfell"}}
+    changes = CacheMerger.merge(cache, {"address": None})
+
+    assert cache == {"address": None}
+    assert changes == {("address",)}
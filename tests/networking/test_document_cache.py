@@ -0,0 +1,43 @@
+"""Tests for the cache of parsed GraphQL documents."""
+import pytest
+from graphql import GraphQLError, build_schema
+
+from tibber.networking import QueryBuilder, schema
+from tibber.networking.document_cache import DocumentCache
+
+
+def test_repeated_queries_are_parsed_once():
+    cache = DocumentCache()
+    query = QueryBuilder.query_all_data()
+
+    first = cache.get(query)
+    second = cache.get(query)
+
+    assert first is second
+    assert cache.info == {"hits": 1, "misses": 1, "size": 1, "maxsize": 128}
+
+def test_least_recently_used_document_is_evicted():
+    cache = DocumentCache(maxsize=2)
+    cache.get("{ viewer { name } }")
+    cache.get("{ viewer { login } }")
+    cache.get("{ viewer { name } }")
+    cache.get("{ viewer { userId } }")
+
+    assert len(cache) == 2
+    cache.get("{ viewer { name } }")
+    assert cache.hits == 2
+
+def test_invalid_queries_are_rejected():
+    cache = DocumentCache()
+    with pytest.raises(GraphQLError):
+        cache.get("{ viewer { notAField } }")
+    with pytest.raises(GraphQLError):
+        cache.get("{ viewer { name }")
+    assert len(cache) == 0
+
+def test_invalid_queries_are_rejected_with_the_schema_of_the_api(monkeypatch):
+    monkeypatch.setattr(schema, "_server_schema", build_schema(schema.SCHEMA_SNAPSHOT_PATH.read_text()))
+    cache = DocumentCache()
+    with pytest.raises(GraphQLError):
+        cache.get("{ viewer { notAField } }")
+    assert len(cache) == 0
@@ -0,0 +1,73 @@
+"""Tests for the background event loop which runs the queries of the synchronous API."""
+import asyncio
+import threading
+
+import asyncio_atexit
+import pytest
+
+from tibber.networking.event_loop import BackgroundEventLoop
+from tibber.networking.query_executor import QueryExecutor
+
+
+class ThreadRecordingSession:
+    """Answers every request and records the thread it was executed on."""
+
+    def __init__(self, response):
+        self.response = response
+        self.threads = []
+
+    async def execute(self, request, variable_values=None):
+        self.threads.append(threading.current_thread().name)
+        return self.response
+
+
+class OfflineExecutor(QueryExecutor):
+    token = "token"
+
+
+@pytest.fixture
+def background_loop():
+    loop = BackgroundEventLoop()
+    yield loop
+    loop.close()
+
+
+def test_execute_query_can_be_called_from_a_running_event_loop():
+    executor = OfflineExecutor(ThreadRecordingSession({"viewer": {"name": "Arya Stark"}}))
+
+    async def main():
+        return executor.execute_query(executor.token, "{ viewer { name } }")
+
+    assert asyncio.run(main()) == {"viewer": {"name": "Arya Stark"}}
+    assert executor.session.threads == ["tibber-event-loop"]
+
+def test_exceptions_propagate_through_run(background_loop):
+    async def fail():
+        raise ValueError("Raised on the background loop")
+
+    with pytest.raises(ValueError, match="Raised on the background loop"):
+        background_loop.run(fail())
+
+def test_blocking_from_inside_the_loop_is_rejected(background_loop):
+    async def nested():
+        return background_loop.run(asyncio.sleep(0))
+
+    with pytest.raises(RuntimeError):
+        background_loop.run(nested())
+
+def test_close_stops_the_thread_and_runs_the_exit_callbacks(background_loop):
+    closed = []
+
+    async def register():
+        async def on_exit():
+            closed.append(True)
+
+        asyncio_atexit.register(on_exit)
+
+    background_loop.run(register())
+    background_loop.close()
+
+    assert closed == [True]
+    assert background_loop.loop.is_closed()
+    assert not background_loop._thread.is_alive()
+    background_loop.close()  # Closing twice does nothing
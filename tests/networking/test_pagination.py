@@ -0,0 +1,100 @@
+"""Tests for iterating over paginated history with a stand-in for the gql session."""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import tibber
+from tibber.networking.cursor import decode_cursor, encode_cursor
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+HOURS = 50
+
+
+class HistorySession:
+    """Answers consumption queries with hourly nodes from START, like the API pages them."""
+
+    def __init__(self):
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def execute(self, request, variable_values=None):
+        # gql 3 sessions are called with the document and its variables instead of a request.
+        variables = getattr(request, "variable_values", variable_values)
+        self.requests.append(variables)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        first = START
+        if "after" in variables:
+            first = max(START, decode_cursor(variables["after"]) + timedelta(milliseconds=1))
+            # Round up to the next whole hour, like the start of a node.
+            first = START + timedelta(hours=-(-(first - START) // timedelta(hours=1)))
+        count = max(0, min(variables["first"], (START + timedelta(hours=HOURS) - first) // timedelta(hours=1)))
+        times = [first + timedelta(hours=i) for i in range(count)]
+        nodes = [{"from": time.isoformat(timespec="milliseconds"), "consumption": 1.0} for time in times]
+        return {"viewer": {"home": {"consumption": {
+            "pageInfo": {
+                "endCursor": encode_cursor(times[-1]) if times else None,
+                "hasNextPage": bool(times) and times[-1] < START + timedelta(hours=HOURS - 1),
+            },
+            "nodes": nodes,
+            "edges": [{"cursor": encode_cursor(node["from"]), "node": node} for node in nodes],
+        }}}}
+
+
+@pytest.fixture
+def home():
+    account = tibber.Account(tibber.DEMO_TOKEN, immediate_update=False)
+    account.session = HistorySession()
+    return tibber.TibberHome({"id": "home-id"}, account)
+
+
+def collect(iterator):
+    async def run():
+        return [node async for node in iterator]
+    return asyncio.run(run())
+
+
+def test_cursors_round_trip():
+    cursor = encode_cursor("2023-02-06T01:00:00.000+01:00")
+
+    assert cursor == "MjAyMy0wMi0wNlQwMTowMDowMC4wMDArMDE6MDA="
+    assert decode_cursor(cursor) == datetime(2023, 2, 6, tzinfo=timezone.utc)
+
+def test_iterating_follows_the_cursors_until_the_last_page(home):
+    nodes = collect(home.iter_consumption("HOURLY", page_size=8))
+
+    assert len(nodes) == HOURS
+    assert len(home.tibber_client.session.requests) == 7
+
+def test_iterating_a_time_range(home):
+    since, until = START + timedelta(hours=5), START + timedelta(hours=20)
+    nodes = collect(home.iter_consumption("HOURLY", since=since, until=until, page_size=4))
+
+    times = [datetime.fromisoformat(node.from_time) for node in nodes]
+    assert times == [since + timedelta(hours=i) for i in range(15)]
+    assert len(home.tibber_client.session.requests) <= 5
+
+def test_invalid_page_size(home):
+    with pytest.raises(ValueError):
+        collect(home.iter_consumption("HOURLY", page_size=0))
+
+def test_fetching_a_period_in_parallel_chunks(home):
+    since, until = START + timedelta(hours=3), START + timedelta(hours=43)
+    connection = home.fetch_consumption_between("HOURLY", since, until, chunk_size=10, concurrency=2)
+
+    times = [datetime.fromisoformat(node.from_time) for node in connection.nodes]
+    assert times == [since + timedelta(hours=i) for i in range(40)]
+    assert [edge.node.from_time for edge in connection.edges] == [node.from_time for node in connection.nodes]
+    assert connection.page_info.count == 40
+    assert len(home.tibber_client.session.requests) == 4
+    assert home.tibber_client.session.max_in_flight == 2
+
+def test_fetching_a_period_past_the_end_of_the_data(home):
+    since = START + timedelta(hours=45)
+    connection = home.fetch_consumption_between("HOURLY", since, since + timedelta(hours=30), chunk_size=10)
+
+    assert len(connection.nodes) == HOURS - 45
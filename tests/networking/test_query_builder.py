@@ -0,0 +1,81 @@
+"""Tests for building queries with the QueryBuilder."""
+import timeit
+
+import pytest
+
+from tibber.networking import QueryBuilder
+
+
+def legacy_create_query_from_dict(query_dict, indentation=0, last=True):
+    """The string concatenating implementation QueryBuilder.create_query_from_dict replaced."""
+    string_query = "{\n"
+    for key, value in query_dict.items():
+        if isinstance(value, dict):
+            string_query += " " * (indentation + 2) + key + " "
+            string_query += legacy_create_query_from_dict(value, indentation + 2, False)
+            string_query += " " * (indentation + 2) + "}\n"
+        else:
+            string_query += " " * (indentation + 2) + key + "\n"
+    if last:
+        string_query += "}"
+    return string_query
+
+
+def test_query_all_data_is_unchanged():
+    assert QueryBuilder.query_all_data() == legacy_create_query_from_dict(QueryBuilder.query())
+
+@pytest.mark.parametrize("query_dict", [QueryBuilder.home(), QueryBuilder.price_rating(), {"id": ""}, {}])
+def test_create_query_from_dict_is_unchanged(query_dict):
+    assert QueryBuilder.create_query_from_dict(query_dict) == legacy_create_query_from_dict(query_dict)
+    assert QueryBuilder.create_query_from_dict(query_dict, 4, False) == legacy_create_query_from_dict(query_dict, 4, False)
+
+def test_query_all_data_is_built_once():
+    assert QueryBuilder.query_all_data() is QueryBuilder.query_all_data()
+    assert QueryBuilder.consumption_query() is QueryBuilder.consumption_query()
+
+def test_query_all_data_build_cost_is_near_zero():
+    """Microbenchmark: getting the memoized query must be far cheaper than building it."""
+    build = min(timeit.repeat(lambda: legacy_create_query_from_dict(QueryBuilder.query()), number=50, repeat=3))
+    cached = min(timeit.repeat(QueryBuilder.query_all_data, number=50, repeat=3))
+    assert cached * 20 < build
+
+def test_refresh_profile_only_queries_the_profile_fields():
+    query = QueryBuilder.query_data("prices")
+    assert "priceInfo" in query
+    assert "priceRating" not in query
+    assert "owner" not in query
+    assert "id" in query
+
+def test_field_paths_and_profiles_can_be_mixed():
+    query = QueryBuilder.query_data(["name", "homes.features", "identity"])
+    assert "realTimeConsumptionEnabled" in query
+    assert "login" in query
+    assert "currentSubscription" not in query
+
+def test_unknown_fields_are_rejected():
+    with pytest.raises(ValueError):
+        QueryBuilder.query_data("unknown-profile")
+    with pytest.raises(ValueError):
+        QueryBuilder.query_data(["homes.notAField"])
+
+def test_empty_selections_are_rejected():
+    with pytest.raises(ValueError):
+        QueryBuilder.query_data([])
+    with pytest.raises(ValueError):
+        QueryBuilder.home_query(())
+
+def test_live_measurement_profile_only_subscribes_to_the_profile_fields():
+    query = QueryBuilder.live_measurement("power_only")
+    assert query.split() == "subscription LiveMeasurement($homeId: ID!) { liveMeasurement(homeId: $homeId) { timestamp power powerProduction } }".split()
+    assert QueryBuilder.live_measurement(["powerProduction", "power"]) is QueryBuilder.live_measurement("power_only")
+
+def test_live_measurement_subscribes_to_all_fields_by_default():
+    query = QueryBuilder.live_measurement()
+    assert all(field in query for field in QueryBuilder.LIVE_MEASUREMENT_FIELDS)
+    assert QueryBuilder.live_measurement("all") is query
+
+def test_unknown_live_measurement_fields_are_rejected():
+    with pytest.raises(ValueError):
+        QueryBuilder.live_measurement("unknown-profile")
+    with pytest.raises(ValueError):
+        QueryBuilder.live_measurement(["power", "notAField"])
@@ -0,0 +1,230 @@
+"""Tests for executing queries with a stand-in for the gql session."""
+import asyncio
+
+import gql
+import pytest
+from graphql import parse, print_ast
+
+import tibber
+from tibber.networking import QueryBuilder, RateLimiter
+
+
+class RecordingSession:
+    """Records the requests it is asked to execute and answers them with a fixed response."""
+
+    def __init__(self, response):
+        self.response = response
+        self.requests = []
+
+    async def execute(self, request, variable_values=None):
+        # gql 3 sessions are called with the document and its variables instead of a request.
+        if not isinstance(request, gql.GraphQLRequest):
+            request = gql.GraphQLRequest(request, variable_values=variable_values)
+        self.requests.append(request)
+        return self.response
+
+
+@pytest.fixture
+def offline_account():
+    account = tibber.Account(tibber.DEMO_TOKEN, immediate_update=False)
+    account.session = RecordingSession({"viewer": {"home": {"consumption": {"nodes": [], "edges": []}}}})
+    return account
+
+
+def test_consumption_is_fetched_with_variables(offline_account):
+    home = tibber.TibberHome({"id": "home-id"}, offline_account)
+    home.fetch_consumption("HOURLY", first=5, after="cursor")
+
+    request = offline_account.session.requests[0]
+    assert request.variable_values == {
+        "homeId": "home-id",
+        "resolution": "HOURLY",
+        "first": 5,
+        "after": "cursor",
+        "filterEmptyNodes": False,
+    }
+
+def test_consumption_document_is_shared_between_homes(offline_account):
+    tibber.TibberHome({"id": "first"}, offline_account).fetch_consumption("HOURLY", last=1)
+    tibber.TibberHome({"id": "second"}, offline_account).fetch_consumption("DAILY", last=2)
+
+    first, second = offline_account.session.requests
+    assert first.document is second.document
+
+def test_push_notification_text_is_sent_as_variables(offline_account):
+    offline_account.session.response = {"sendPushNotification": {"successful": True, "pushedToNumberOfDevices": 1}}
+    response = offline_account.send_push_notification('Say "hi"', "It's here", "HOME")
+
+    assert response.successful
+    assert offline_account.session.requests[0].variable_values == {
+        "input": {"title": 'Say "hi"', "message": "It's here", "screenToOpen": "HOME"}
+    }
+
+def test_refresh_home_only_updates_the_matching_home(offline_account):
+    offline_account.update_cache({"viewer": {"homes": [
+        {"id": "first", "size": 100, "features": {"realTimeConsumptionEnabled": False}},
+        {"id": "second", "size": 200, "features": {"realTimeConsumptionEnabled": False}},
+    ]}})
+    offline_account.session.response = {"viewer": {"home": {"id": "second", "features": {"realTimeConsumptionEnabled": True}}}}
+
+    offline_account.refresh_home("second", fields="features")
+
+    assert offline_account.session.requests[0].variable_values == {"homeId": "second"}
+    first, second = offline_account.homes
+    assert not first.features.real_time_consumption_enabled
+    assert second.features.real_time_consumption_enabled
+    assert second.size == 200
+
+def test_fetch_home_returns_the_fetched_home(offline_account):
+    offline_account.update_cache({"viewer": {"homes": [{"id": "first"}]}})
+    offline_account.session.response = {"viewer": {"home": {"id": "second", "size": 200}}}
+
+    home = offline_account.fetch_home("second")
+
+    assert home is offline_account.home("second")
+    assert home is offline_account.viewer.home("second")
+    assert home.size == 200
+    assert offline_account.viewer.home("unknown") is None
+
+def test_refresh_home_of_an_unknown_home_keeps_the_cached_homes(offline_account):
+    offline_account.update_cache({"viewer": {"homes": [{"id": "first"}, {"id": "second"}]}})
+    offline_account.session.response = {"viewer": {"home": None}}
+
+    with pytest.raises(tibber.exceptions.APIException):
+        offline_account.refresh_home("unknown", fields="features")
+    with pytest.raises(ValueError):
+        offline_account.update_home_cache(None)
+    assert [home.id for home in offline_account.homes] == ["first", "second"]
+
+def test_refresh_home_rejects_fields_without_home_fields(offline_account):
+    with pytest.raises(ValueError):
+        offline_account.refresh_home("second", fields=[])
+    assert offline_account.session.requests == []
+
+def price_range(total):
+    return {"currentSubscription": {"priceInfo": {"range": {"nodes": [{"total": total}], "edges": []}}}}
+
+def test_price_range_of_a_subscription_is_fetched_for_its_home_only(offline_account):
+    offline_account.session.response = {"viewer": {"home": price_range(1.5)}}
+    home = tibber.TibberHome({"id": "home-id", "currentSubscription": {"id": "sub"}}, offline_account)
+
+    connection = home.current_subscription.price_info.fetch_range("HOURLY", last=24)
+
+    request = offline_account.session.requests[0]
+    assert request.variable_values == {"homeId": "home-id", "resolution": "HOURLY", "last": 24}
+    assert connection.nodes[0].total == 1.5
+
+def test_price_range_falls_back_to_the_first_home(offline_account):
+    offline_account.session.response = {"viewer": {"homes": [price_range(1.0), price_range(2.0)]}}
+    price_info = tibber.types.PriceInfo({}, offline_account)
+
+    assert price_info.fetch_range("HOURLY", last=1).nodes[0].total == 1.0
+
+def test_price_ranges_of_several_homes_are_fetched_in_one_query(offline_account):
+    offline_account.session.response = {"viewer": {"h0": price_range(1.0), "h1": price_range(2.0)}}
+
+    connections = offline_account.fetch_price_ranges(["first", "second", "first"], "DAILY", first=3)
+
+    assert len(offline_account.session.requests) == 1
+    assert offline_account.session.requests[0].variable_values == {
+        "h0": "first", "h1": "second", "resolution": "DAILY", "first": 3
+    }
+    assert connections["first"].nodes[0].total == 1.0
+    assert connections["second"].nodes[0].total == 2.0
+
+def test_consumption_of_many_homes_is_fetched_in_batches(offline_account):
+    offline_account.session.response = {"viewer": {
+        "h0": {"consumption": {"nodes": [{"consumption": 1.0}]}},
+        "h1": {"consumption": {"nodes": [{"consumption": 2.0}]}},
+    }}
+
+    connections = offline_account.fetch_consumption_many(["a", "b", "c"], "HOURLY", last=1, batch_size=2)
+
+    first, second = offline_account.session.requests
+    assert {first.variable_values["h0"], second.variable_values["h0"]} == {"a", "c"}
+    assert first.variable_values["last"] == 1
+    assert connections["a"].nodes[0].consumption == 1.0
+    assert connections["b"].nodes[0].consumption == 2.0
+    assert connections["c"].nodes[0].consumption == 1.0
+
+class SlowSession(RecordingSession):
+    async def execute(self, request, variable_values=None):
+        # gql 3 sessions are called with the document and its variables instead of a request.
+        if not isinstance(request, gql.GraphQLRequest):
+            request = gql.GraphQLRequest(request, variable_values=variable_values)
+        self.requests.append(request)
+        await asyncio.sleep(0.01)
+        return self.response
+
+def test_identical_concurrent_queries_share_one_request(offline_account):
+    offline_account.session = SlowSession({"viewer": {"name": "Arya Stark"}})
+
+    async def run():
+        return await asyncio.gather(
+            offline_account.execute_async(offline_account.token, "{ viewer { name } }"),
+            offline_account.execute_async(offline_account.token, "{\n  viewer { name }\n}"),
+            offline_account.execute_async(offline_account.token, "{ viewer { login } }"),
+        )
+
+    first, second, third = offline_account.run_blocking(run())
+
+    assert len(offline_account.session.requests) == 2
+    assert first == second
+    assert offline_account._in_flight == {}
+
+def test_callers_of_a_shared_request_get_their_own_result(offline_account):
+    offline_account.session = SlowSession({"viewer": {"homes": [{"id": "first"}]}})
+
+    async def run():
+        return await asyncio.gather(
+            offline_account.execute_async(offline_account.token, "{ viewer { homes { id } } }"),
+            offline_account.execute_async(offline_account.token, "{ viewer { homes { id } } }"),
+        )
+
+    first, second = offline_account.run_blocking(run())
+
+    assert len(offline_account.session.requests) == 1
+    assert first == second
+    assert first is not second
+    first["viewer"]["homes"].append({"id": "second"})
+    assert second == {"viewer": {"homes": [{"id": "first"}]}}
+
+def test_queries_with_different_string_literals_are_not_shared(offline_account):
+    first = '{ viewer { home(id: "a  b") { id } } }'
+    second = '{ viewer { home(id: "a b") { id } } }'
+
+    assert offline_account._single_flight_key("token", first) != offline_account._single_flight_key("token", second)
+    assert offline_account._single_flight_key("token", first) == offline_account._single_flight_key(
+        "token", '{\n  viewer {\n    home(id: "a  b") { id }\n  }\n}'
+    )
+
+def test_mutations_are_never_shared(offline_account):
+    offline_account.session = SlowSession({"sendPushNotification": {"successful": True, "pushedToNumberOfDevices": 1}})
+
+    async def run():
+        return await asyncio.gather(
+            offline_account.send_push_notification_async("Title", "Message"),
+            offline_account.send_push_notification_async("Title", "Message"),
+        )
+
+    offline_account.run_blocking(run())
+
+    assert len(offline_account.session.requests) == 2
+
+def test_coalescing_does_not_validate_before_connecting(offline_account, monkeypatch):
+    def get(query, key=None):
+        raise AssertionError("The document must not be validated before connecting.")
+
+    monkeypatch.setattr(offline_account.document_cache, "get", get)
+    query = "{ viewer { name } }"
+
+    assert offline_account._single_flight_key("token", query) == ("token", print_ast(parse(query)), "{}")
+    assert offline_account._single_flight_key("token", "mutation { a }") is None
+
+def test_executor_waits_for_the_rate_limiter(offline_account):
+    offline_account.rate_limiter = RateLimiter(rate=100, burst=1)
+    offline_account.execute_query(offline_account.token, "{ viewer { name } }")
+    offline_account.execute_query(offline_account.token, "{ viewer { login } }")
+
+    assert offline_account.rate_limiter.metrics["acquired"] == 2
+    assert offline_account.rate_limiter.metrics["total_wait"] > 0
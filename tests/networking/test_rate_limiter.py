@@ -0,0 +1,61 @@
+"""Tests for the client-side rate limiter."""
+import asyncio
+
+import pytest
+
+from tibber.networking import RateLimiter, request_priority
+from tibber.networking.rate_limiter import current_priority
+
+
+def test_requests_within_the_burst_do_not_wait():
+    limiter = RateLimiter(rate=100, burst=3)
+
+    async def run():
+        return [await limiter.acquire("token") for _ in range(3)]
+
+    assert asyncio.run(run()) == [0.0, 0.0, 0.0]
+    assert limiter.metrics["acquired"] == 3
+
+def test_waiting_requests_are_released_by_priority():
+    limiter = RateLimiter(rate=50, burst=1)
+    released = []
+
+    async def request(name, priority):
+        await limiter.acquire("token", priority)
+        released.append(name)
+
+    async def run():
+        await limiter.acquire("token")
+        bulk = asyncio.ensure_future(request("bulk", "bulk"))
+        await asyncio.sleep(0)
+        live = asyncio.ensure_future(request("live", "live"))
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 2
+        await asyncio.gather(bulk, live)
+
+    asyncio.run(run())
+    assert released == ["live", "bulk"]
+    assert limiter.metrics["max_wait"] > 0
+
+def test_a_token_at_its_limit_does_not_hold_back_other_tokens():
+    limiter = RateLimiter(per_token_rate=1, per_token_burst=1)
+
+    async def run():
+        await limiter.acquire("first")
+        waiting = asyncio.ensure_future(limiter.acquire("first"))
+        await asyncio.sleep(0)
+        waited = await asyncio.wait_for(limiter.acquire("second"), 0.5)
+        waiting.cancel()
+        return waited
+
+    assert asyncio.run(run()) < 0.5
+    assert limiter.queue_depth == 0
+
+def test_priority_is_set_for_a_block():
+    assert current_priority() == 20
+    with request_priority("bulk"):
+        with request_priority("live", override=False):
+            assert current_priority() == 30
+    with pytest.raises(ValueError):
+        with request_priority("urgent"):
+            pass
@@ -0,0 +1,51 @@
+"""Tests for the GraphQL schema snapshot bundled with tibber.py."""
+import pytest
+from graphql import parse, validate
+
+import tibber
+from tibber.networking import QueryBuilder
+from tibber.networking.schema import get_schema, load_schema_snapshot
+
+
+def test_schema_snapshot_is_built_once():
+    assert load_schema_snapshot() is load_schema_snapshot()
+    assert get_schema() is load_schema_snapshot()
+
+def test_query_all_data_is_valid_for_the_snapshot():
+    assert validate(get_schema(), parse(QueryBuilder.query_all_data())) == []
+
+def test_live_measurement_subscription_is_valid_for_the_snapshot():
+    assert validate(get_schema(), parse(QueryBuilder.live_measurement())) == []
+
+@pytest.mark.parametrize("profile", list(QueryBuilder.LIVE_MEASUREMENT_PROFILES))
+def test_live_measurement_profiles_are_valid_for_the_snapshot(profile):
+    assert validate(get_schema(), parse(QueryBuilder.live_measurement(profile))) == []
+
+def builder_queries():
+    """Every document the QueryBuilder builds for tibber.py."""
+    queries = {
+        "query_all_data": QueryBuilder.query_all_data(),
+        "home_query": QueryBuilder.home_query(),
+        "range_query": QueryBuilder.range_query(),
+        "home_range_query": QueryBuilder.home_range_query(),
+        "homes_range_query": QueryBuilder.homes_range_query(2),
+        "consumption_query": QueryBuilder.consumption_query(),
+        "homes_consumption_query": QueryBuilder.homes_consumption_query(2),
+        "production_query": QueryBuilder.production_query(),
+        "homes_production_query": QueryBuilder.homes_production_query(2),
+        "send_push_notification": QueryBuilder.send_push_notification(),
+    }
+    for profile in QueryBuilder.REFRESH_PROFILES:
+        queries[f"query_data({profile})"] = QueryBuilder.query_data(profile)
+        queries[f"home_query({profile})"] = QueryBuilder.home_query(QueryBuilder.resolve_home_field_paths(profile))
+    return queries
+
+@pytest.mark.parametrize("name, query", builder_queries().items())
+def test_queries_of_the_query_builder_are_valid_for_the_snapshot(name, query):
+    assert validate(load_schema_snapshot(), parse(query)) == []
+
+def test_accounts_do_not_fetch_the_schema():
+    first = tibber.Account(tibber.DEMO_TOKEN, immediate_update=False)
+    second = tibber.Account(tibber.DEMO_TOKEN, immediate_update=False)
+    assert not first.gql_client.fetch_schema_from_transport
+    assert first.document_cache is second.document_cache
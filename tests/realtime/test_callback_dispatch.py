@@ -0,0 +1,121 @@
+"""Tests for running the live measurement callbacks of a home in their own tasks."""
+import asyncio
+
+import pytest
+
+import tibber
+
+
+@pytest.fixture
+def home():
+    account = tibber.Account("a-token-for-the-dispatch-tests", immediate_update=False)
+    account.update_cache({"viewer": {"homes": [{"id": "home"}]}})
+    return account.homes[0]
+
+def process(home, powers):
+    async def run():
+        for power in powers:
+            await home.process_websocket_response({"liveMeasurement": {"power": power}})
+            await asyncio.sleep(0)
+        await home.close_callbacks()
+
+    asyncio.run(run())
+
+
+def test_slow_and_failing_callbacks_do_not_hold_up_others(home, caplog):
+    received, order = [], []
+
+    @home.event("live_measurement")
+    async def slow(data):
+        await asyncio.sleep(0.01)
+        order.append("slow")
+
+    @home.event("live_measurement")
+    async def failing(data):
+        raise RuntimeError("Broken callback")
+
+    @home.event("live_measurement")
+    async def fast(data):
+        received.append(data.power)
+        order.append("fast")
+
+    process(home, [1, 2, 3])
+
+    assert received == [1, 2, 3]
+    assert order == ["fast"] * 3 + ["slow"] * 3
+    assert home.callback_metrics[failing]["failed"] == 3
+    assert home.callback_metrics[failing]["name"].endswith("failing")
+    assert "failing raised an exception" in caplog.text
+
+def test_latest_policy_skips_to_the_newest_measurement(home):
+    received = []
+
+    @home.event("live_measurement", policy="latest")
+    async def callback(data):
+        await asyncio.sleep(0.01)
+        received.append(data.power)
+
+    process(home, [1, 2, 3, 4])
+
+    assert received == [1, 4]
+    assert home.callback_metrics[callback]["dropped"] == 2
+
+def test_callbacks_are_cancelled_after_the_timeout(home):
+    @home.event("live_measurement", timeout=0.01)
+    async def callback(data):
+        await asyncio.sleep(10)
+
+    process(home, [1])
+
+    assert home.callback_metrics[callback]["timed_out"] == 1
+
+def test_callbacks_with_the_same_name_have_separate_metrics(home):
+    class Writer:
+        def __init__(self):
+            self.received = []
+
+        async def write(self, data):
+            self.received.append(data.power)
+
+    first, second = Writer(), Writer()
+    home.event("live_measurement")(first.write)
+    home.event("live_measurement", policy="latest")(second.write)
+
+    process(home, [1])
+
+    assert len(home.callback_metrics) == 2
+    assert home.callback_metrics[first.write]["delivered"] == 1
+    assert home.callback_metrics[second.write]["delivered"] == 1
+
+def test_callbacks_are_stopped_when_the_websocket_fails(home, monkeypatch):
+    home.tibber_client.update_cache({"viewer": {"homes": [{"id": "home", "features": {"realTimeConsumptionEnabled": True}}]}})
+
+    async def update_async(fields=None):
+        pass
+
+    monkeypatch.setattr(home.tibber_client, "update_async", update_async)
+
+    class FailingSession:
+        async def subscribe(self, request, variable_values=None):
+            yield {"liveMeasurement": {"power": 1}}
+            raise ConnectionError("The websocket was closed.")
+
+    received = []
+
+    @home.event("live_measurement")
+    async def callback(data):
+        await asyncio.sleep(0.01)
+        received.append(data.power)
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(home.run_websocket_loop(FailingSession(), exit_condition=None))
+
+    assert received == [1]
+    assert home.callback_metrics[callback]["queued"] == 0
+    assert all(worker._task is None for worker in home._dispatcher._workers.values())
+
+def test_unknown_policy(home):
+    with pytest.raises(ValueError):
+        @home.event("live_measurement", policy="oldest")
+        async def callback(data):
+            pass
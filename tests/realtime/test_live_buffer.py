@@ -0,0 +1,93 @@
+"""Tests for the buffer of recent live measurements."""
+import asyncio
+import math
+import random
+
+import pytest
+
+import tibber
+from tibber.live.ring_buffer import LiveMeasurementBuffer
+from tibber.types.live_measurement import LiveMeasurement
+
+
+def measurement(second, power=None, **values):
+    return LiveMeasurement({"timestamp": f"2023-02-06T01:00:{second:02d}.000+01:00", "power": power, **values})
+
+def fill(buffer, powers):
+    for second, power in enumerate(powers):
+        buffer.append(measurement(second, power))
+
+
+def test_statistics_of_the_last_seconds():
+    buffer = LiveMeasurementBuffer(capacity=10, fields=["power"])
+    fill(buffer, [100, 400, 200, None, 300])
+
+    assert len(buffer) == 5
+    assert buffer.values("power", seconds=2) == [200, None, 300]
+    assert buffer.mean("power") == 250
+    assert buffer.mean("power", seconds=2) == 250
+    assert (buffer.min("power", seconds=3), buffer.max("power", seconds=3)) == (200, 400)
+    assert buffer.percentile("power", 50) == 250
+    assert buffer.rate_of_change("power", seconds=2) == 50
+
+def test_oldest_measurements_are_replaced_when_full():
+    buffer = LiveMeasurementBuffer(capacity=4, fields=["power"])
+    fill(buffer, [1, 2, 3])
+    assert buffer.max("power") == 3
+    for second, power in enumerate([4, 5, 6], start=3):
+        buffer.append(measurement(second, power))
+
+    assert buffer.values("power") == [3, 4, 5, 6]
+    assert buffer.mean("power") == 4.5
+    assert (buffer.min("power"), buffer.max("power")) == (3, 6)
+
+def test_rolling_queries_match_the_values_in_the_window():
+    generator = random.Random(1)
+    buffer = LiveMeasurementBuffer(capacity=7, fields=["power"])
+    powers = [generator.choice([None, generator.uniform(0, 1000)]) for _ in range(40)]
+    for second, power in enumerate(powers):
+        buffer.append(measurement(second, power))
+        buffer.min("power")  # Keeps the segment trees up to date from here on
+        for seconds in (0, 2, 5, None):
+            window = [value for value in buffer.values("power", seconds) if value is not None]
+            assert buffer.min("power", seconds) == (min(window) if window else None)
+            assert buffer.max("power", seconds) == (max(window) if window else None)
+            mean = buffer.mean("power", seconds)
+            assert mean == pytest.approx(sum(window) / len(window)) if window else mean is None
+
+def test_running_totals_do_not_grow_with_the_stream():
+    buffer = LiveMeasurementBuffer(capacity=3, fields=["power"])
+    for second, power in enumerate([1e16] * 3 + [0.25] * 9):
+        buffer.append(measurement(second, power))
+
+    assert buffer.mean("power") == 0.25
+    assert buffer.mean("power", seconds=1) == 0.25
+    assert max(buffer._sums["power"]) <= 0.75
+
+def test_older_measurements_are_skipped():
+    buffer = LiveMeasurementBuffer(capacity=4, fields=["power"])
+    buffer.append(measurement(5, 1))
+    buffer.append(measurement(4, 2))
+
+    assert buffer.values("power") == [1]
+    assert buffer.skipped == 1
+
+def test_unknown_field():
+    with pytest.raises(ValueError):
+        LiveMeasurementBuffer(fields=["power"]).mean("voltage_phase_1")
+
+def test_home_fills_its_buffer():
+    account = tibber.Account("a-token-for-the-buffer-tests", immediate_update=False)
+    account.update_cache({"viewer": {"homes": [{"id": "home"}]}})
+    home = account.homes[0]
+    buffer = home.enable_live_buffer(capacity=10)
+
+    async def run():
+        for second, current in enumerate([10.5, 11.5]):
+            data = {"timestamp": f"2023-02-06T01:00:0{second}.000+01:00", "currentL1": current}
+            await home.process_websocket_response({"liveMeasurement": data})
+
+    asyncio.run(run())
+
+    assert buffer.mean("currentL1") == 11
+    assert math.isclose(buffer.rate_of_change("currentL1"), 1)
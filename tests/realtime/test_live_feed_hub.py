@@ -0,0 +1,216 @@
+"""Tests for multiplexing and streaming live feeds with a stand-in for the websocket session."""
+import asyncio
+
+import types
+
+import gql
+import pytest
+
+import tibber
+from tibber.live import LiveFeedHub, websocket
+
+
+class WebsocketSession:
+    """Answers each subscription with measurements that carry the id of the subscribed home."""
+
+    def __init__(self, count=3):
+        self.count = count
+        self.subscriptions = []
+        self.documents = []
+
+    async def subscribe(self, request, variable_values=None):
+        # gql 3 sessions are called with the document and its variables instead of a request.
+        if not isinstance(request, gql.GraphQLRequest):
+            request = gql.GraphQLRequest(request, variable_values=variable_values)
+        home_id = request.variable_values["homeId"]
+        self.subscriptions.append(home_id)
+        self.documents.append(request.document)
+        for power in range(self.count):
+            await asyncio.sleep(0)
+            yield {"liveMeasurement": {"timestamp": home_id, "power": power}}
+
+
+class WebsocketClient:
+    def __init__(self):
+        self.closed = 0
+
+    async def close_async(self):
+        self.closed += 1
+
+
+@pytest.fixture
+def homes():
+    account = tibber.Account("a-token-for-the-hub-tests", immediate_update=False)
+    account.update_cache({"viewer": {"homes": [
+        {"id": home_id, "features": {"realTimeConsumptionEnabled": True}} for home_id in ("first", "second")
+    ]}})
+    return account.homes
+
+
+def test_hub_is_shared_per_token(homes):
+    account = homes[0].tibber_client
+    assert LiveFeedHub.for_account(account) is LiveFeedHub.for_account(account)
+
+def test_measurements_are_routed_to_their_home(homes):
+    hub = LiveFeedHub(homes[0].tibber_client)
+    hub._session, hub._websocket_client = WebsocketSession(), WebsocketClient()
+    client = hub._websocket_client
+    received = {"first": [], "second": []}
+
+    for home in homes:
+        @home.event("live_measurement")
+        async def callback(data, home_id=home.id):
+            received[home_id].append(data.timestamp)
+
+    async def run():
+        await asyncio.gather(*(hub.subscribe(home, exit_condition=lambda data: data.power == 1) for home in homes))
+
+    asyncio.run(run())
+
+    assert received == {"first": ["first", "first"], "second": ["second", "second"]}
+    assert client.closed == 1
+    assert not hub.connected
+
+def test_subscription_only_requests_the_selected_fields(homes):
+    hub = LiveFeedHub(homes[0].tibber_client)
+    session = WebsocketSession(count=1)
+    hub._session, hub._websocket_client = session, WebsocketClient()
+    received = []
+
+    @homes[0].event("live_measurement")
+    async def callback(data):
+        received.append((data.power, data.currentL1))
+
+    asyncio.run(hub.subscribe(homes[0], fields="power_only"))
+
+    selections = session.documents[0].definitions[0].selection_set.selections[0].selection_set.selections
+    assert [selection.name.value for selection in selections] == ["timestamp", "power", "powerProduction"]
+    assert received == [(0, None)]
+
+def test_hub_connects_again_on_a_new_event_loop(homes, monkeypatch):
+    class Client:
+        """Stands in for the gql client of the hub."""
+
+        def __init__(self, transport):
+            pass
+
+        async def connect_async(self, **kwargs):
+            await asyncio.sleep(0)
+            return WebsocketSession()
+
+        async def close_async(self):
+            pass
+
+    monkeypatch.setattr(gql, "Client", Client)
+    monkeypatch.setattr(websocket, "create_websocket_transport", lambda *args, **kwargs: None)
+    account = homes[0].tibber_client
+    account.user_agent = "tibber.py-tests"
+    hub = LiveFeedHub(account)
+
+    async def connect_twice():
+        first, second = await asyncio.gather(hub.connect(), hub.connect())
+        assert first is second
+        await hub.close()
+
+    # Like start(), which runs every call on a new event loop.
+    asyncio.run(connect_twice())
+    asyncio.run(connect_twice())
+
+def test_home_without_real_time_consumption_is_rejected(homes):
+    homes[0].tibber_client.update_cache({"viewer": {"homes": [
+        {"id": "first", "features": {"realTimeConsumptionEnabled": False}}
+    ]}})
+    hub = LiveFeedHub(homes[0].tibber_client)
+
+    with pytest.raises(ValueError):
+        asyncio.run(hub.subscribe(homes[0]))
+
+def stream_measurements(home, count, consume, **kwargs):
+    """Runs a subscription of count measurements on the hub, with a stream attached to it."""
+    hub = LiveFeedHub.for_account(home.tibber_client)
+    hub._session, hub._websocket_client = WebsocketSession(count), WebsocketClient()
+
+    async def run():
+        subscription = asyncio.ensure_future(hub.subscribe(home))
+        await asyncio.sleep(0)
+        stream = home.live_measurements(**kwargs)
+        stream.start()
+        powers = await consume(stream, subscription)
+        await stream.close()
+        return stream, powers
+
+    return asyncio.run(run())
+
+def test_stream_drops_the_oldest_measurements_when_full(homes):
+    async def consume(stream, subscription):
+        await subscription
+        return [measurement.power async for measurement in _take(stream, 2)]
+
+    stream, powers = stream_measurements(homes[0], 5, consume, maxsize=2)
+
+    assert powers == [3, 4]
+    assert (stream.received, stream.dropped) == (5, 3)
+
+def test_blocking_stream_keeps_every_measurement(homes):
+    async def consume(stream, subscription):
+        powers = []
+        async for measurement in _take(stream, 5):
+            await asyncio.sleep(0.001)
+            powers.append(measurement.power)
+        await subscription
+        return powers
+
+    stream, powers = stream_measurements(homes[0], 5, consume, maxsize=1, overflow="block")
+
+    assert powers == [0, 1, 2, 3, 4]
+    assert stream.dropped == 0
+
+def test_attached_stream_ends_with_the_subscription(homes):
+    async def consume(stream, subscription):
+        return [measurement.power async for measurement in stream]
+
+    stream, powers = stream_measurements(homes[0], 3, consume)
+
+    assert powers == [0, 1, 2]
+
+def test_stream_attaches_to_the_live_feed_of_the_home(homes, monkeypatch):
+    home = homes[0]
+    session = WebsocketSession(count=3)
+
+    class Client:
+        """Stands in for the gql client of the live feed of the home."""
+
+        def __init__(self, transport):
+            self.transport = types.SimpleNamespace(websocket=None)
+
+        async def connect_async(self, **kwargs):
+            return session
+
+    async def update_async(**kwargs):
+        pass
+
+    monkeypatch.setattr(gql, "Client", Client)
+    monkeypatch.setattr(websocket, "create_websocket_transport", lambda *args, **kwargs: None)
+    monkeypatch.setattr(home.tibber_client, "update_async", update_async)
+
+    async def run():
+        feed = asyncio.ensure_future(home.start_websocket_loop())
+        await asyncio.sleep(0)
+        powers = [measurement.power async for measurement in home.live_measurements()]
+        await feed
+        return powers
+
+    assert asyncio.run(run()) == [0, 1, 2]
+    assert session.subscriptions == ["first"]
+    assert not home.live_feed_running
+
+def test_unknown_overflow_policy(homes):
+    with pytest.raises(ValueError):
+        homes[0].live_measurements(overflow="ignore")
+
+async def _take(stream, count):
+    async for measurement in stream:
+        yield measurement
+        count -= 1
+        if count == 0:
+            return
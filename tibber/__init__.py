@@ -10,7 +10,7 @@ if os.name == "nt":
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
 # Import modules after defining constants to avoid circular import error.
-from .account import Account
+from .account import Account, AsyncAccount
 from .types.home import NonDecoratedTibberHome, TibberHome
 
 __all__ = [
@@ -18,6 +18,7 @@ __all__ = [
     "DEMO_TOKEN",
     "API_ENDPOINT",
     "Account",
+    "AsyncAccount",
     "NonDecoratedTibberHome",
     "TibberHome",
 ]
@@ -1,8 +1,16 @@
-import json
+import asyncio
 import logging
+from typing import Callable, Optional
 
-from .networking import QueryBuilder, QueryExecutor
+from .exceptions import APIException
+from .networking import CacheMerger, QueryBuilder, QueryExecutor
+from .types.cached_view import cached_view
+from .types.home import TibberHome
+from .types.home_consumption_connection import HomeConsumptionConnection
+from .types.home_production_connection import HomeProductionConnection
+from .types.price_info import PriceInfo
 from .types.push_notification_response import PushNotificationResponse
+from .types.subscription_price_connection import SubscriptionPriceConnection
 from .types.viewer import Viewer
 
 _logger = logging.getLogger(__name__)
@@ -11,61 +19,464 @@ _logger = logging.getLogger(__name__)
 class Account(QueryExecutor):
     """The main Tibber class to communicate with the Tibber API."""
 
+    # The maximum number of homes per query of the fetch_*_many methods. Larger sets of homes
+    # are split into several queries.
+    batch_size: int = 50
+
     def __init__(
-        self, token: str, user_agent: str = None, immediate_update: bool = True
+        self,
+        token: str,
+        user_agent: str = None,
+        immediate_update: bool = True,
+        refresh_schema: bool = False,
+        fields=None,
     ):
         """Initialize the tibber client.
 
         :param token: The token to log in with
         :param immediate_update: Specifies whether to immediately update all tibber information
             on initialization.
+        :param refresh_schema: Fetch the GraphQL schema from the Tibber API when connecting instead
+            of using the subset of the schema bundled with tibber.py. Needed to execute queries that
+            use other parts of the API. The fetched schema is shared with all clients created afterwards.
+        :param fields: The data to fetch when updating the account if nothing else is specified. Either
+            the name of a refresh profile (see QueryBuilder.REFRESH_PROFILES) like "prices", or a list
+            of profile names and dot separated field paths relative to the viewer, like
+            ["name", "homes.features"]. By default all data is fetched.
         :throws UnauthenticatedException: If the provided token was not accepted by the Tibber API.
             Note that this will only be checked if the immediate_update parameter is set to True.
         """
         self.cache: dict = {}
+        # Increased whenever update_cache changes the cache. Views over the cache (see
+        # cached_view) are only rebuilt when the version they were built at is outdated.
+        self.cache_version: int = 0
+        # Identity map of the TibberHome objects by home id. The same object is handed out
+        # for a home as long as it exists, so callbacks and websockets registered on it survive.
+        self._homes: dict = {}
+        self._home_list: list = []
         self._token: str = token
         self.user_agent = user_agent
+        self.fields = fields
 
-        super().__init__()
+        super().__init__(refresh_schema=refresh_schema)
 
         if immediate_update:
             self.fetch_all()
 
-    def update(self):
+    @classmethod
+    async def create(
+        cls,
+        token: str,
+        user_agent: str = None,
+        immediate_update: bool = True,
+        refresh_schema: bool = False,
+        fields=None,
+    ):
+        """Creates an account without blocking the running event loop.
+
+        Example:
+            account = await tibber.AsyncAccount.create(tibber.DEMO_TOKEN)
+
+        :param token: The token to log in with
+        :param immediate_update: Specifies whether to fetch all tibber information before returning.
+        :param refresh_schema: Fetch the GraphQL schema from the Tibber API when connecting.
+        :param fields: The data to fetch when updating the account. See Account.__init__.
+        :throws UnauthenticatedException: If the provided token was not accepted by the Tibber API.
+            Note that this will only be checked if the immediate_update parameter is set to True.
+        """
+        account = cls(
+            token,
+            user_agent,
+            immediate_update=False,
+            refresh_schema=refresh_schema,
+            fields=fields,
+        )
+        if immediate_update:
+            await account.update_async()
+        return account
+
+    def update(self, fields=None):
         """Alias for fetch_all()"""
-        self.fetch_all()
+        self.fetch_all(fields=fields)
 
-    async def update_async(self, retries=1):
+    async def update_async(self, retries=1, fields=None):
         """Fetches all available data from the API and caches it. This method is used in async
-        contexts to avoid errors about an event loop already running."""
+        contexts to avoid errors about an event loop already running.
+
+        :param fields: A refresh profile or list of field paths to fetch instead of the fields
+            given when creating the account. See fetch_all().
+        """
+        data = await self.execute_async(self.token, self._query_for(fields), retries)
+        self.update_cache(data, partial=self._is_partial(fields))
+
+    def fetch_all(self, retries=1, fields=None):
+        """Fetches all available data from the API and caches it.
+
+        :param fields: A refresh profile or list of field paths to fetch instead of the fields
+            given when creating the account. E.g. "prices" only fetches the price info of the
+            current subscription of every home and merges it into the cache.
+        """
+        data = self.execute_query(self.token, self._query_for(fields), retries)
+        self.update_cache(data, partial=self._is_partial(fields))
+
+    def _query_for(self, fields) -> str:
+        return QueryBuilder.query_data(fields if fields is not None else self.fields)
+
+    def _is_partial(self, fields) -> bool:
+        """Returns True if a fetch with these fields only returns part of the data."""
+        return fields is not None or self.fields is not None
+
+    def refresh_home(self, home_id: str, fields=None, retries=1):
+        """Fetches the data of a single home and merges it into the cached entry with the same id.
+        The other homes of the account are not downloaded again.
+
+        :param home_id: The id of the home to refresh.
+        :param fields: A refresh profile (e.g. "prices") or a list of profile names and dot separated
+            field paths relative to the home (e.g. ["features", "currentSubscription.priceInfo"]).
+            By default all data of the home is fetched.
+        :throws APIException: If the API did not return the home, e.g. because the id is unknown.
+        """
+        data = self.execute_query(
+            self.token,
+            self._home_query_for(fields),
+            retries,
+            variable_values={"homeId": home_id},
+        )
+        self.update_home_cache(self._home_from_response(home_id, data))
+
+    async def refresh_home_async(self, home_id: str, fields=None, retries=1):
+        """Coroutine version of refresh_home()."""
         data = await self.execute_async(
-            self.token, QueryBuilder.query_all_data(), retries
+            self.token,
+            self._home_query_for(fields),
+            retries,
+            variable_values={"homeId": home_id},
         )
-        self.update_cache(data)
+        self.update_home_cache(self._home_from_response(home_id, data))
+
+    def fetch_home(self, home_id: str, fields=None, retries=1) -> TibberHome:
+        """Fetches a single home with the home(id:) query of the API and returns it. The home is
+        merged into the cache, see refresh_home().
+
+        :throws APIException: If the API did not return the home, e.g. because the id is unknown.
+        """
+        self.refresh_home(home_id, fields, retries)
+        return self.home(home_id)
+
+    async def fetch_home_async(
+        self, home_id: str, fields=None, retries=1
+    ) -> TibberHome:
+        """Coroutine version of fetch_home()."""
+        await self.refresh_home_async(home_id, fields, retries)
+        return self.home(home_id)
+
+    @staticmethod
+    def _home_from_response(home_id: str, data: dict) -> dict:
+        home_data = ((data or {}).get("viewer") or {}).get("home")
+        if not home_data:
+            raise APIException(f"The Tibber API did not return the home {home_id}.")
+        return home_data
 
-    def fetch_all(self, retries=1):
-        """Fetches all available data from the API and caches it."""
-        data = self.execute_query(self.token, QueryBuilder.query_all_data())
-        self.update_cache(data)
+    def _home_query_for(self, fields) -> str:
+        if fields is None:
+            return QueryBuilder.home_query()
+        return QueryBuilder.home_query(QueryBuilder.resolve_home_field_paths(fields))
 
-    def update_cache(self, data):
-        """Updates the cache with values from data.
+    def update_home_cache(self, home_data: dict) -> set:
+        """Merges the data of a single home into the cached home with the same id. The home is added
+        to the cache if it is not cached yet.
+
+        :param home_data: The data of the home. Must contain the id of the home.
+        :return: The paths of the cached values that changed. See update_cache().
+        :throws ValueError: If home_data is not the data of a home with an id.
+        """
+        if not isinstance(home_data, dict) or home_data.get("id") is None:
+            raise ValueError("The data of the home must contain the id of the home.")
+        return self.update_cache({"viewer": {"homes": [home_data]}}, partial=True)
+
+    def update_cache(self, data, partial: bool = False) -> set:
+        """Updates the cache with values from data. Homes and subscriptions are matched by id and
+        prices by their start time, so the cached entries are updated in place.
 
         :param data: The data to add / update values in the cache with.
+        :param partial: Whether data only contains some of the homes and subscriptions, e.g. from
+            refresh_home(). If False, cached homes and subscriptions missing from data are removed.
+        :return: The paths of the cached values that were added, changed or removed, as tuples
+            of keys (see CacheMerger). An empty set means nothing changed.
         """
-        _logger.debug("Overwriting the cache data.")
-        _logger.debug("Old data: " + json.dumps(self.cache))
-        _logger.debug("New data: " + json.dumps(data))
-        self.cache = QueryBuilder.combine_dicts(self.cache, data)
+        changes = CacheMerger.merge(self.cache, data, partial=partial)
+        if changes:
+            self.cache_version += 1
+        self._rebind_homes()
+
+        # Only summarize the update. Serializing the whole cache for every refresh is far too
+        # expensive, and it must not happen at all when debug logging is disabled.
+        if _logger.isEnabledFor(logging.DEBUG):
+            homes = self.cache.get("viewer", {}).get("homes", [])
+            changed_homes = {
+                path[2]
+                for path in changes
+                if path[:2] == ("viewer", "homes") and len(path) > 2
+            }
+            _logger.debug(
+                "Cache updated: %d changed paths in %d of %d homes.",
+                len(changes),
+                len(changed_homes),
+                len(homes),
+                extra={
+                    "tibber_event": "cache_updated",
+                    "changed_paths": len(changes),
+                    "changed_homes": len(changed_homes),
+                    "cached_homes": len(homes),
+                },
+            )
+        return changes
 
     def send_push_notification(
         self, title: str, message: str, screen_to_open: str = None
     ):
         """Sends a push notification to all registered devices connected to the account owning the API key."""
-        data = QueryBuilder.send_push_notification(title, message, screen_to_open)
-        response_data = self.execute_query(self.token, data).get("sendPushNotification")
+        response_data = self.execute_query(
+            self.token,
+            QueryBuilder.send_push_notification(),
+            variable_values=self._push_notification_variables(
+                title, message, screen_to_open
+            ),
+        ).get("sendPushNotification")
         return PushNotificationResponse(response_data, self)
 
+    async def send_push_notification_async(
+        self, title: str, message: str, screen_to_open: str = None
+    ):
+        """Coroutine version of send_push_notification()."""
+        response_data = (
+            await self.execute_async(
+                self.token,
+                QueryBuilder.send_push_notification(),
+                variable_values=self._push_notification_variables(
+                    title, message, screen_to_open
+                ),
+            )
+        ).get("sendPushNotification")
+        return PushNotificationResponse(response_data, self)
+
+    @staticmethod
+    def _push_notification_variables(
+        title: str, message: str, screen_to_open: str = None
+    ) -> dict:
+        return {
+            "input": QueryBuilder.variables(
+                title=title, message=message, screenToOpen=screen_to_open
+            )
+        }
+
+    def fetch_consumption_many(
+        self,
+        home_ids: list,
+        resolution: str,
+        first: int = None,
+        last: int = None,
+        before: str = None,
+        after: str = None,
+        filter_empty_nodes: bool = False,
+        batch_size: int = None,
+    ) -> dict:
+        """Fetches a page of the consumption of several homes with one query per batch of homes.
+        The arguments after home_ids are the same as for TibberHome.fetch_consumption().
+
+        :param home_ids: The ids of the homes to fetch the consumption of.
+        :param batch_size: The maximum number of homes per query. Defaults to Account.batch_size.
+        :return: A dict with the HomeConsumptionConnection of each home by home id.
+        """
+        return self.run_blocking(
+            self.fetch_consumption_many_async(
+                home_ids,
+                resolution,
+                first,
+                last,
+                before,
+                after,
+                filter_empty_nodes,
+                batch_size,
+            )
+        )
+
+    async def fetch_consumption_many_async(
+        self,
+        home_ids: list,
+        resolution: str,
+        first: int = None,
+        last: int = None,
+        before: str = None,
+        after: str = None,
+        filter_empty_nodes: bool = False,
+        batch_size: int = None,
+    ) -> dict:
+        """Coroutine version of fetch_consumption_many()."""
+        return await self._fetch_many_async(
+            home_ids,
+            QueryBuilder.homes_consumption_query,
+            self._history_variables(
+                resolution, first, last, before, after, filter_empty_nodes
+            ),
+            lambda home: HomeConsumptionConnection(
+                resolution, (home or {}).get("consumption"), self
+            ),
+            batch_size,
+        )
+
+    def fetch_production_many(
+        self,
+        home_ids: list,
+        resolution: str,
+        first: int = None,
+        last: int = None,
+        before: str = None,
+        after: str = None,
+        filter_empty_nodes: bool = False,
+        batch_size: int = None,
+    ) -> dict:
+        """Fetches a page of the production of several homes with one query per batch of homes.
+        Takes the same arguments as fetch_consumption_many().
+
+        :return: A dict with the HomeProductionConnection of each home by home id.
+        """
+        return self.run_blocking(
+            self.fetch_production_many_async(
+                home_ids,
+                resolution,
+                first,
+                last,
+                before,
+                after,
+                filter_empty_nodes,
+                batch_size,
+            )
+        )
+
+    async def fetch_production_many_async(
+        self,
+        home_ids: list,
+        resolution: str,
+        first: int = None,
+        last: int = None,
+        before: str = None,
+        after: str = None,
+        filter_empty_nodes: bool = False,
+        batch_size: int = None,
+    ) -> dict:
+        """Coroutine version of fetch_production_many()."""
+        return await self._fetch_many_async(
+            home_ids,
+            QueryBuilder.homes_production_query,
+            self._history_variables(
+                resolution, first, last, before, after, filter_empty_nodes
+            ),
+            lambda home: HomeProductionConnection(
+                resolution, (home or {}).get("production"), self
+            ),
+            batch_size,
+        )
+
+    def fetch_price_ranges(
+        self,
+        home_ids: list,
+        resolution: str,
+        first: int = None,
+        last: int = None,
+        before: str = None,
+        after: str = None,
+        batch_size: int = None,
+    ) -> dict:
+        """Fetches the price ranges of the current subscriptions of several homes with one query
+        per batch of homes. The arguments after home_ids are the same as for PriceInfo.fetch_range().
+
+        :param home_ids: The ids of the homes to fetch the price ranges of.
+        :param batch_size: The maximum number of homes per query. Defaults to Account.batch_size.
+        :return: A dict with the SubscriptionPriceConnection of each home by home id.
+        """
+        return self.run_blocking(
+            self.fetch_price_ranges_async(
+                home_ids, resolution, first, last, before, after, batch_size
+            )
+        )
+
+    async def fetch_price_ranges_async(
+        self,
+        home_ids: list,
+        resolution: str,
+        first: int = None,
+        last: int = None,
+        before: str = None,
+        after: str = None,
+        batch_size: int = None,
+    ) -> dict:
+        """Coroutine version of fetch_price_ranges()."""
+        return await self._fetch_many_async(
+            home_ids,
+            QueryBuilder.homes_range_query,
+            PriceInfo._range_variables(resolution, first, last, before, after),
+            lambda home: SubscriptionPriceConnection(PriceInfo.range_data(home), self),
+            batch_size,
+        )
+
+    async def _fetch_many_async(
+        self,
+        home_ids: list,
+        query_for: Callable[[int], str],
+        variable_values: dict,
+        result_for: Callable[[Optional[dict]], object],
+        batch_size: Optional[int],
+    ) -> dict:
+        """Runs an aliased multi-home query (see QueryBuilder.home_aliases) for batches of homes.
+        The batches are sent concurrently.
+
+        :param home_ids: The ids of the homes. Duplicates are only queried once.
+        :param query_for: Returns the query for a given number of homes.
+        :param variable_values: The variables shared by all homes.
+        :param result_for: Creates the result of a home from its aliased data.
+        :param batch_size: The maximum number of homes per query.
+        :throws ValueError: If batch_size is less than 1.
+        """
+        home_ids = list(dict.fromkeys(home_ids))
+        batch_size = batch_size or self.batch_size
+        if batch_size < 1:
+            raise ValueError("The batch size must be at least 1.")
+
+        async def fetch_batch(batch: list) -> dict:
+            aliases = QueryBuilder.home_aliases(len(batch))
+            data = await self.execute_async(
+                self.token,
+                query_for(len(batch)),
+                variable_values={**dict(zip(aliases, batch)), **variable_values},
+            )
+            return {
+                home_id: result_for(data["viewer"].get(alias))
+                for alias, home_id in zip(aliases, batch)
+            }
+
+        batches = []
+        for start in range(0, len(home_ids), batch_size):
+            end = start + batch_size
+            batches.append(home_ids[start:end])
+        results = {}
+        for batch_results in await asyncio.gather(*map(fetch_batch, batches)):
+            results.update(batch_results)
+        return results
+
+    @staticmethod
+    def _history_variables(
+        resolution, first, last, before, after, filter_empty_nodes
+    ) -> dict:
+        return QueryBuilder.variables(
+            resolution=resolution,
+            first=first,
+            last=last,
+            before=before,
+            after=after,
+            filterEmptyNodes=filter_empty_nodes,
+        )
+
     @property
     def token(self) -> str:
         return self._token
@@ -80,7 +491,7 @@ class Account(QueryExecutor):
         self._token = token
         _logger.debug("The tibber token was set to a new value.")
 
-    @property
+    @cached_view
     def viewer(self):
         return Viewer(self.cache.get("viewer"), self)
 
@@ -105,4 +516,70 @@ class Account(QueryExecutor):
     @property
     def homes(self):
         """All homes visible to the logged-in user"""
-        return self.viewer.homes
+        return list(self._home_list)
+
+    def home(self, home_id: str) -> Optional[TibberHome]:
+        """Returns the cached home with the given id, or None if the account has no such home."""
+        return self._homes.get(home_id)
+
+    def home_for_data(self, data: dict) -> TibberHome:
+        """Returns the TibberHome object for cached home data, bound to that data.
+
+        :param data: The cached data of a home.
+        """
+        home = self._homes.get(data.get("id"))
+        if home is None:
+            home = TibberHome(data, self)
+            self._homes[home.id] = home
+        elif home.cache is not data:
+            home.cache = data
+        return home
+
+    def _rebind_homes(self):
+        """Binds the identity mapped homes to the current cache data. Homes which are no longer
+        in the cache are forgotten."""
+        self._home_list = [
+            self.home_for_data(data)
+            for data in self.cache.get("viewer", {}).get("homes", [])
+        ]
+        self._homes = {home.id: home for home in self._home_list}
+
+
+class AsyncAccount(Account):
+    """A Tibber account for async applications.
+
+    Creating an AsyncAccount never blocks. The connection to the Tibber API is made lazily on the
+    first query, and it is bound to the event loop which runs that query. Use the coroutine methods
+    (update_async, fetch_consumption_async, ...) to fetch data; the blocking methods raise a
+    RuntimeError.
+    """
+
+    use_background_loop = False
+
+    def __init__(
+        self,
+        token: str,
+        user_agent: str = None,
+        immediate_update: bool = False,
+        refresh_schema: bool = False,
+        fields=None,
+    ):
+        """Initialize the tibber client without fetching any data.
+
+        :param token: The token to log in with
+        :param immediate_update: Not supported, use `await AsyncAccount.create(token)` instead.
+        :param refresh_schema: Fetch the GraphQL schema from the Tibber API when connecting.
+        :param fields: The data to fetch when updating the account. See Account.__init__.
+        :throws ValueError: If immediate_update is True.
+        """
+        if immediate_update:
+            raise ValueError(
+                "An AsyncAccount cannot be updated on initialization. Use `await AsyncAccount.create(token)` instead."
+            )
+        super().__init__(
+            token,
+            user_agent,
+            immediate_update=False,
+            refresh_schema=refresh_schema,
+            fields=fields,
+        )
@@ -0,0 +1,3 @@
+from tibber.live.hub import LiveFeedHub
+
+__all__ = ["LiveFeedHub"]
@@ -0,0 +1,192 @@
+"""Running the callbacks of live measurements without holding up the websocket."""
+
+import asyncio
+import collections
+import logging
+from typing import Awaitable, Callable, Iterable, Optional, Union
+
+_logger = logging.getLogger(__name__)
+
+# How measurements are queued for a callback that is still busy with an earlier one.
+# "queue": Measurements wait in a bounded queue; the oldest is dropped when it is full.
+# "latest": Only the newest measurement waits, older ones are dropped ("latest value wins").
+POLICIES = ("queue", "latest")
+
+
+class CallbackWorker:
+    """Calls a single callback from its own task with the measurements queued for it."""
+
+    def __init__(
+        self,
+        callback: Callable[..., Awaitable],
+        policy: str = "queue",
+        maxsize: int = 100,
+        timeout: Optional[Union[float, int]] = None,
+    ):
+        """
+        :param callback: The coroutine function to call.
+        :param policy: How to queue measurements while the callback is busy, see POLICIES.
+        :param maxsize: The maximum number of queued measurements with the "queue" policy.
+        :param timeout: The number of seconds a call may take before it is cancelled. None for no limit.
+        :throws ValueError: If the policy is unknown, maxsize is less than 1 or timeout is not positive.
+        """
+        if policy not in POLICIES:
+            raise ValueError(
+                f"Unknown policy {policy!r}. Use one of {', '.join(POLICIES)}."
+            )
+        if maxsize < 1:
+            raise ValueError("The maximum size of the queue must be at least 1.")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("The timeout must be greater than 0.")
+
+        self.callback = callback
+        self.policy = policy
+        self.timeout = timeout
+        self._pending = collections.deque(maxlen=1 if policy == "latest" else maxsize)
+
+        self.delivered = 0
+        self.dropped = 0
+        self.failed = 0
+        self.timed_out = 0
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._idle: Optional[asyncio.Event] = None
+
+    @property
+    def name(self) -> str:
+        return getattr(self.callback, "__qualname__", repr(self.callback))
+
+    def submit(self, data) -> None:
+        """Queues a measurement for the callback without waiting for it to be handled."""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._loop is not loop:
+            self._start(loop)
+        if len(self._pending) == self._pending.maxlen:
+            self.dropped += 1
+        self._pending.append(data)
+        self._idle.clear()
+        self._wakeup.set()
+
+    def _start(self, loop: asyncio.AbstractEventLoop) -> None:
+        # Measurements queued on another (closed) event loop are not delivered.
+        self._pending.clear()
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            if not self._pending:
+                self._idle.set()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            await self._call(self._pending.popleft())
+
+    async def _call(self, data) -> None:
+        try:
+            await asyncio.wait_for(self.callback(data), self.timeout)
+            self.delivered += 1
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            _logger.warning(
+                f"The callback {self.name} did not finish within {self.timeout} seconds and was cancelled."
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.failed += 1
+            _logger.exception(f"The callback {self.name} raised an exception.")
+
+    async def drain(self) -> None:
+        """Waits until all queued measurements have been handled."""
+        if (
+            self._task is not None
+            and not self._task.done()
+            and self._loop is asyncio.get_running_loop()
+        ):
+            await self._idle.wait()
+
+    async def close(self, drain: bool = True) -> None:
+        """Stops the task of the callback. It is started again by the next measurement.
+
+        :param drain: Whether to handle the queued measurements first instead of dropping them.
+        """
+        if drain:
+            await self.drain()
+        self._pending.clear()
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            if self._loop is asyncio.get_running_loop():
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+        self._task = None
+
+    @property
+    def metrics(self) -> dict:
+        return {
+            "name": self.name,
+            "queued": len(self._pending),
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+        }
+
+
+class CallbackDispatcher:
+    """Passes measurements to callbacks that each run in their own task.
+
+    Dispatching does not wait for the callbacks, so a slow callback neither delays the other
+    callbacks nor the reading of the websocket. An exception or timeout in a callback is logged
+    and counted for that callback only.
+    """
+
+    def __init__(self):
+        self._workers: dict = {}
+
+    def register(
+        self,
+        callback: Callable[..., Awaitable],
+        policy: str = "queue",
+        maxsize: int = 100,
+        timeout: Optional[Union[float, int]] = None,
+    ) -> None:
+        """Sets how measurements are passed to a callback. See CallbackWorker for the parameters."""
+        self._workers[callback] = CallbackWorker(callback, policy, maxsize, timeout)
+
+    def dispatch(self, callbacks: Iterable[Callable[..., Awaitable]], data) -> None:
+        """Queues a measurement for each of the callbacks. Must be called from a running event loop."""
+        for callback in callbacks:
+            worker = self._workers.get(callback)
+            if worker is None:
+                worker = self._workers[callback] = CallbackWorker(callback)
+            worker.submit(data)
+
+    async def drain(self) -> None:
+        """Waits until all callbacks have handled their queued measurements."""
+        await asyncio.gather(
+            *(worker.drain() for worker in list(self._workers.values()))
+        )
+
+    async def close(self, drain: bool = True) -> None:
+        """Stops the tasks of all callbacks.
+
+        :param drain: Whether to handle the queued measurements first instead of dropping them.
+        """
+        await asyncio.gather(
+            *(worker.close(drain) for worker in list(self._workers.values()))
+        )
+
+    @property
+    def metrics(self) -> dict:
+        """The number of queued, delivered, dropped, failed and timed out measurements by
+        callback. The name of the callback is included as a label, since several callbacks
+        (e.g. lambdas) can have the same name."""
+        return {callback: worker.metrics for callback, worker in self._workers.items()}
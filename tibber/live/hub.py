@@ -0,0 +1,211 @@
+"""Live measurement subscriptions of several homes over a single websocket."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Union
+
+import gql
+
+from tibber.live import websocket
+from tibber.networking import QueryBuilder, gql_compat
+from tibber.networking.document_cache import document_cache
+from tibber.networking.rate_limiter import request_priority
+
+# Import type checking modules
+if TYPE_CHECKING:
+    from tibber.account import Account
+    from tibber.types.home import TibberHome
+    from tibber.types.live_measurement import LiveMeasurement
+
+_logger = logging.getLogger(__name__)
+
+
+class LiveFeedHub:
+    """Runs the live measurement subscriptions of several homes over one websocket.
+
+    The graphql-ws protocol multiplexes subscriptions, so one connection (with one TLS handshake
+    and one ping/pong loop) is enough for all homes of an API token. Each measurement is passed on
+    to the callbacks of the home it belongs to. The websocket is connected for the first
+    subscription and closed when the last subscription ends.
+
+    Example:
+        hub = LiveFeedHub.for_account(account)
+        await hub.run(account.homes, exit_condition=lambda data: data.power > 5000)
+    """
+
+    # The hubs by API token, so accounts with the same token share one websocket.
+    _hubs: "weakref.WeakValueDictionary[str, LiveFeedHub]" = (
+        weakref.WeakValueDictionary()
+    )
+
+    def __init__(self, tibber_client: "Account", retries: int = 3, **kwargs):
+        """
+        :param tibber_client: The account to authenticate with. It must have a user agent.
+        :param retries: The number of times to retry connecting and subscribing.
+        :param kwargs: Additional arguments to pass to the websocket (gql.transport.WebsocketsTransport).
+        """
+        self.tibber_client = tibber_client
+        self.retries = retries
+        self._transport_kwargs = kwargs
+        self._websocket_client: Optional[gql.Client] = None
+        self._session = None
+        # The lock belongs to the event loop it was created on. start() runs every call on a new loop.
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._connect_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._active_subscriptions: dict = {}
+
+    @classmethod
+    def for_account(cls, tibber_client: "Account", **kwargs) -> "LiveFeedHub":
+        """Returns the hub for the token of an account, creating it if there is none yet.
+
+        :param tibber_client: The account to authenticate with.
+        :param kwargs: Arguments for a new hub, see LiveFeedHub.__init__. Ignored if the hub exists.
+        """
+        hub = cls._hubs.get(tibber_client.token)
+        if hub is None:
+            hub = cls(tibber_client, **kwargs)
+            cls._hubs[tibber_client.token] = hub
+        return hub
+
+    @property
+    def subscribed_homes(self) -> list:
+        """The ids of the homes with a running subscription."""
+        return list(self._active_subscriptions)
+
+    @property
+    def connected(self) -> bool:
+        """Returns True if the websocket is connected."""
+        return self._session is not None
+
+    async def run(
+        self,
+        homes: Optional[Iterable["TibberHome"]] = None,
+        exit_condition: Callable[["LiveMeasurement"], bool] = None,
+        fields: Optional[Union[str, Iterable[str]]] = None,
+    ) -> None:
+        """Subscribes to the live measurements of several homes and waits until all
+        subscriptions have ended.
+
+        :param homes: The homes to subscribe to. Defaults to all homes of the account with real
+            time consumption enabled.
+        :param exit_condition: A function that takes a LiveMeasurement as input and returns a
+            boolean. If it returns True, the subscription of the home the measurement belongs to ends.
+        :param fields: The fields to subscribe to, see subscribe(). Defaults to all fields.
+        :throws ValueError: If a home does not have real time consumption enabled.
+        """
+        with request_priority("live"):
+            await self.tibber_client.update_async(fields="live")
+
+        if homes is None:
+            homes = [
+                home
+                for home in self.tibber_client.homes
+                if home.features.real_time_consumption_enabled
+            ]
+        await asyncio.gather(
+            *(self.subscribe(home, exit_condition, fields) for home in homes)
+        )
+
+    def start(
+        self,
+        homes: Optional[Iterable["TibberHome"]] = None,
+        exit_condition: Callable[["LiveMeasurement"], bool] = None,
+        fields: Optional[Union[str, Iterable[str]]] = None,
+    ) -> None:
+        """Blocking version of run(), like TibberHome.start_live_feed()."""
+        try:
+            asyncio.run(self.run(homes, exit_condition, fields))
+        except KeyboardInterrupt:
+            _logger.info("Keyboard interrupt detected. Websocket should be closed now.")
+
+    async def subscribe(
+        self,
+        home: "TibberHome",
+        exit_condition: Callable[["LiveMeasurement"], bool] = None,
+        fields: Optional[Union[str, Iterable[str]]] = None,
+    ) -> None:
+        """Subscribes to the live measurements of a home on the shared websocket and passes them
+        to the callbacks of the home until the exit condition is met.
+
+        :param home: The home to subscribe to.
+        :param exit_condition: A function that takes a LiveMeasurement as input and returns a boolean.
+            If it returns True, the subscription ends.
+        :param fields: The fields to subscribe to, as the name of a profile in
+            QueryBuilder.LIVE_MEASUREMENT_PROFILES or a list of profile names and LiveMeasurement
+            fields. Defaults to all fields.
+        :throws ValueError: If the home does not have real time consumption enabled, already has
+            a subscription on this hub or a field is unknown.
+        """
+        if not home.features.real_time_consumption_enabled:
+            raise ValueError(
+                f"The home {home.id} does not have real time consumption enabled."
+            )
+        if home.id in self._active_subscriptions:
+            raise ValueError(f"The home {home.id} is already subscribed to.")
+        query = QueryBuilder.live_measurement(fields)
+
+        self._active_subscriptions[home.id] = home
+        try:
+            session = await self.connect()
+            await websocket.retry_subscribe(self.retries)(self._run_subscription)(
+                session, home, query, exit_condition
+            )
+        finally:
+            await home.close_callbacks()
+            home.end_streams()
+            del self._active_subscriptions[home.id]
+            if not self._active_subscriptions:
+                await self.close()
+
+    async def _run_subscription(self, session, home, query, exit_condition) -> None:
+        document = document_cache.get(query)
+        _logger.info(f"Subscribing to the live measurements of home {home.id}.")
+        async for data in gql_compat.subscribe(
+            session, document, variable_values={"homeId": home.id}
+        ):
+            if await home.process_websocket_response(
+                data, exit_condition=exit_condition
+            ):
+                _logger.info(f"Exit condition met for home {home.id}.")
+                return
+
+    async def connect(self):
+        """Connects the websocket if it is not connected yet. This is done automatically by
+        subscribe()."""
+        loop = asyncio.get_running_loop()
+        if self._connect_lock is None or self._connect_loop is not loop:
+            self._connect_lock, self._connect_loop = asyncio.Lock(), loop
+
+        async with self._connect_lock:
+            if self._session is None:
+                if not self.tibber_client.user_agent:
+                    raise ValueError(
+                        'You must specify a user agent when starting the live feed. E.g. "Homey/10.0.0"'
+                    )
+                self._websocket_client = gql.Client(
+                    transport=websocket.create_websocket_transport(
+                        self.tibber_client, **self._transport_kwargs
+                    )
+                )
+                _logger.debug("Connecting the shared websocket.")
+                self._session = await self._websocket_client.connect_async(
+                    reconnecting=True,
+                    retry_connect=websocket.retry_connect(self.retries),
+                )
+                _logger.info("Connected to websocket.")
+        return self._session
+
+    async def close(self) -> None:
+        """Closes the websocket. Running subscriptions end with an error."""
+        if self._websocket_client is None:
+            return
+        client, self._websocket_client, self._session = (
+            self._websocket_client,
+            None,
+            None,
+        )
+        await client.close_async()
+        _logger.info("Shared websocket connection closed.")
@@ -0,0 +1,320 @@
+"""A fixed-size buffer of recent live measurements with rolling statistics."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple
+
+from tibber.networking.cursor import parse_timestamp
+
+# Import type checking modules
+if TYPE_CHECKING:
+    from tibber.types.live_measurement import LiveMeasurement
+
+# The LiveMeasurement attributes that are kept by default.
+DEFAULT_FIELDS = (
+    "power",
+    "power_production",
+    "voltage_phase_1",
+    "voltage_phase_2",
+    "voltage_phase_3",
+    "currentL1",
+    "currentL2",
+    "currentL3",
+    "accumulated_consumption",
+    "accumulated_production",
+    "accumulated_consumption_last_hour",
+    "accumulated_production_last_hour",
+    "accumulated_cost",
+    "accumulated_reward",
+)
+
+
+class LiveMeasurementBuffer:
+    """Keeps the most recent live measurements of a home in fixed-size arrays.
+
+    Each field is stored in a circular array of floats (missing values are NaN), next to an array
+    of timestamps in seconds since the epoch. Windows ("the last N seconds", counted back from the
+    newest measurement) are found with a binary search over the timestamps. Running sums make mean
+    queries O(1) after that, and min/max queries use a segment tree that is built for a field the
+    first time it is queried. Percentiles sort the values in the window.
+
+    Example:
+        buffer = home.enable_live_buffer(capacity=3600)
+        home.start_live_feed(...)
+        buffer.mean("power", seconds=60), buffer.max("power", seconds=300)
+    """
+
+    def __init__(self, capacity: int = 3600, fields: Iterable[str] = DEFAULT_FIELDS):
+        """
+        :param capacity: The number of measurements to keep.
+        :param fields: The LiveMeasurement attributes to keep, e.g. "power" or "currentL1".
+        :throws ValueError: If capacity is less than 1 or no fields are given.
+        """
+        if capacity < 1:
+            raise ValueError("The capacity must be at least 1.")
+        self.fields = tuple(fields)
+        if not self.fields:
+            raise ValueError("At least one field must be kept.")
+
+        self.capacity = capacity
+        self._start = 0  # The slot of the oldest measurement.
+        self._size = 0
+        # Measurements that were older than the newest one or had no timestamp.
+        self.skipped = 0
+
+        empty = array("d", [math.nan]) * capacity
+        self._times = array("d", empty)
+        self._values = {field: array("d", empty) for field in self.fields}
+        # Running totals of the values (missing values count as 0) and of the number of values,
+        # up to and including each slot, and the totals of the last evicted measurement. The
+        # totals are re-based every time the buffer wraps around, so they stay in the range of
+        # the values in the buffer instead of growing with the stream.
+        self._sums = {field: array("d", bytes(8 * capacity)) for field in self.fields}
+        self._counts = {field: array("q", bytes(8 * capacity)) for field in self.fields}
+        self._evicted = {field: (0.0, 0) for field in self.fields}
+        # Segment trees over the slots for min and max queries, by field.
+        self._min_trees: dict = {}
+        self._max_trees: dict = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, measurement: "LiveMeasurement") -> None:
+        """Adds a measurement, replacing the oldest one if the buffer is full.
+
+        Measurements without a timestamp or with a timestamp before the newest measurement are
+        skipped and counted in the skipped attribute.
+        """
+        if measurement.timestamp is None:
+            self.skipped += 1
+            return
+        time = parse_timestamp(measurement.timestamp).timestamp()
+        if self._size and time < self._times[self._slot(self._size - 1)]:
+            self.skipped += 1
+            return
+
+        if self._size == self.capacity:
+            oldest = self._start
+            for field in self.fields:
+                self._evicted[field] = (
+                    self._sums[field][oldest],
+                    self._counts[field][oldest],
+                )
+            self._start = (self._start + 1) % self.capacity
+            self._size -= 1
+            if self._start == 0:
+                self._rebase_totals()
+
+        previous = self._slot(self._size - 1) if self._size else None
+        slot = self._slot(self._size)
+        self._size += 1
+        self._times[slot] = time
+
+        for field in self.fields:
+            value = getattr(measurement, field)
+            value = math.nan if value is None else float(value)
+            self._values[field][slot] = value
+            if previous is None:
+                total, count = self._evicted[field]
+            else:
+                total, count = (
+                    self._sums[field][previous],
+                    self._counts[field][previous],
+                )
+            present = not math.isnan(value)
+            self._sums[field][slot] = total + value if present else total
+            self._counts[field][slot] = count + 1 if present else count
+
+            if field in self._min_trees:
+                self._set_leaf(
+                    self._min_trees[field], slot, value if present else math.inf, min
+                )
+                self._set_leaf(
+                    self._max_trees[field], slot, value if present else -math.inf, max
+                )
+
+    def values(self, field: str, seconds: Optional[float] = None) -> list:
+        """Returns the values of a field in the window, oldest first. Missing values are None.
+
+        :param field: One of the fields of the buffer.
+        :param seconds: The length of the window, counted back from the newest measurement.
+            None for all measurements in the buffer.
+        """
+        column = self._column(field)
+        first, last = self._window(seconds)
+        values = (column[self._slot(index)] for index in range(first, last))
+        return [None if math.isnan(value) else value for value in values]
+
+    def timestamps(self, seconds: Optional[float] = None) -> list:
+        """Returns the timestamps of the measurements in the window in seconds since the epoch."""
+        first, last = self._window(seconds)
+        return [self._times[self._slot(index)] for index in range(first, last)]
+
+    def mean(self, field: str, seconds: Optional[float] = None) -> Optional[float]:
+        """Returns the mean value of a field in the window, or None if it has no values."""
+        self._column(field)
+        first, last = self._window(seconds)
+        if first == last:
+            return None
+        total, count = self._totals(field, last - 1)
+        total_before, count_before = self._totals(field, first - 1)
+        count -= count_before
+        return (total - total_before) / count if count else None
+
+    def min(self, field: str, seconds: Optional[float] = None) -> Optional[float]:
+        """Returns the smallest value of a field in the window, or None if it has no values."""
+        value = self._tree_query(field, seconds, self._min_trees, min, math.inf)
+        return None if value == math.inf else value
+
+    def max(self, field: str, seconds: Optional[float] = None) -> Optional[float]:
+        """Returns the largest value of a field in the window, or None if it has no values."""
+        value = self._tree_query(field, seconds, self._max_trees, max, -math.inf)
+        return None if value == -math.inf else value
+
+    def percentile(
+        self, field: str, percentile: float, seconds: Optional[float] = None
+    ) -> Optional[float]:
+        """Returns a percentile of the values of a field in the window, interpolating linearly
+        between the closest values. Returns None if the window has no values.
+
+        :param field: One of the fields of the buffer.
+        :param percentile: The percentile between 0 and 100, e.g. 50 for the median.
+        :param seconds: The length of the window, counted back from the newest measurement.
+        :throws ValueError: If the percentile is not between 0 and 100.
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError("The percentile must be between 0 and 100.")
+        values = sorted(
+            value for value in self.values(field, seconds) if value is not None
+        )
+        if not values:
+            return None
+        position = (len(values) - 1) * percentile / 100
+        lower = math.floor(position)
+        upper = min(lower + 1, len(values) - 1)
+        return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+    def rate_of_change(
+        self, field: str, seconds: Optional[float] = None
+    ) -> Optional[float]:
+        """Returns how much a field changed per second between the first and the last value in the
+        window, e.g. in W/s for power. Returns None if the window has less than two values at
+        different times.
+        """
+        column = self._column(field)
+        first, last = self._window(seconds)
+        start = self._first_present(column, range(first, last))
+        end = self._first_present(column, range(last - 1, first - 1, -1))
+        if start is None:
+            return None
+        elapsed = self._times[end] - self._times[start]
+        if elapsed <= 0:
+            return None
+        return (column[end] - column[start]) / elapsed
+
+    def _rebase_totals(self) -> None:
+        """Subtracts the totals of the evicted measurements from the running totals."""
+        for field in self.fields:
+            total, count = self._evicted[field]
+            sums, counts = self._sums[field], self._counts[field]
+            for slot in range(self.capacity):
+                sums[slot] -= total
+                counts[slot] -= count
+            self._evicted[field] = (0.0, 0)
+
+    def _slot(self, index: int) -> int:
+        """Returns the slot of the measurement at an index, where 0 is the oldest measurement."""
+        return (self._start + index) % self.capacity
+
+    def _column(self, field: str) -> array:
+        try:
+            return self._values[field]
+        except KeyError:
+            raise ValueError(
+                f"The field {field!r} is not kept. Use one of {', '.join(self.fields)}."
+            ) from None
+
+    def _window(self, seconds: Optional[float]) -> Tuple[int, int]:
+        """Returns the indexes [first, last) of the measurements within the last seconds."""
+        if seconds is None or not self._size:
+            return 0, self._size
+        since = self._times[self._slot(self._size - 1)] - seconds
+        # Binary search for the first measurement at or after since.
+        low, high = 0, self._size
+        while low < high:
+            middle = (low + high) // 2
+            if self._times[self._slot(middle)] < since:
+                low = middle + 1
+            else:
+                high = middle
+        return low, self._size
+
+    def _totals(self, field: str, index: int) -> Tuple[float, int]:
+        """Returns the running totals up to and including the measurement at an index."""
+        if index < 0:
+            return self._evicted[field]
+        slot = self._slot(index)
+        return self._sums[field][slot], self._counts[field][slot]
+
+    def _first_present(self, column: array, indexes: range) -> Optional[int]:
+        """Returns the slot of the first measurement in indexes with a value."""
+        for index in indexes:
+            if not math.isnan(column[self._slot(index)]):
+                return self._slot(index)
+        return None
+
+    def _tree_query(self, field, seconds, trees, combine, empty) -> float:
+        column = self._column(field)
+        if field not in trees:
+            self._build_trees(field, column)
+        tree = trees[field]
+        first, last = self._window(seconds)
+        if first == last:
+            return empty
+        start, end = self._slot(first), self._slot(last - 1) + 1
+        if start < end:
+            return self._range_query(tree, start, end, combine, empty)
+        # The window wraps around the end of the arrays.
+        return combine(
+            self._range_query(tree, start, self.capacity, combine, empty),
+            self._range_query(tree, 0, end, combine, empty),
+        )
+
+    def _build_trees(self, field: str, column: array) -> None:
+        for trees, combine, empty in (
+            (self._min_trees, min, math.inf),
+            (self._max_trees, max, -math.inf),
+        ):
+            tree = array("d", [empty]) * (2 * self.capacity)
+            for index in range(self._size):
+                slot = self._slot(index)
+                if not math.isnan(column[slot]):
+                    tree[self.capacity + slot] = column[slot]
+            for node in range(self.capacity - 1, 0, -1):
+                tree[node] = combine(tree[2 * node], tree[2 * node + 1])
+            trees[field] = tree
+
+    def _set_leaf(self, tree: array, slot: int, value: float, combine) -> None:
+        node = self.capacity + slot
+        tree[node] = value
+        while node > 1:
+            node //= 2
+            tree[node] = combine(tree[2 * node], tree[2 * node + 1])
+
+    def _range_query(self, tree: array, start: int, end: int, combine, empty) -> float:
+        """Combines the leaves of the slots [start, end)."""
+        result = empty
+        start += self.capacity
+        end += self.capacity
+        while start < end:
+            if start & 1:
+                result = combine(result, tree[start])
+                start += 1
+            if end & 1:
+                end -= 1
+                result = combine(result, tree[end])
+            start //= 2
+            end //= 2
+        return result
@@ -0,0 +1,189 @@
+"""An async iterator over the live measurements of a home."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Iterable, Optional, Union
+
+from tibber.live.hub import LiveFeedHub
+from tibber.networking import QueryBuilder
+from tibber.networking.rate_limiter import request_priority
+
+# Import type checking modules
+if TYPE_CHECKING:
+    from tibber.types.home import TibberHome
+    from tibber.types.live_measurement import LiveMeasurement
+
+_logger = logging.getLogger(__name__)
+
+# Marks the end of the stream in the queue.
+_END = object()
+
+
+class LiveMeasurementStream:
+    """Iterates over the live measurements of a home with `async for`.
+
+    Measurements are put into a bounded queue by the websocket reader and taken out by the
+    consumer, so a slow consumer does not stall the websocket. When the queue is full, the overflow
+    policy decides what happens:
+
+    - "drop_oldest": The oldest queued measurement is dropped to make room (the default).
+    - "drop_newest": The new measurement is dropped.
+    - "block": The reader waits for the consumer. Measurements of the home are not read from the
+      websocket in the meantime.
+
+    If the home already runs its own live feed or is subscribed to on the LiveFeedHub of its
+    account, the stream receives the measurements of that feed and ends when the feed stops.
+    Otherwise the stream subscribes to the home on the hub when iteration starts. The subscription
+    ends when the stream is closed, which is done automatically when it is used as an async
+    context manager.
+
+    Example:
+        async with home.live_measurements(maxsize=10) as stream:
+            async for measurement in stream:
+                print(measurement.power)
+    """
+
+    OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+    def __init__(
+        self,
+        home: "TibberHome",
+        maxsize: int = 100,
+        overflow: str = "drop_oldest",
+        fields: Optional[Union[str, Iterable[str]]] = None,
+    ):
+        """
+        :param home: The home to stream the live measurements of.
+        :param maxsize: The maximum number of measurements to queue.
+        :param overflow: The policy for a full queue, see the class documentation.
+        :param fields: The fields to subscribe to, see LiveFeedHub.subscribe(). Only used if the
+            stream subscribes to the home itself.
+        :throws ValueError: If maxsize is less than 1, or the overflow policy or a field is unknown.
+        """
+        if maxsize < 1:
+            raise ValueError("The maximum size of the queue must be at least 1.")
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown overflow policy {overflow!r}. Use one of {', '.join(self.OVERFLOW_POLICIES)}."
+            )
+
+        self.home = home
+        self.fields = QueryBuilder.resolve_live_measurement_fields(fields)
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.received = 0
+        self.dropped = 0
+        self._queue: Optional[asyncio.Queue] = None
+        # Set whenever a measurement is taken out of the queue or the stream ends.
+        self._space_available: Optional[asyncio.Event] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
+        self._closed = False
+
+    @property
+    def qsize(self) -> int:
+        """The number of queued measurements."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def put(self, measurement: "LiveMeasurement") -> None:
+        """Adds a measurement to the queue, following the overflow policy. Called by the home for
+        every measurement it receives."""
+        if self._closed or self._queue is None:
+            return
+        self.received += 1
+
+        if self.overflow == "block":
+            while self._queue.full():
+                self._space_available.clear()
+                await self._space_available.wait()
+                if self._closed:
+                    return
+            self._queue.put_nowait(measurement)
+            return
+
+        if self._queue.full():
+            self.dropped += 1
+            if self.overflow == "drop_newest":
+                return
+            self._queue.get_nowait()
+        self._queue.put_nowait(measurement)
+
+    def start(self) -> None:
+        """Registers the stream with its home and subscribes to the home if needed. This is done
+        automatically when iteration starts."""
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue(self.maxsize)
+        self._space_available = asyncio.Event()
+        self.home._streams.append(self)
+        self._reader = asyncio.ensure_future(self._read())
+
+    async def _read(self) -> None:
+        hub = LiveFeedHub.for_account(self.home.tibber_client)
+        try:
+            if self.home.live_feed_running or self.home.id in hub.subscribed_homes:
+                # The measurements of the running live feed are passed on to the stream, which
+                # is ended by the home when the live feed stops.
+                return
+            with request_priority("live"):
+                await self.home.tibber_client.update_async(fields="live")
+            await hub.subscribe(self.home, fields=self.fields)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            _logger.error(f"The live feed of home {self.home.id} failed: {e}")
+            self._error = e
+        self.end()
+
+    def end(self) -> None:
+        """Ends the stream once the queued measurements are read. Called by the home when its live
+        feed stops."""
+        if self._closed:
+            return
+        self._closed = True
+        if self in self.home._streams:
+            self.home._streams.remove(self)
+        self._space_available.set()
+        # A full queue is drained by the consumer first, which then finds the stream closed.
+        if not self._queue.full():
+            self._queue.put_nowait(_END)
+
+    async def close(self) -> None:
+        """Ends the stream and the subscription it started. Queued measurements can still be read."""
+        if self._queue is None:
+            self._closed = True
+            return
+        self.end()
+        if self._reader is not None and not self._reader.done():
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+
+    def __aiter__(self) -> "LiveMeasurementStream":
+        return self
+
+    async def __anext__(self) -> "LiveMeasurement":
+        self.start()
+        if self._closed and self._queue.empty():
+            self._finish()
+        measurement = await self._queue.get()
+        self._space_available.set()
+        if measurement is _END:
+            self._finish()
+        return measurement
+
+    def _finish(self):
+        if self._error is not None:
+            raise self._error
+        raise StopAsyncIteration
+
+    async def __aenter__(self) -> "LiveMeasurementStream":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
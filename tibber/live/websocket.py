@@ -0,0 +1,77 @@
+"""Helpers for the graphql-ws websocket of the live measurement subscriptions."""
+
+import logging
+
+import backoff
+import gql
+import websockets
+from gql.transport.exceptions import TransportQueryError
+from gql.transport.websockets import WebsocketsTransport
+
+from tibber import __version__
+
+_logger = logging.getLogger(__name__)
+
+
+def create_websocket_transport(tibber_client, **kwargs) -> WebsocketsTransport:
+    """Creates the transport for a websocket to the live measurement endpoint of an account.
+
+    :param tibber_client: The account to authenticate with. Its user agent is sent to the API.
+    :param kwargs: Additional arguments to pass to gql.transport.WebsocketsTransport.
+    """
+    return WebsocketsTransport(
+        **kwargs,
+        url=tibber_client.viewer.websocket_subscription_url,
+        subprotocols=[WebsocketsTransport.GRAPHQLWS_SUBPROTOCOL],
+        init_payload={"token": tibber_client.token},
+        headers={"User-Agent": f"{tibber_client.user_agent} tibber.py/{__version__}"},
+        ping_interval=10,
+        pong_timeout=10,
+    )
+
+
+def _give_up(e: Exception) -> bool:
+    return isinstance(e, TransportQueryError) or isinstance(e, ValueError)
+
+
+def retry_connect(retries: int):
+    """Returns the backoff decorator for (re)connecting a websocket.
+
+    :param retries: The maximum number of attempts.
+    """
+    return backoff.on_exception(
+        backoff.expo,
+        [
+            gql.transport.exceptions.TransportClosed,
+            websockets.exceptions.ConnectionClosedError,
+        ],
+        max_value=100,
+        max_tries=retries,
+        on_backoff=lambda details: _logger.warning(
+            "Retrying to connect with backoff. Running {target} in {wait:.1f} seconds after {tries} tries.".format(
+                **details
+            )
+        ),
+        jitter=backoff.full_jitter,
+        giveup=_give_up,
+    )
+
+
+def retry_subscribe(retries: int):
+    """Returns the backoff decorator for (re)subscribing to live measurements.
+
+    :param retries: The maximum number of attempts.
+    """
+    return backoff.on_exception(
+        backoff.expo,
+        Exception,
+        max_value=100,
+        max_tries=retries,
+        on_backoff=lambda details: _logger.warning(
+            "Retrying to subscribe with backoff. Running {target} in {wait:.1f} seconds after {tries} tries.".format(
+                **details
+            )
+        ),
+        jitter=backoff.full_jitter,
+        giveup=_give_up,
+    )
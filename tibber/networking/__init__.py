@@ -1,4 +1,12 @@
+from tibber.networking.cache_merger import CacheMerger
 from tibber.networking.query_builder import QueryBuilder
 from tibber.networking.query_executor import QueryExecutor
+from tibber.networking.rate_limiter import RateLimiter, request_priority
 
-__all__ = ["QueryBuilder", "QueryExecutor"]
+__all__ = [
+    "CacheMerger",
+    "QueryBuilder",
+    "QueryExecutor",
+    "RateLimiter",
+    "request_priority",
+]
@@ -0,0 +1,121 @@
+"""A class for merging API responses into the cache of an account."""
+
+
+class CacheMerger:
+    """Merges API responses into a cache dict in place and reports which paths changed.
+
+    Lists of objects are matched element by element with a key (see LIST_KEYS) instead of being
+    replaced, so the cached element objects are kept and updated in place. In a partial merge, a
+    response that only covers some of the entities (see ENTITY_LISTS) updates those entities and
+    leaves the rest of the list untouched.
+
+    Changed paths are returned as tuples of keys. Elements of keyed lists are identified by the
+    value of their key, e.g. ("viewer", "homes", "<home id>", "size").
+    """
+
+    # The key to match the elements of a list by, given the name of the field holding the list.
+    LIST_KEYS = {
+        "homes": "id",
+        "subscriptions": "id",
+        "today": "startsAt",
+        "tomorrow": "startsAt",
+        "entries": "time",
+    }
+
+    # Lists of entities which may be refreshed one element at a time. In a partial merge, cached
+    # elements missing from the response are kept. Otherwise, and for the other keyed lists (price
+    # series, which the API always returns whole), elements missing from the response are removed.
+    ENTITY_LISTS = {"homes", "subscriptions"}
+
+    @classmethod
+    def merge(
+        cls, cache: dict, data: dict, path: tuple = (), partial: bool = False
+    ) -> set:
+        """Merges data into the cache dict in place.
+
+        :param cache: The dict to update.
+        :param data: The new data to merge into the cache.
+        :param path: The path of the cache dict. Prefixed to all returned paths.
+        :param partial: Whether the data may only contain some of the entities of a list, e.g.
+            a single refreshed home. If False, entities missing from the data are removed.
+        :return: A set with the paths of all values that were added, changed or removed.
+        :throws TypeError: If cache or data is not a dict.
+        """
+        if not (isinstance(cache, dict) and isinstance(data, dict)):
+            raise TypeError(f"Cannot merge types {type(cache)} and {type(data)}.")
+
+        changes = set()
+        for key, value in data.items():
+            key_path = path + (key,)
+            if key not in cache:
+                cache[key] = value
+                changes.add(key_path)
+            elif isinstance(cache[key], dict) and isinstance(value, dict):
+                changes |= cls.merge(cache[key], value, key_path, partial)
+            elif isinstance(cache[key], list) and isinstance(value, list):
+                changes |= cls._merge_list(cache, key, value, key_path, partial)
+            elif cache[key] != value:
+                cache[key] = value
+                changes.add(key_path)
+        return changes
+
+    @classmethod
+    def _merge_list(
+        cls, cache: dict, key: str, items: list, path: tuple, partial: bool
+    ) -> set:
+        cached_items = cache[key]
+        item_key = cls.LIST_KEYS.get(key)
+        if item_key is None or not (
+            cls._is_keyed(cached_items, item_key) and cls._is_keyed(items, item_key)
+        ):
+            if cached_items == items:
+                return set()
+            cache[key] = items
+            return {path}
+
+        changes = set()
+        cached_by_key = {item[item_key]: item for item in cached_items}
+
+        if partial and key in cls.ENTITY_LISTS:
+            # Update the matching elements in place and append new ones.
+            for item in items:
+                cached_item = cached_by_key.get(item[item_key])
+                if cached_item is None:
+                    cached_items.append(item)
+                    changes.add(path + (item[item_key],))
+                else:
+                    changes |= cls.merge(
+                        cached_item, item, path + (item[item_key],), partial
+                    )
+            return changes
+
+        # Keep the cached element objects that are still part of the list, in the order of
+        # the response, and drop the elements that are not.
+        merged_items = []
+        for item in items:
+            cached_item = cached_by_key.pop(item[item_key], None)
+            if cached_item is None:
+                merged_items.append(item)
+                changes.add(path + (item[item_key],))
+            else:
+                changes |= cls.merge(
+                    cached_item, item, path + (item[item_key],), partial
+                )
+                merged_items.append(cached_item)
+        changes.update(path + (removed_key,) for removed_key in cached_by_key)
+
+        if not changes and [item[item_key] for item in cached_items] != [
+            item[item_key] for item in merged_items
+        ]:
+            changes.add(path)
+        cached_items[:] = merged_items
+        return changes
+
+    @staticmethod
+    def _is_keyed(items: list, item_key: str) -> bool:
+        return all(isinstance(item, dict) and item_key in item for item in items)
+
+    @staticmethod
+    def format_path(path: tuple) -> str:
+        """Formats a changed path as a dot separated string."""
+        return ".".join(str(key) for key in path)
@@ -0,0 +1,163 @@
+"""Fetching long periods of a paginated connection in parallel.
+
+The cursors of the Tibber API are encoded timestamps (see tibber.networking.cursor), so the page
+that starts at any point in time can be requested directly. A period is split into chunks which
+are fetched concurrently, and the nodes of all chunks are stitched together afterwards.
+"""
+
+import asyncio
+import math
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Union
+
+from tibber.networking.cursor import encode_cursor, parse_timestamp
+from tibber.networking.rate_limiter import request_priority
+
+# The nominal length of a node for each resolution, used to split a period into chunks, and the
+# shortest possible length (days with a daylight saving time change, February, ...), used to
+# estimate how many nodes a chunk can contain at most.
+RESOLUTION_STEPS = {
+    "HOURLY": (timedelta(hours=1), timedelta(hours=1)),
+    "DAILY": (timedelta(days=1), timedelta(hours=23)),
+    "WEEKLY": (timedelta(weeks=1), timedelta(days=7, hours=-1)),
+    "MONTHLY": (timedelta(days=31), timedelta(days=28, hours=-1)),
+    "ANNUAL": (timedelta(days=366), timedelta(days=365, hours=-1)),
+}
+
+# The largest page to request in a single query.
+MAX_PAGE_SIZE = 5000
+
+
+def split_period(
+    since: datetime, until: datetime, resolution: str, chunk_size: int
+) -> list:
+    """Splits a period into chunks of about chunk_size nodes.
+
+    :param since: The start of the period (inclusive).
+    :param until: The end of the period (exclusive).
+    :param resolution: The resolution of the nodes, e.g. "HOURLY".
+    :param chunk_size: The amount of nodes per chunk.
+    :return: A list of (start, end) tuples which cover the period without overlapping.
+    :throws ValueError: If the resolution is unknown or chunk_size is less than 1.
+    """
+    if resolution not in RESOLUTION_STEPS:
+        raise ValueError(f"Cannot split a period with the resolution {resolution}.")
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be at least 1.")
+
+    length = RESOLUTION_STEPS[resolution][0] * chunk_size
+    chunks = []
+    start = since
+    while start < until:
+        end = min(start + length, until)
+        chunks.append((start, end))
+        start = end
+    return chunks
+
+
+async def fetch_period(
+    fetch_page: Callable[..., Awaitable],
+    resolution: str,
+    since: Union[str, datetime],
+    until: Union[str, datetime],
+    time_field: str,
+    chunk_size: int = 500,
+    concurrency: int = 4,
+) -> dict:
+    """Fetches all nodes of a connection in a period, with several chunks in flight at once.
+
+    :param fetch_page: A coroutine function that fetches a page. It is called with the first and
+        after keyword arguments and must return a connection object (with the response in .cache).
+    :param resolution: The resolution of the nodes, e.g. "HOURLY".
+    :param since: The start of the period (inclusive). Naive datetimes are assumed to be in the
+        local timezone.
+    :param until: The end of the period (exclusive).
+    :param time_field: The GraphQL field with the start time of a node, e.g. "from".
+    :param chunk_size: The amount of nodes to fetch per query.
+    :param concurrency: The maximum amount of queries to run at the same time.
+    :return: The data of a connection with the nodes and edges of the whole period, ordered by
+        time and without duplicates.
+    :throws ValueError: If concurrency or chunk_size is less than 1, or the resolution is unknown.
+    """
+    if concurrency < 1:
+        raise ValueError("The concurrency must be at least 1.")
+    since, until = parse_timestamp(since), parse_timestamp(until)
+    chunks = split_period(since, until, resolution, chunk_size)
+    shortest_step = RESOLUTION_STEPS[resolution][1]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_chunk(start: datetime, end: datetime) -> list:
+        pages = []
+        # A page starts after the time of its cursor.
+        cursor = encode_cursor(start - timedelta(milliseconds=1))
+        first = min(math.ceil((end - start) / shortest_step) + 1, MAX_PAGE_SIZE)
+        async with semaphore:
+            while True:
+                page = (await fetch_page(first=first, after=cursor)).cache
+                pages.append(page)
+                nodes = page.get("nodes") or []
+                page_info = page.get("pageInfo") or {}
+                # Continue the chunk only if a full page did not reach its end.
+                if not (
+                    len(nodes) >= first
+                    and page_info.get("hasNextPage")
+                    and page_info.get("endCursor") not in (None, cursor)
+                    and parse_timestamp(nodes[-1][time_field]) < end
+                ):
+                    return pages
+                cursor = page_info["endCursor"]
+
+    # Backfills must not delay interactive requests when a rate limiter is used.
+    with request_priority("bulk", override=False):
+        chunk_pages = await asyncio.gather(
+            *(fetch_chunk(start, end) for start, end in chunks)
+        )
+    pages = [page for pages in chunk_pages for page in pages]
+    return stitch_pages(pages, since, until, time_field)
+
+
+def stitch_pages(
+    pages: list, since: datetime, until: datetime, time_field: str
+) -> dict:
+    """Combines pages of a connection into a single connection.
+
+    Nodes and edges outside of [since, until) are left out, and nodes that occur on several pages
+    are only kept once.
+
+    :param pages: The connection data of the pages.
+    :param since: The start of the period (inclusive).
+    :param until: The end of the period (exclusive).
+    :param time_field: The GraphQL field with the start time of a node.
+    """
+    nodes, edges = {}, {}
+    for page in pages:
+        for node in page.get("nodes") or []:
+            time = parse_timestamp(node[time_field])
+            if since <= time < until:
+                nodes.setdefault(time, node)
+        for edge in page.get("edges") or []:
+            time = parse_timestamp(edge["node"][time_field])
+            if since <= time < until:
+                edges.setdefault(time, edge)
+
+    ordered_edges = [edges[time] for time in sorted(edges)]
+    first_info = (pages[0].get("pageInfo") or {}) if pages else {}
+    last_info = (pages[-1].get("pageInfo") or {}) if pages else {}
+    # Totals of single pages do not apply to the whole period, so only these values are kept.
+    page_info = {
+        key: first_info[key] for key in ("currency", "resolution") if key in first_info
+    }
+    page_info.update(
+        {
+            "count": len(nodes),
+            "startCursor": ordered_edges[0]["cursor"] if ordered_edges else None,
+            "endCursor": ordered_edges[-1]["cursor"] if ordered_edges else None,
+            "hasPreviousPage": first_info.get("hasPreviousPage"),
+            "hasNextPage": last_info.get("hasNextPage"),
+        }
+    )
+    return {
+        "pageInfo": page_info,
+        "nodes": [nodes[time] for time in sorted(nodes)],
+        "edges": ordered_edges,
+    }
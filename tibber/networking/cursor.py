@@ -0,0 +1,50 @@
+"""Functions for creating and reading the pagination cursors of the Tibber API.
+
+The cursors of consumption, production and price connections are Base64 encoded ISO 8601
+timestamps, e.g. "MjAyMy0wMi0wNlQwMTowMDowMC4wMDArMDE6MDA=" for 2023-02-06T01:00:00.000+01:00.
+This makes it possible to start a page at any time without fetching the pages before it.
+"""
+
+import base64
+from datetime import datetime
+from typing import Union
+
+
+def parse_timestamp(timestamp: Union[str, datetime]) -> datetime:
+    """Returns a timestamp as a timezone aware datetime.
+
+    :param timestamp: An ISO 8601 timestamp as returned by the API, or a datetime. Naive datetimes
+        are assumed to be in the local timezone.
+    """
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.astimezone()
+    return timestamp
+
+
+def encode_cursor(timestamp: Union[str, datetime]) -> str:
+    """Creates a cursor for a point in time.
+
+    :param timestamp: The time to create the cursor for, as an ISO 8601 timestamp or a datetime.
+        Naive datetimes are assumed to be in the local timezone.
+    """
+    timestamp = parse_timestamp(timestamp).isoformat(timespec="milliseconds")
+    return base64.b64encode(timestamp.encode("utf-8")).decode("utf-8")
+
+
+def decode_cursor(cursor: str) -> datetime:
+    """Returns the point in time of a cursor as a timezone aware datetime.
+
+    :param cursor: A cursor from the API or created with encode_cursor.
+    :throws ValueError: If the cursor is not a Base64 encoded ISO 8601 timestamp.
+    """
+    try:
+        timestamp = base64.b64decode(cursor.encode("utf-8"), validate=True).decode(
+            "utf-8"
+        )
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(
+            f"The cursor {cursor!r} is not a Base64 encoded timestamp."
+        ) from e
+    return parse_timestamp(timestamp)
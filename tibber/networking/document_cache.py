@@ -0,0 +1,88 @@
+"""A cache of parsed and validated GraphQL documents."""
+
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from graphql import DocumentNode, parse, validate
+
+from tibber.networking.schema import get_schema
+
+
+class DocumentCache:
+    """A bounded LRU cache of parsed GraphQL documents keyed by query text (or a stable query ID).
+
+    Documents are validated against the shared Tibber schema once, when they are added to the cache,
+    so repeated executions of the same query skip lexing, parsing and validation entirely. The
+    bundled schema only covers the queries of tibber.py. Queries that use other parts of the API
+    need the schema of the API, see Account(refresh_schema=True).
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """
+        :param maxsize: The maximum amount of documents to keep. The least recently used
+            document is evicted when the cache is full.
+        """
+        if maxsize < 1:
+            raise ValueError(
+                "The maximum size of the document cache must be at least 1."
+            )
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._documents: "OrderedDict[str, DocumentNode]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, query: str, key: Optional[str] = None) -> DocumentNode:
+        """Returns the parsed and validated document for a query.
+
+        :param query: The GraphQL query text.
+        :param key: An optional stable ID of the query to use as cache key instead of the query text.
+        :throws graphql.GraphQLError: If the query cannot be parsed or is invalid for the Tibber schema.
+        """
+        key = key or query
+        with self._lock:
+            document = self._documents.get(key)
+            if document is not None:
+                self._documents.move_to_end(key)
+                self.hits += 1
+                return document
+            self.misses += 1
+
+        document = parse(query)
+        errors = validate(get_schema(), document)
+        if errors:
+            raise errors[0]
+
+        with self._lock:
+            self._documents[key] = document
+            self._documents.move_to_end(key)
+            if len(self._documents) > self.maxsize:
+                self._documents.popitem(last=False)
+        return document
+
+    def clear(self) -> None:
+        """Removes all documents from the cache and resets the counters."""
+        with self._lock:
+            self._documents.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def info(self) -> dict:
+        """The hit and miss counters together with the current and maximum size of the cache."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._documents),
+                "maxsize": self.maxsize,
+            }
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+
+# The cache shared by all query executors and websockets in the process.
+document_cache = DocumentCache()
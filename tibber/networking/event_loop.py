@@ -0,0 +1,78 @@
+"""A long-lived asyncio event loop running in a background thread for the synchronous API."""
+
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import threading
+from typing import Coroutine, Optional
+
+_logger = logging.getLogger(__name__)
+
+
+class BackgroundEventLoop:
+    """An asyncio event loop which runs forever in a dedicated daemon thread.
+
+    Coroutines are submitted from other threads with asyncio.run_coroutine_threadsafe, which
+    means that network resources bound to the loop (like the aiohttp connection pool of a gql
+    session) stay alive between synchronous calls.
+    """
+
+    _shared: Optional["BackgroundEventLoop"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_forever, name="tibber-event-loop", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    @classmethod
+    def shared(cls) -> "BackgroundEventLoop":
+        """Returns the background loop shared by all synchronous clients in this process.
+        The loop (and its thread) is created on the first call."""
+        with cls._shared_lock:
+            if cls._shared is None or cls._shared.loop.is_closed():
+                cls._shared = cls()
+            return cls._shared
+
+    def _run_forever(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    @property
+    def in_loop_thread(self) -> bool:
+        """True if the caller is running in the thread of this event loop."""
+        return threading.get_ident() == self._thread.ident
+
+    def submit(self, coroutine: Coroutine) -> concurrent.futures.Future:
+        """Schedules a coroutine on the background loop and returns a concurrent future for its result."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def run(self, coroutine: Coroutine):
+        """Runs a coroutine on the background loop and blocks until it has completed.
+
+        :param coroutine: The coroutine to run.
+        :throws RuntimeError: If called from the background loop itself, as that would deadlock.
+        """
+        if self.in_loop_thread:
+            coroutine.close()
+            raise RuntimeError(
+                "Cannot block on the tibber background event loop from inside the loop itself. "
+                "Await the async variant of the method instead."
+            )
+        return self.submit(coroutine).result()
+
+    def close(self):
+        """Stops the loop and closes it. Callbacks registered with asyncio_atexit (like closing
+        the gql sessions) are run when the loop closes."""
+        if self.loop.is_closed():
+            return
+
+        _logger.debug("Closing the background event loop.")
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+        self.loop.close()
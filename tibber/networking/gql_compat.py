@@ -0,0 +1,28 @@
+"""Executing parsed documents on the sessions of both gql 3 and gql 4.
+
+gql 4 sessions take a GraphQLRequest holding the document and its variables, while gql 3
+sessions take the document and the variables as separate arguments.
+"""
+
+import gql
+from graphql import DocumentNode
+
+GQL_REQUESTS = int(gql.__version__.split(".")[0]) >= 4
+
+
+def execute(session, document: DocumentNode, variable_values: dict = None):
+    """Returns the awaitable result of executing a document on a gql session."""
+    if GQL_REQUESTS:
+        return session.execute(
+            gql.GraphQLRequest(document, variable_values=variable_values)
+        )
+    return session.execute(document, variable_values=variable_values)
+
+
+def subscribe(session, document: DocumentNode, variable_values: dict = None):
+    """Returns the async generator of a subscription to a document on a gql session."""
+    if GQL_REQUESTS:
+        return session.subscribe(
+            gql.GraphQLRequest(document, variable_values=variable_values)
+        )
+    return session.subscribe(document, variable_values=variable_values)
@@ -1,7 +1,101 @@
 """A class for generating GraphQL queries to send to the Tibber API"""
 
+import functools
+from typing import Iterable, Optional, Union
+
 
 class QueryBuilder:
+    # Named sets of field paths that can be refreshed instead of all data. The paths are
+    # dot separated GraphQL field names relative to the `Viewer` type.
+    REFRESH_PROFILES = {
+        "identity": ("login", "userId", "name", "accountType", "homes.owner"),
+        "homes": (
+            "homes.timeZone",
+            "homes.appNickname",
+            "homes.appAvatar",
+            "homes.size",
+            "homes.type",
+            "homes.numberOfResidents",
+            "homes.primaryHeatingSource",
+            "homes.hasVentilationSystem",
+            "homes.mainFuseSize",
+            "homes.address",
+            "homes.meteringPointData",
+        ),
+        "features": ("homes.features",),
+        "prices": ("homes.currentSubscription.priceInfo",),
+        "price_rating": ("homes.currentSubscription.priceRating",),
+        "subscriptions": ("homes.currentSubscription", "homes.subscriptions"),
+        "live": ("websocketSubscriptionUrl", "homes.features"),
+    }
+
+    # The fields of the `LiveMeasurement` type, in the order they are requested.
+    LIVE_MEASUREMENT_FIELDS = (
+        "timestamp",
+        "power",
+        "lastMeterConsumption",
+        "accumulatedConsumption",
+        "accumulatedProduction",
+        "accumulatedConsumptionLastHour",
+        "accumulatedProductionLastHour",
+        "accumulatedCost",
+        "accumulatedReward",
+        "currency",
+        "minPower",
+        "averagePower",
+        "maxPower",
+        "powerProduction",
+        "powerReactive",
+        "powerProductionReactive",
+        "minPowerProduction",
+        "maxPowerProduction",
+        "lastMeterProduction",
+        "powerFactor",
+        "voltagePhase1",
+        "voltagePhase2",
+        "voltagePhase3",
+        "currentL1",
+        "currentL2",
+        "currentL3",
+        "signalStrength",
+    )
+
+    # Named sets of live measurement fields for smaller subscriptions. The timestamp is always
+    # included. Profile names must not be field names.
+    LIVE_MEASUREMENT_PROFILES = {
+        "power_only": ("power", "powerProduction"),
+        "power_statistics": (
+            "power",
+            "minPower",
+            "averagePower",
+            "maxPower",
+            "powerProduction",
+            "minPowerProduction",
+            "maxPowerProduction",
+        ),
+        "energy": (
+            "lastMeterConsumption",
+            "lastMeterProduction",
+            "accumulatedConsumption",
+            "accumulatedProduction",
+            "accumulatedConsumptionLastHour",
+            "accumulatedProductionLastHour",
+            "accumulatedCost",
+            "accumulatedReward",
+            "currency",
+        ),
+        "phases": (
+            "voltagePhase1",
+            "voltagePhase2",
+            "voltagePhase3",
+            "currentL1",
+            "currentL2",
+            "currentL3",
+            "powerFactor",
+        ),
+        "all": LIVE_MEASUREMENT_FIELDS,
+    }
+
     @classmethod
     def create_query_from_dict(
         cls, query_dict: dict, indentation: int = 0, last: bool = True
@@ -12,22 +106,26 @@ class QueryBuilder:
         :param indentation: The amount of spaces to indent the returned query.
         :param last: Specifies if the function call is the last in a recursive loop.
         """
-        string_query = "{\n"
+        lines = ["{\n"]
+        cls._append_query_lines(lines, query_dict, indentation)
+
+        if last:
+            lines.append("}")
 
+        return "".join(lines)
+
+    @classmethod
+    def _append_query_lines(cls, lines: list, query_dict: dict, indentation: int):
+        """Appends the lines of a query dict (without the opening brace) to a list of lines.
+        The lines are joined once at the end to keep building the query linear in its size.
+        """
         for key, value in query_dict.items():
             if isinstance(value, dict):
-                string_query += " " * (indentation + 2) + key + " "
-                string_query += cls.create_query_from_dict(
-                    value, indentation + 2, False
-                )
-                string_query += " " * (indentation + 2) + "}\n"
+                lines.append(" " * (indentation + 2) + key + " {\n")
+                cls._append_query_lines(lines, value, indentation + 2)
+                lines.append(" " * (indentation + 2) + "}\n")
             else:
-                string_query += " " * (indentation + 2) + key + "\n"
-
-        if last:
-            string_query += "}"
-
-        return string_query
+                lines.append(" " * (indentation + 2) + key + "\n")
 
     @classmethod
     def create_query(cls, *args):
@@ -52,6 +150,32 @@ class QueryBuilder:
 
         return QueryBuilder.create_query_from_dict(nest_dict(*args))
 
+    @classmethod
+    def create_operation(cls, operation: str, name: str, variables: dict, *args):
+        """Creates a named GraphQL operation with typed variables. The remaining arguments
+        are passed on to create_query.
+
+        Example:
+            create_operation("query", "HomeName", {"homeId": "ID!"}, "viewer", "home(id: $homeId)", {"appNickname": ""})
+
+            This returns the query `query HomeName($homeId: ID!) { viewer { home(id: $homeId) { appNickname } } }`.
+
+        :param operation: The operation type. Either "query", "mutation" or "subscription".
+        :param name: The name of the operation.
+        :param variables: A dict with variable names as keys and their GraphQL types as values.
+        """
+        variable_definitions = ", ".join(
+            f"${variable}: {graphql_type}"
+            for variable, graphql_type in variables.items()
+        )
+        return f"{operation} {name}({variable_definitions}) " + cls.create_query(*args)
+
+    @classmethod
+    def variables(cls, **kwargs) -> dict:
+        """Returns the variable values to send with an operation. Variables set to None are left out,
+        which makes the API treat the corresponding arguments as not given."""
+        return {key: value for key, value in kwargs.items() if value is not None}
+
     @classmethod
     def combine_dicts(cls, dict1: dict, dict2: dict) -> dict:
         """Combines two nested dictionaries. The values from second dictionary overwrites the first one
@@ -59,7 +183,8 @@ class QueryBuilder:
         is a dict, while the second dictionary value is a string. Then the dictionary with a dictionary
         typed value is prioritized.
 
-        This method is meant to be used to combine query building components in dictionary form.
+        This method is meant to be used to combine query building components in dictionary form. Neither
+        of the dicts is modified. To merge API responses into a cache, use CacheMerger instead.
 
         :param dict1: The first dict to combine with the second dict
         :param dict2: The second dict to combine with the first dict
@@ -68,7 +193,7 @@ class QueryBuilder:
         if not (isinstance(dict1, dict) and isinstance(dict2, dict)):
             raise TypeError(f"Cannot combine types {type(dict1)} and {type(dict2)}.")
 
-        result_dict = dict1
+        result_dict = dict(dict1)
 
         for key, value in dict2.items():
             # The key in the second dict does not exist in the first so it's safe to add it
@@ -83,7 +208,7 @@ class QueryBuilder:
 
             # We know the key already exists in both dicts now. If the values in dict1 and dict 2
             # are also dicts, we need to call the function again on these dicts to resolve "merge conflicts"
-            elif isinstance(value, dict):
+            elif isinstance(value, dict) and isinstance(dict1[key], dict):
                 result_dict[key] = cls.combine_dicts(dict1[key], dict2[key])
 
             # We know the key exists in both dicts. If the value in dict1 is a dictionary, but
@@ -98,10 +223,136 @@ class QueryBuilder:
 
         return result_dict
 
+    # The complete queries below are built once and then returned from a cache. They are
+    # immutable strings, so it is safe to share them between all accounts and homes.
+
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def query_all_data(cls) -> str:
         return cls.create_query_from_dict(QueryBuilder.query())
 
+    @classmethod
+    def query_data(cls, fields: Optional[Union[str, Iterable[str]]] = None) -> str:
+        """Returns a query for the given fields of the `Viewer` type. Fields not included are not
+        requested from the API at all.
+
+        Example:
+            query_data("prices")
+            query_data(["name", "homes.features"])
+
+        :param fields: The name of a refresh profile (see QueryBuilder.REFRESH_PROFILES), or a list of
+            profile names and dot separated field paths relative to the viewer. None queries all data.
+        :throws ValueError: If a profile or field path is unknown.
+        """
+        if fields is None:
+            return cls.query_all_data()
+        return cls.query_field_paths(cls.resolve_field_paths(fields))
+
+    @classmethod
+    def resolve_field_paths(cls, fields: Union[str, Iterable[str]]) -> tuple:
+        """Expands refresh profile names to their field paths.
+
+        :param fields: A refresh profile name or a list of profile names and field paths.
+        :throws ValueError: If a single string is given which is not a refresh profile.
+        """
+        if isinstance(fields, str):
+            if fields not in cls.REFRESH_PROFILES:
+                raise ValueError(
+                    f'Unknown refresh profile "{fields}". Choose one of: {", ".join(cls.REFRESH_PROFILES)}'
+                )
+            return cls.REFRESH_PROFILES[fields]
+
+        paths = []
+        for field in fields:
+            paths.extend(cls.REFRESH_PROFILES.get(field, (field,)))
+        return tuple(dict.fromkeys(paths))
+
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def query_field_paths(cls, paths: tuple) -> str:
+        """Returns a query for a tuple of dot separated field paths relative to the `Viewer` type.
+        The `id` of every object on the way is included, so the result can be merged into the cache.
+
+        :param paths: The field paths to query.
+        :throws ValueError: If no field paths are given or a field path does not exist.
+        """
+        if not paths:
+            raise ValueError("At least one field must be queried.")
+        return cls.create_query_from_dict(
+            {"viewer": cls.select_field_paths(cls.viewer(), paths)}
+        )
+
+    @classmethod
+    def resolve_home_field_paths(cls, fields: Union[str, Iterable[str]]) -> tuple:
+        """Resolves refresh profiles and field paths to paths relative to the `Home` type. Profile
+        paths outside of the viewer's homes are left out.
+
+        :param fields: A refresh profile name or a list of profile names and field paths relative
+            to the `Home` type.
+        :throws ValueError: If a single string is given which is not a refresh profile.
+        """
+        if isinstance(fields, str):
+            profile_paths = cls.resolve_field_paths(fields)
+        else:
+            profile_paths = []
+            for field in fields:
+                profile_paths.extend(
+                    cls.REFRESH_PROFILES.get(field, ("homes." + field,))
+                )
+
+        return tuple(
+            dict.fromkeys(
+                path.split(".", 1)[1]
+                for path in profile_paths
+                if path.startswith("homes.")
+            )
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def home_query(cls, paths: Optional[tuple] = None) -> str:
+        """Returns a query for a single home. Variables: homeId.
+
+        :param paths: Dot separated field paths relative to the `Home` type. None queries all data of the home.
+        :throws ValueError: If an empty tuple of paths is given or a field path does not exist.
+        """
+        if paths is not None and not paths:
+            raise ValueError("At least one field of the home must be queried.")
+        home = (
+            cls.home() if paths is None else cls.select_field_paths(cls.home(), paths)
+        )
+        return cls.create_operation(
+            "query", "Home", {"homeId": "ID!"}, "viewer", "home(id: $homeId)", home
+        )
+
+    @classmethod
+    def select_field_paths(cls, query_dict: dict, paths: Iterable[str]) -> dict:
+        """Returns the part of a query dict selected by dot separated field paths. The `id` of every
+        object on the way is included, so the result can be merged into the cache.
+
+        :param query_dict: The query dict to select from, e.g. QueryBuilder.viewer().
+        :param paths: The field paths to select.
+        :throws ValueError: If a field path does not exist.
+        """
+        selected = {}
+
+        for path in paths:
+            source, target = query_dict, selected
+            keys = path.split(".")
+            for index, key in enumerate(keys):
+                if not isinstance(source, dict) or key not in source:
+                    raise ValueError(f'Unknown field path "{path}".')
+                if "id" in source:
+                    target["id"] = source["id"]
+
+                if index == len(keys) - 1:
+                    target[key] = source[key]
+                else:
+                    target = target.setdefault(key, {})
+                source = source[key]
+
+        return selected
+
     # -------------------------------------------------------------------
     # Query dicts for the Tibber API types. Remember that values ignored.
     # -------------------------------------------------------------------
@@ -274,60 +525,179 @@ class QueryBuilder:
             "level": "",
         }
 
-    # Queries with arguments. Note that these are different than queries in the way that
-    # these components need to return the key for the query as well as all it's properties
-    # not just the queries. This means that these should be unpacked when combined with
-    # other queries, not added as a value of a key.
+    # Operations with arguments. These are static documents which take all arguments as typed
+    # variables, so the same document can be parsed once and reused for every home and page.
+    # Use QueryBuilder.variables to build the variable values to send with them.
+
+    CONNECTION_ARGUMENTS = "first: $first, last: $last, before: $before, after: $after"
+    CONNECTION_VARIABLES = {
+        "first": "Int",
+        "last": "Int",
+        "before": "String",
+        "after": "String",
+    }
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def range_query(cls) -> str:
+        """Return the price range query for the current subscription of all homes.
+        Variables: resolution, first, last, before and after."""
+        return cls.create_operation(
+            "query",
+            "PriceRange",
+            {"resolution": "PriceResolution!", **cls.CONNECTION_VARIABLES},
+            "viewer",
+            "homes",
+            cls.subscription_price_range(),
+        )
 
     @classmethod
-    def single_home(home_id: str) -> dict:
-        return {f"home({home_id})": QueryBuilder.home()}
+    @functools.lru_cache(maxsize=None)
+    def home_range_query(cls) -> str:
+        """Return the price range query for the current subscription of a single home.
+        Variables: homeId, resolution, first, last, before and after."""
+        return cls.create_operation(
+            "query",
+            "HomePriceRange",
+            {
+                "homeId": "ID!",
+                "resolution": "PriceResolution!",
+                **cls.CONNECTION_VARIABLES,
+            },
+            "viewer",
+            "home(id: $homeId)",
+            cls.subscription_price_range(),
+        )
 
     @classmethod
-    def range_query(
-        cls, resolution: str, first: int, last: int, before: str, after: str
-    ):
-        first_arg = f"first: {first}" if first else None
-        last_arg = f"last: {last}" if last else None
-        before_arg = f'before: "{before}"' if before else None
-        after_arg = f'after: "{after}"' if after else None
+    @functools.lru_cache(maxsize=None)
+    def homes_range_query(cls, count: int) -> str:
+        """Return the price range query for the current subscription of several homes at once.
+        The homes are aliased h0, h1, ... in the response. Variables: h0, h1, ... (the home ids),
+        resolution, first, last, before and after.
 
-        args = ", ".join(
-            [
-                arg
-                for arg in [first_arg, last_arg, before_arg, after_arg]
-                if arg is not None
-            ]
+        :param count: The number of homes to query.
+        """
+        return cls.create_operation(
+            "query",
+            "HomesPriceRange",
+            {
+                **cls.home_aliases(count),
+                "resolution": "PriceResolution!",
+                **cls.CONNECTION_VARIABLES,
+            },
+            "viewer",
+            {
+                f"{alias}: home(id: ${alias})": cls.subscription_price_range()
+                for alias in cls.home_aliases(count)
+            },
         )
+
+    @classmethod
+    def home_aliases(cls, count: int) -> dict:
+        """Return the aliases (and variable names) of the homes in an aliased multi-home query,
+        mapped to the GraphQL type of their id variables."""
+        if count < 1:
+            raise ValueError("At least one home must be queried.")
+        return {f"h{index}": "ID!" for index in range(count)}
+
+    @classmethod
+    def subscription_price_range(cls) -> dict:
+        """Return the selection of the price range of the current subscription of a home.
+        Uses the variables resolution, first, last, before and after."""
         return {
-            f"range(resolution: {resolution}, {args})": {
-                "pageInfo": QueryBuilder.subscription_price_connection_page_info(),
-                "edges": QueryBuilder.subscription_price_edge(),
-                "nodes": QueryBuilder.price(),
+            "currentSubscription": {
+                "priceInfo": {
+                    f"range(resolution: $resolution, {cls.CONNECTION_ARGUMENTS})": {
+                        "pageInfo": QueryBuilder.subscription_price_connection_page_info(),
+                        "edges": QueryBuilder.subscription_price_edge(),
+                        "nodes": QueryBuilder.price(),
+                    }
+                }
             }
         }
 
     @classmethod
-    def consumption_query(
-        cls,
-        resolution: str,
-        first: int = None,
-        last: int = None,
-        before: str = None,
-        after: str = None,
-        filter_empty_nodes: bool = False,
-    ):
-        # TODO: I feel like this can be improved...
-        first_arg = f"first: {first}" if first else ""
-        last_arg = f"last: {last}" if last else ""
-        before_arg = f'before: "{before}"' if before else ""
-        after_arg = f'after: "{after}"' if after else ""
-
-        args = ", ".join(
-            [arg for arg in [first_arg, last_arg, before_arg, after_arg] if arg]
+    @functools.lru_cache(maxsize=None)
+    def consumption_query(cls) -> str:
+        """Return the query for a page of the consumption of a home.
+        Variables: homeId, resolution, first, last, before, after and filterEmptyNodes.
+        """
+        return cls.create_operation(
+            "query",
+            "HomeConsumption",
+            {"homeId": "ID!", **cls.HISTORY_VARIABLES},
+            "viewer",
+            "home(id: $homeId)",
+            cls.home_consumption_connection(),
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def homes_consumption_query(cls, count: int) -> str:
+        """Return the query for a page of the consumption of several homes at once. The homes are
+        aliased h0, h1, ... in the response. Variables: h0, h1, ... (the home ids), resolution,
+        first, last, before, after and filterEmptyNodes.
+
+        :param count: The number of homes to query.
+        """
+        return cls.create_operation(
+            "query",
+            "HomesConsumption",
+            {**cls.home_aliases(count), **cls.HISTORY_VARIABLES},
+            "viewer",
+            {
+                f"{alias}: home(id: ${alias})": cls.home_consumption_connection()
+                for alias in cls.home_aliases(count)
+            },
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def production_query(cls) -> str:
+        """Return the query for a page of the production of a home.
+        Variables: homeId, resolution, first, last, before, after and filterEmptyNodes.
+        """
+        return cls.create_operation(
+            "query",
+            "HomeProduction",
+            {"homeId": "ID!", **cls.HISTORY_VARIABLES},
+            "viewer",
+            "home(id: $homeId)",
+            cls.home_production_connection(),
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def homes_production_query(cls, count: int) -> str:
+        """Return the query for a page of the production of several homes at once. Takes the
+        same variables as homes_consumption_query.
+
+        :param count: The number of homes to query.
+        """
+        return cls.create_operation(
+            "query",
+            "HomesProduction",
+            {**cls.home_aliases(count), **cls.HISTORY_VARIABLES},
+            "viewer",
+            {
+                f"{alias}: home(id: ${alias})": cls.home_production_connection()
+                for alias in cls.home_aliases(count)
+            },
         )
+
+    HISTORY_VARIABLES = {
+        "resolution": "EnergyResolution!",
+        **CONNECTION_VARIABLES,
+        "filterEmptyNodes": "Boolean",
+    }
+
+    @classmethod
+    def home_consumption_connection(cls) -> dict:
+        """Return the selection of a page of the consumption of a home. Uses the variables
+        resolution, first, last, before, after and filterEmptyNodes."""
         return {
-            f"consumption(resolution: {resolution}, {args}, filterEmptyNodes: {str(filter_empty_nodes).lower()})": {
+            f"consumption(resolution: $resolution, {cls.CONNECTION_ARGUMENTS}, filterEmptyNodes: $filterEmptyNodes)": {
                 "pageInfo": QueryBuilder.home_consumption_page_info(),
                 "nodes": QueryBuilder.consumption(),
                 "edges": QueryBuilder.home_consumption_edge(),
@@ -335,25 +705,11 @@ class QueryBuilder:
         }
 
     @classmethod
-    def production_query(
-        cls,
-        resolution: str,
-        first: int = None,
-        last: int = None,
-        before: str = None,
-        after: str = None,
-        filter_empty_nodes: bool = False,
-    ):
-        first_arg = f"first: {first}" if first else ""
-        last_arg = f"last: {last}" if last else ""
-        before_arg = f'before: "{before}"' if before else ""
-        after_arg = f'after: "{after}"' if after else ""
-
-        args = ", ".join(
-            [arg for arg in [first_arg, last_arg, before_arg, after_arg] if arg]
-        )
+    def home_production_connection(cls) -> dict:
+        """Return the selection of a page of the production of a home. Uses the same variables
+        as home_consumption_connection."""
         return {
-            f"production(resolution: {resolution}, {args}, filterEmptyNodes: {str(filter_empty_nodes).lower()})": {
+            f"production(resolution: $resolution, {cls.CONNECTION_ARGUMENTS}, filterEmptyNodes: $filterEmptyNodes)": {
                 "pageInfo": QueryBuilder.home_production_page_info(),
                 "nodes": QueryBuilder.production(),
                 "edges": QueryBuilder.home_production_edge(),
@@ -446,53 +802,79 @@ class QueryBuilder:
             "node": QueryBuilder.price(),
         }
 
-    # Live data - This WILL be rewritten together with this whole class.
-    # TODO: Rewrite the whole class from a dict-based approach to a string-based approach.
-    @classmethod
-    def live_measurement(cls, home_id):
-        return f"""subscription {{
-            liveMeasurement(homeId: "{home_id}") {{
-                timestamp
-                power
-                lastMeterConsumption
-                accumulatedConsumption
-                accumulatedProduction
-                accumulatedConsumptionLastHour
-                accumulatedProductionLastHour
-                accumulatedCost
-                accumulatedReward
-                currency
-                minPower
-                averagePower
-                maxPower
-                powerProduction
-                powerReactive
-                powerProductionReactive
-                minPowerProduction
-                maxPowerProduction
-                lastMeterProduction
-                powerFactor
-                voltagePhase1
-                voltagePhase2
-                voltagePhase3
-                currentL1
-                currentL2
-                currentL3
-                signalStrength
-            }}
-        }}"""
-
-    @classmethod
-    def send_push_notification(
-        cls, title: str, message: str, screen_to_open: str = None
-    ):
-        return f"""mutation {{
-            sendPushNotification(input: {{
-                title: "{title}",
-                message: "{message}",
-                {'screenToOpen: ' + screen_to_open if screen_to_open else ""}
-            }}) {{
+    @classmethod
+    def live_measurement(
+        cls, fields: Optional[Union[str, Iterable[str]]] = None
+    ) -> str:
+        """Return the live measurement subscription. Variables: homeId.
+
+        Example:
+            live_measurement("power_only")
+            live_measurement(["power", "phases"])
+
+        :param fields: The name of a live measurement profile (see
+            QueryBuilder.LIVE_MEASUREMENT_PROFILES), or a list of profile names and `LiveMeasurement`
+            fields. None subscribes to all fields.
+        :throws ValueError: If a profile or field is unknown.
+        """
+        return cls.live_measurement_fields_query(
+            cls.resolve_live_measurement_fields(fields)
+        )
+
+    @classmethod
+    def resolve_live_measurement_fields(
+        cls, fields: Optional[Union[str, Iterable[str]]] = None
+    ) -> tuple:
+        """Expands live measurement profile names to their fields. The timestamp is always
+        included, and the fields are returned in the order of LIVE_MEASUREMENT_FIELDS, so equal
+        selections share one subscription document.
+
+        :param fields: A profile name, a list of profile names and fields, or None for all fields.
+        :throws ValueError: If a profile or field is unknown.
+        """
+        if fields is None:
+            return cls.LIVE_MEASUREMENT_FIELDS
+        if isinstance(fields, str):
+            if fields not in cls.LIVE_MEASUREMENT_PROFILES:
+                raise ValueError(
+                    f'Unknown live measurement profile "{fields}". Choose one of: {", ".join(cls.LIVE_MEASUREMENT_PROFILES)}'
+                )
+            fields = [fields]
+
+        selected = {"timestamp"}
+        for field in fields:
+            if field in cls.LIVE_MEASUREMENT_PROFILES:
+                selected.update(cls.LIVE_MEASUREMENT_PROFILES[field])
+            elif field in cls.LIVE_MEASUREMENT_FIELDS:
+                selected.add(field)
+            else:
+                raise ValueError(
+                    f'Unknown live measurement field or profile "{field}".'
+                )
+        return tuple(
+            field for field in cls.LIVE_MEASUREMENT_FIELDS if field in selected
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def live_measurement_fields_query(cls, fields: tuple) -> str:
+        """Return the live measurement subscription for a tuple of `LiveMeasurement` fields.
+        Variables: homeId."""
+        return cls.create_operation(
+            "subscription",
+            "LiveMeasurement",
+            {"homeId": "ID!"},
+            "liveMeasurement(homeId: $homeId)",
+            dict.fromkeys(fields, ""),
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def send_push_notification(cls) -> str:
+        """Return the push notification mutation. Variables: input (a PushNotificationInput)."""
+        return """mutation SendPushNotification($input: PushNotificationInput!) {
+            sendPushNotification(input: $input) {
                 successful
                 pushedToNumberOfDevices
-            }}
-        }}"""
+            }
+        }"""
@@ -1,5 +1,9 @@
 import asyncio
+import copy
+import functools
+import json
 import logging
+from typing import Optional
 
 import asyncio_atexit
 import backoff
@@ -7,67 +11,230 @@ import gql
 import websockets
 from gql.transport.aiohttp import AIOHTTPTransport
 from gql.transport.exceptions import TransportQueryError
+from graphql import GraphQLError, OperationDefinitionNode, OperationType, parse
+from graphql.language import print_ast
 
 from tibber import API_ENDPOINT
 from tibber.exceptions import APIException, UnauthenticatedException
+from tibber.networking import gql_compat
+from tibber.networking.document_cache import document_cache
+from tibber.networking.event_loop import BackgroundEventLoop
+from tibber.networking.rate_limiter import RateLimiter
+from tibber.networking.schema import set_schema
 
 _logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=128)
+def _normalized_query(query: str) -> Optional[str]:
+    """Returns the query printed from its syntax tree, so differently formatted copies of a query
+    are equal while the string literals in it are kept as they are. Returns None if the document
+    cannot be parsed or has operations other than queries. The document is only parsed, not
+    validated, since validation must wait until the schema is loaded."""
+    try:
+        document = parse(query, no_location=True)
+    except GraphQLError:
+        return None
+    if not all(
+        definition.operation is OperationType.QUERY
+        for definition in document.definitions
+        if isinstance(definition, OperationDefinitionNode)
+    ):
+        return None
+    return print_ast(document)
+
+
+class _Flight:
+    """An execution of a query that is shared by identical concurrent executions."""
+
+    __slots__ = ("execution", "callers")
+
+    def __init__(self, execution: asyncio.Future):
+        self.execution = execution
+        self.callers = 1
+
+
 class QueryExecutor:
-    """A class for executing queries."""
+    """A class for executing queries.
+
+    The gql session is connected lazily on the first query. By default it is created on, and
+    bound to, a long-lived event loop running in a background thread. Synchronous calls are
+    submitted to that loop, so the connection pool is reused between calls instead of being torn
+    down together with a fresh loop for every query. Subclasses which set `use_background_loop`
+    to False bind the session to the loop of the caller that runs the first query instead.
+    """
+
+    use_background_loop: bool = True
+    # Whether concurrent executions of the same query (with the same variables and token) share
+    # a single request. Mutations are never shared.
+    coalesce_requests: bool = True
+    # An optional client-side rate limit for the requests sent by the executor. The same limiter
+    # can be shared by several accounts to limit their requests together.
+    rate_limiter: Optional[RateLimiter] = None
 
-    def __init__(self, session=None):
+    def __init__(self, session=None, refresh_schema: bool = False):
         self.gql_client = None
+        self._event_loop = (
+            BackgroundEventLoop.shared() if self.use_background_loop else None
+        )
+        self._session_loop = None
+        self._connect_lock = None
+        # The shared executions of the queries that are in flight (_Flight), by single flight key.
+        self._in_flight: dict = {}
         transport = AIOHTTPTransport(
             url=API_ENDPOINT,
             headers={"Authorization": "Bearer " + self.token},
         )
+        # Unless a refresh is requested, no introspection query is sent. The documents are
+        # validated against the shared schema once by the document cache instead of
+        # by the gql client on every execution.
+        self._refresh_schema = refresh_schema
         self.gql_client = gql.Client(
-            transport=transport, fetch_schema_from_transport=True
+            transport=transport, fetch_schema_from_transport=refresh_schema
         )
+        self.document_cache = document_cache
+        self.session = session
+
+    async def connect_async(self):
+        """Connects the gql session if it is not connected yet. This is done automatically
+        before the first query is executed."""
+        if self.session is not None:
+            return
 
-        asyncio.run(self.__ainit__(session))
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
 
-    async def __ainit__(self, session):
-        self.session = session or await self.gql_client.connect_async()
-        asyncio_atexit.register(self.gql_client.close_async)
+        async with self._connect_lock:
+            if self.session is not None:
+                return
+
+            _logger.debug("Connecting the gql session.")
+            self.session = await self.gql_client.connect_async()
+            self._session_loop = asyncio.get_running_loop()
+            asyncio_atexit.register(self.gql_client.close_async)
+
+            if self._refresh_schema:
+                set_schema(self.gql_client.schema)
+
+    async def close_async(self):
+        """Closes the gql session. A new session is connected if another query is executed."""
+        if self.session is None:
+            return
+
+        await self.gql_client.close_async()
+        asyncio_atexit.unregister(self.gql_client.close_async, loop=self._session_loop)
+        self.session = None
+        self._session_loop = None
 
     def execute_query(
-        self, access_token: str, query: str, max_tries: int = 1, **kwargs
+        self,
+        access_token: str,
+        query: str,
+        max_tries: int = 1,
+        variable_values: dict = None,
+        **kwargs,
     ):
         """Executes a GraphQL query to the Tibber API.
 
         :param access_token: The Tibber API token to use for the request.
         :param query: The query to send to the Tibber API.
         :param max_tries: The amount of attempts before giving up. Set to None for infinite tries.
+        :param variable_values: The values of the variables declared by the query.
         :param **kwargs: Arguments to be passed in to the backoff.on_exception decorator
+        :throws RuntimeError: If the executor does not use the background loop.
         """
-        # To allow invocations from async contexts, check if a loop is running and attempt
-        # to schedule the execute_async method there. If no loop is found or the loop is not
-        # running, asyncio.run can be run instead.
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
-
-        if loop and loop.is_running():
-            return loop.run_until_complete(
-                self.execute_async(access_token, query, max_tries, **kwargs)
+        return self.run_blocking(
+            self.execute_async(
+                access_token, query, max_tries, variable_values, **kwargs
             )
+        )
+
+    def run_blocking(self, coroutine):
+        """Runs a coroutine on the background loop and waits for its result.
 
-        return asyncio.run(self.execute_async(access_token, query, max_tries, **kwargs))
+        The coroutine is always run on the background loop, which also makes it possible to
+        call this method from a thread that is already running an event loop.
+
+        :param coroutine: The coroutine to run.
+        :throws RuntimeError: If the executor does not use the background loop.
+        """
+        if self._event_loop is None:
+            coroutine.close()
+            raise RuntimeError(
+                f"{type(self).__name__} does not support blocking calls. Await the async variant of the method instead."
+            )
+        return self._event_loop.run(coroutine)
 
     async def execute_async(
-        self, access_token: str, query: str, max_tries: int = 1, **kwargs
+        self,
+        access_token: str,
+        query: str,
+        max_tries: int = 1,
+        variable_values: dict = None,
+        **kwargs,
     ):
         """Coroutine for executing a GraphQL query to the Tibber API asynchronously.
 
+        Concurrent executions of the same query with the same variables and token share a single
+        request. Each of them receives its own copy of the result. Set `coalesce_requests` to
+        False to send a request for every execution.
+
         :param access_token: The Tibber API token to use for the request.
         :param query: The query to send to the Tibber API.
         :param max_tries: The amount of attempts before giving up. Set to None for infinite tries.
+        :param variable_values: The values of the variables declared by the query.
         :param **kwargs: Arguments to be passed in to the backoff.on_exception decorator
         """
+        # The session belongs to a single loop. Coroutines awaited from any other
+        # loop are handed over to it and the result is awaited from the calling loop.
+        owner_loop = self._owner_loop
+        if owner_loop is not None and asyncio.get_running_loop() is not owner_loop:
+            return await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(
+                    self.execute_async(
+                        access_token, query, max_tries, variable_values, **kwargs
+                    ),
+                    owner_loop,
+                )
+            )
+
+        key = self._single_flight_key(access_token, query, variable_values)
+        if key is None:
+            return await self._execute_with_backoff(
+                access_token, query, max_tries, variable_values, **kwargs
+            )
+
+        flight = self._in_flight.get(key)
+        if flight is None:
+            execution = asyncio.ensure_future(
+                self._execute_with_backoff(
+                    access_token, query, max_tries, variable_values, **kwargs
+                )
+            )
+            flight = self._in_flight[key] = _Flight(execution)
+            execution.add_done_callback(
+                lambda execution: self._finish_flight(key, execution)
+            )
+        else:
+            flight.callers += 1
+            _logger.debug("Sharing the result of an identical query that is in flight.")
+
+        # A caller that is cancelled must not cancel the request for the other callers.
+        result = await asyncio.shield(flight.execution)
+        # The results are merged into the caches of the callers, so a shared result is copied
+        # for each of them.
+        return copy.deepcopy(result) if flight.callers > 1 else result
+
+    async def _execute_with_backoff(
+        self,
+        access_token: str,
+        query: str,
+        max_tries: int = 1,
+        variable_values: dict = None,
+        **kwargs,
+    ):
+        await self.connect_async()
+
         backoff_execution = backoff.on_exception(
             backoff.expo,
             [
@@ -83,12 +250,42 @@ class QueryExecutor:
             **kwargs,
         )(self.execute_async_single)
 
-        result = await backoff_execution(access_token, query)
-        return result
+        return await backoff_execution(access_token, query, variable_values)
+
+    def _finish_flight(self, key: tuple, execution: asyncio.Future) -> None:
+        flight = self._in_flight.get(key)
+        if flight is not None and flight.execution is execution:
+            del self._in_flight[key]
+        # Mark the exception as retrieved, in case every caller was cancelled before it was raised.
+        if not execution.cancelled():
+            execution.exception()
+
+    def _single_flight_key(
+        self, access_token: str, query: str, variable_values: dict = None
+    ):
+        """Returns the key identifying identical executions of a query, or None if the execution
+        must not be shared with others."""
+        if not self.coalesce_requests:
+            return None
 
-    async def execute_async_single(self, access_token: str, query: str):
+        normalized_query = _normalized_query(query)
+        if normalized_query is None:
+            return None
+
+        return (
+            access_token,
+            normalized_query,
+            json.dumps(variable_values or {}, sort_keys=True, default=str),
+        )
+
+    async def execute_async_single(
+        self, access_token: str, query: str, variable_values: dict = None
+    ):
         try:
-            result = await self.gql_client.execute_async(gql.gql(query))
+            document = self.document_cache.get(query)
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(access_token)
+            result = await gql_compat.execute(self.session, document, variable_values)
         except TransportQueryError as e:
             for error in e.errors:
                 self._process_error(error)
@@ -100,6 +297,13 @@ class QueryExecutor:
             raise APIException("Timed out when executing query.")
         return result
 
+    @property
+    def _owner_loop(self):
+        """The event loop the gql session belongs to, or None if it is not decided yet."""
+        if self._event_loop is not None:
+            return self._event_loop.loop
+        return self._session_loop
+
     def _process_error(self, error):
         try:
             code = error["extensions"]["code"]
@@ -0,0 +1,278 @@
+"""A client-side rate limiter for the requests sent to the Tibber API."""
+
+import asyncio
+import bisect
+import contextlib
+import contextvars
+import itertools
+import logging
+import time
+from typing import Optional, Union
+
+_logger = logging.getLogger(__name__)
+
+# The priority levels of requests, from the most to the least urgent. Integers can be used as well.
+PRIORITIES = {"live": 0, "interactive": 10, "default": 20, "bulk": 30}
+
+_request_priority: contextvars.ContextVar = contextvars.ContextVar(
+    "tibber_request_priority", default=None
+)
+
+
+def resolve_priority(priority: Union[str, int, None]) -> int:
+    """Returns the numeric value of a priority. Lower values are more urgent.
+
+    :param priority: A name from PRIORITIES, an integer or None for the default priority.
+    :throws ValueError: If the priority name is unknown.
+    """
+    if priority is None:
+        return PRIORITIES["default"]
+    if isinstance(priority, int):
+        return priority
+    try:
+        return PRIORITIES[priority]
+    except KeyError:
+        raise ValueError(
+            f"Unknown priority {priority!r}. Use an integer or one of {', '.join(PRIORITIES)}."
+        ) from None
+
+
+def current_priority() -> int:
+    """Returns the priority of the requests sent from the current context."""
+    return resolve_priority(_request_priority.get())
+
+
+@contextlib.contextmanager
+def request_priority(priority: Union[str, int], override: bool = True):
+    """Sets the priority of the requests sent within the block, including from tasks that are
+    created within it.
+
+    Example:
+        with request_priority("bulk"):
+            await home.fetch_consumption_between_async("HOURLY", since, until)
+
+    :param priority: A name from PRIORITIES or an integer. Lower values are more urgent.
+    :param override: Whether to replace a priority that was already set by a surrounding block.
+    """
+    resolve_priority(priority)
+    if not override and _request_priority.get() is not None:
+        yield
+        return
+
+    reset_token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(reset_token)
+
+
+class TokenBucket:
+    """A token bucket that refills at a fixed rate up to its capacity."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        :param rate: The number of tokens added per second.
+        :param burst: The capacity of the bucket, i.e. the number of requests that can be sent at
+            once after a quiet period. Defaults to the rate (at least 1).
+        """
+        if rate <= 0:
+            raise ValueError("The rate must be greater than 0.")
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1, rate)
+        if self.capacity < 1:
+            raise ValueError("The burst must be at least 1.")
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+
+    def delay(self, now: float) -> float:
+        """Returns the number of seconds until a token is available."""
+        self._refill(now)
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self, now: float) -> None:
+        """Removes a token from the bucket."""
+        self._refill(now)
+        self.tokens -= 1
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class RateLimiter:
+    """Limits the rate of requests in total and per API token.
+
+    Requests that have to wait are queued by priority (see PRIORITIES), so live and interactive
+    requests are sent before queued bulk requests. Among requests of the same priority the oldest
+    one is sent first. A request that is held back only by the limit of its own token does not
+    hold back requests for other tokens.
+
+    The limiter must only be used from a single event loop. All accounts using the background
+    loop (the default for Account) can share one limiter.
+
+    Example:
+        account.rate_limiter = RateLimiter(rate=5, per_token_rate=2)
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        per_token_rate: Optional[float] = None,
+        per_token_burst: Optional[int] = None,
+    ):
+        """
+        :param rate: The maximum number of requests per second in total. None for no limit.
+        :param burst: The number of requests that can be sent at once in total. Defaults to the rate.
+        :param per_token_rate: The maximum number of requests per second for each API token.
+            None for no limit.
+        :param per_token_burst: The number of requests that can be sent at once for each API token.
+            Defaults to the per token rate.
+        """
+        self._global_bucket = TokenBucket(rate, burst) if rate is not None else None
+        self._per_token_rate = per_token_rate
+        self._per_token_burst = per_token_burst
+        if per_token_rate is not None:
+            # Validate the arguments now instead of on the first request.
+            TokenBucket(per_token_rate, per_token_burst)
+        self._token_buckets: dict = {}
+
+        # The waiting requests as (priority, sequence number, token, future), sorted.
+        self._waiters: list = []
+        self._sequence = itertools.count()
+        self._changed: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    async def acquire(
+        self, token: str, priority: Union[str, int, None] = None
+    ) -> float:
+        """Waits until a request may be sent.
+
+        :param token: The API token the request is sent with.
+        :param priority: The priority of the request. Defaults to the priority set with
+            request_priority(), or "default".
+        :return: The number of seconds the request waited.
+        """
+        priority = (
+            resolve_priority(priority) if priority is not None else current_priority()
+        )
+        started = time.monotonic()
+
+        if not self._waiters and self._delay(token, started) == 0:
+            self._take(token, started)
+            self._record_wait(0.0)
+            return 0.0
+
+        future = asyncio.get_running_loop().create_future()
+        bisect.insort(self._waiters, (priority, next(self._sequence), token, future))
+        self._wake_dispatcher()
+        try:
+            await future
+        except asyncio.CancelledError:
+            self._remove(future)
+            raise
+
+        waited = time.monotonic() - started
+        self._record_wait(waited)
+        if waited > 1:
+            _logger.debug(f"A request waited {waited:.1f} seconds for the rate limit.")
+        return waited
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of requests that are waiting."""
+        return len(self._waiters)
+
+    @property
+    def metrics(self) -> dict:
+        """The number of waiting requests (in total and by priority) and statistics about the
+        time requests had to wait."""
+        depth_by_priority = {}
+        for priority, *_ in self._waiters:
+            depth_by_priority[priority] = depth_by_priority.get(priority, 0) + 1
+        return {
+            "queue_depth": len(self._waiters),
+            "queue_depth_by_priority": depth_by_priority,
+            "acquired": self.acquired,
+            "total_wait": self.total_wait,
+            "mean_wait": self.total_wait / self.acquired if self.acquired else 0.0,
+            "max_wait": self.max_wait,
+        }
+
+    def _bucket(self, token: str) -> Optional[TokenBucket]:
+        if self._per_token_rate is None:
+            return None
+        bucket = self._token_buckets.get(token)
+        if bucket is None:
+            bucket = TokenBucket(self._per_token_rate, self._per_token_burst)
+            self._token_buckets[token] = bucket
+        return bucket
+
+    def _global_delay(self, now: float) -> float:
+        return self._global_bucket.delay(now) if self._global_bucket else 0.0
+
+    def _delay(self, token: str, now: float) -> float:
+        bucket = self._bucket(token)
+        return max(self._global_delay(now), bucket.delay(now) if bucket else 0.0)
+
+    def _take(self, token: str, now: float) -> None:
+        if self._global_bucket:
+            self._global_bucket.take(now)
+        bucket = self._bucket(token)
+        if bucket:
+            bucket.take(now)
+
+    def _record_wait(self, waited: float) -> None:
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+    def _remove(self, future: asyncio.Future) -> None:
+        self._waiters = [waiter for waiter in self._waiters if waiter[3] is not future]
+
+    def _wake_dispatcher(self) -> None:
+        if self._changed is None:
+            self._changed = asyncio.Event()
+        self._changed.set()
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.ensure_future(self._dispatch())
+
+    async def _dispatch(self) -> None:
+        """Releases the waiting requests in priority order as the buckets allow."""
+        while self._waiters:
+            self._changed.clear()
+            now = time.monotonic()
+            sleep = self._release_next(now)
+            if sleep is None:
+                continue
+            try:
+                await asyncio.wait_for(self._changed.wait(), sleep)
+            except asyncio.TimeoutError:
+                pass
+
+    def _release_next(self, now: float) -> Optional[float]:
+        """Releases the first waiter that may be sent. Returns None if a waiter was released,
+        otherwise the number of seconds until one may be sent."""
+        global_delay = self._global_delay(now)
+        if global_delay > 0:
+            return global_delay
+
+        sleep = None
+        for index, (_, _, token, future) in enumerate(self._waiters):
+            if future.done():
+                continue
+            bucket = self._bucket(token)
+            delay = bucket.delay(now) if bucket else 0.0
+            if delay == 0:
+                del self._waiters[index]
+                self._take(token, now)
+                future.set_result(None)
+                return None
+            sleep = delay if sleep is None else min(sleep, delay)
+
+        self._waiters = [waiter for waiter in self._waiters if not waiter[3].done()]
+        return sleep if sleep is not None else 0.0
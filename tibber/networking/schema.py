@@ -0,0 +1,49 @@
+"""The GraphQL schema of the Tibber API shared by all clients in the process.
+
+tibber.py ships a hand-maintained subset of the schema (tibber_schema.graphql) so clients do not
+need to send an introspection query to the API before their first request. It covers the queries
+tibber.py builds itself and is built once per process. To send queries that use other parts of the
+API, create an account with `refresh_schema=True`, which replaces it by the schema of the API.
+"""
+
+import functools
+import logging
+import threading
+from pathlib import Path
+from typing import Optional
+
+from graphql import GraphQLSchema, build_schema
+
+_logger = logging.getLogger(__name__)
+
+SCHEMA_SNAPSHOT_PATH = Path(__file__).parent / "tibber_schema.graphql"
+
+_server_schema: Optional[GraphQLSchema] = None
+_schema_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def load_schema_snapshot() -> GraphQLSchema:
+    """Builds the bundled schema. The result is cached, so the SDL is only parsed once."""
+    _logger.debug("Building the bundled Tibber schema.")
+    return build_schema(SCHEMA_SNAPSHOT_PATH.read_text(encoding="utf-8"))
+
+
+def get_schema() -> GraphQLSchema:
+    """Returns the schema to use for new clients. This is the schema fetched from the server if
+    it has been refreshed, otherwise the bundled schema."""
+    with _schema_lock:
+        if _server_schema is not None:
+            return _server_schema
+    return load_schema_snapshot()
+
+
+def set_schema(schema: GraphQLSchema) -> None:
+    """Replaces the shared schema, e.g. with a schema fetched from the server.
+
+    :param schema: The schema to use for all clients created from now on.
+    """
+    global _server_schema
+    with _schema_lock:
+        _server_schema = schema
+    _logger.info("The shared Tibber schema was replaced.")
@@ -0,0 +1,37 @@
+"""A property decorator for memoizing typed views over cached data."""
+
+
+class cached_view:
+    """A read-only property whose value is computed once and then reused until the data changes.
+
+    Use it for properties which wrap cached data in other tibber.py types. The value is computed again
+    when the cache version of the tibber client (which Account.update_cache increases whenever
+    the cache changes) differs from the version it was computed at, or when the object was bound
+    to another data dict. Lists returned by a cached view are shared and must not be modified.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        # The account itself has no tibber client, it is its own source of cache versions.
+        version = getattr(
+            getattr(instance, "tibber_client", instance), "cache_version", 0
+        )
+        views = instance.__dict__.setdefault("_cached_views", {})
+
+        cached = views.get(self.name)
+        if cached is not None and cached[0] == version and cached[1] is instance.cache:
+            return cached[2]
+
+        value = self.func(instance)
+        views[self.name] = (version, instance.cache, value)
+        return value
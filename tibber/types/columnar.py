@@ -0,0 +1,163 @@
+"""Functions for converting connection nodes into columns of NumPy arrays.
+
+NumPy (and pandas for dataframes) are optional dependencies. Install them with
+`pip install tibber.py[numpy]` or `pip install tibber.py[pandas]`.
+"""
+
+from datetime import datetime, timezone
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# The format of all timestamps returned by the Tibber API, e.g. 2023-02-06T01:00:00.000+01:00.
+# Timestamps in exactly this format are parsed with vectorized arithmetic on the characters.
+TIMESTAMP_LENGTH = 29
+_TIMESTAMP_TEMPLATE = "0000-00-00T00:00:00.000+00:00"
+_OFFSET_SIGN = 23
+_SEPARATORS = [
+    i for i, char in enumerate(_TIMESTAMP_TEMPLATE) if char != "0" and i != _OFFSET_SIGN
+]
+_DIGITS = [i for i, char in enumerate(_TIMESTAMP_TEMPLATE) if char == "0"]
+
+
+def require_numpy():
+    """Returns the numpy module.
+
+    :throws ImportError: If numpy is not installed.
+    """
+    if np is None:
+        raise ImportError(
+            "Converting to arrays requires numpy. Install it with `pip install tibber.py[numpy]`."
+        )
+    return np
+
+
+def require_pandas():
+    """Returns the pandas module.
+
+    :throws ImportError: If pandas is not installed.
+    """
+    try:
+        import pandas
+    except ImportError:
+        raise ImportError(
+            "Converting to dataframes requires pandas. Install it with `pip install tibber.py[pandas]`."
+        ) from None
+    return pandas
+
+
+def parse_timestamps(values: list) -> "np.ndarray":
+    """Parses ISO 8601 timestamps into a datetime64[ms] array of UTC times.
+
+    Timestamps in the format of the Tibber API are parsed all at once. If any value is in another
+    format (or None, which becomes NaT), every value is parsed separately instead.
+
+    :param values: The timestamps as strings.
+    """
+    np = require_numpy()
+    if not values:
+        return np.array([], dtype="datetime64[ms]")
+
+    strings = np.array(values)
+    if strings.dtype != np.dtype(f"U{TIMESTAMP_LENGTH}"):
+        # Some values are None, or not all of them have the length of the API format.
+        return _parse_timestamps_slow(values)
+    codes = strings.view(np.uint32).reshape(len(values), TIMESTAMP_LENGTH)
+
+    template = np.frombuffer(_TIMESTAMP_TEMPLATE.encode("utf-32-le"), dtype=np.uint32)
+    digits = codes[:, _DIGITS].astype(np.int64) - ord("0")
+    signs = codes[:, _OFFSET_SIGN]
+    if (
+        (codes[:, _SEPARATORS] != template[_SEPARATORS]).any()
+        or ((signs != ord("+")) & (signs != ord("-"))).any()
+        or ((digits < 0) | (digits > 9)).any()
+    ):
+        return _parse_timestamps_slow(values)
+
+    def number(*columns):
+        result = np.zeros(len(values), dtype=np.int64)
+        for column in columns:
+            result = result * 10 + digits[:, column]
+        return result
+
+    # Digit columns: YYYY MM DD hh mm ss fff oh om
+    year, month, day = number(0, 1, 2, 3), number(4, 5), number(6, 7)
+    hour, minute, second, millisecond = (
+        number(8, 9),
+        number(10, 11),
+        number(12, 13),
+        number(14, 15, 16),
+    )
+    offset = number(17, 18) * 60 + number(19, 20)
+    offset = np.where(signs == ord("-"), -offset, offset)
+
+    months = (year - 1970) * 12 + (month - 1)
+    dates = months.astype("datetime64[M]").astype("datetime64[D]") + (day - 1)
+    milliseconds = (((hour * 60 + minute - offset) * 60) + second) * 1000 + millisecond
+    return dates.astype("datetime64[ms]") + milliseconds.astype("timedelta64[ms]")
+
+
+def _parse_timestamps_slow(values: list) -> "np.ndarray":
+    np = require_numpy()
+    parsed = []
+    for value in values:
+        if value is None:
+            parsed.append(np.datetime64("NaT", "ms"))
+            continue
+        timestamp = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+        parsed.append(np.datetime64(timestamp, "ms"))
+    return np.array(parsed, dtype="datetime64[ms]")
+
+
+def nodes_to_arrays(nodes: list, time_fields: dict, float_fields: dict) -> dict:
+    """Converts connection nodes into a dict of aligned arrays.
+
+    :param nodes: The node dicts from the API response.
+    :param time_fields: The timestamp columns to create, mapped to their GraphQL field name.
+    :param float_fields: The float columns to create, mapped to their GraphQL field name. Missing
+        values become NaN.
+    :return: A dict with a datetime64[ms] array (UTC) for each time field and a float64 array for
+        each float field, all with one element per node.
+    """
+    np = require_numpy()
+    nodes = [node for node in nodes or [] if node is not None]
+    arrays = {
+        name: parse_timestamps([node.get(key) for node in nodes])
+        for name, key in time_fields.items()
+    }
+    arrays.update(
+        (name, np.array([node.get(key) for node in nodes], dtype=np.float64))
+        for name, key in float_fields.items()
+    )
+    return arrays
+
+
+def arrays_to_records(arrays: dict) -> "np.ndarray":
+    """Combines aligned arrays into a single structured array with one field per array."""
+    np = require_numpy()
+    length = len(next(iter(arrays.values()))) if arrays else 0
+    records = np.empty(
+        length, dtype=[(name, array.dtype) for name, array in arrays.items()]
+    )
+    for name, array in arrays.items():
+        records[name] = array
+    return records
+
+
+def arrays_to_dataframe(arrays: dict, index: str):
+    """Creates a pandas DataFrame from aligned arrays.
+
+    :param arrays: The arrays, as returned by nodes_to_arrays.
+    :param index: The name of the time column to use as a (UTC) DatetimeIndex.
+    """
+    pandas = require_pandas()
+    columns = dict(arrays)
+    time_index = pandas.DatetimeIndex(columns.pop(index), name=index).tz_localize("UTC")
+    for name, array in columns.items():
+        if array.dtype.kind == "M":
+            columns[name] = pandas.DatetimeIndex(array).tz_localize("UTC")
+    return pandas.DataFrame(columns, index=time_index)
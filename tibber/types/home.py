@@ -2,26 +2,34 @@ from __future__ import annotations
 
 """Classes representing the Home type from the GraphQL Tibber API."""
 import asyncio
+import functools
 import inspect
 import logging
-from typing import TYPE_CHECKING, Callable, Union
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Iterable, Union
 
-import backoff
 import gql
-import websockets
-from gql.transport.exceptions import TransportQueryError
 from gql.transport.websockets import WebsocketsTransport
-from graphql import parse
 
-from tibber import __version__
-from tibber.networking import QueryBuilder
+from tibber.live import websocket
+from tibber.live.dispatch import CallbackDispatcher
+from tibber.live.ring_buffer import DEFAULT_FIELDS, LiveMeasurementBuffer
+from tibber.live.stream import LiveMeasurementStream
+from tibber.networking import QueryBuilder, gql_compat
+from tibber.networking.chunked_fetch import fetch_period
+from tibber.networking.cursor import encode_cursor, parse_timestamp
+from tibber.networking.document_cache import document_cache
+from tibber.networking.rate_limiter import request_priority
 from tibber.types.address import Address
+from tibber.types.cached_view import cached_view
+from tibber.types.consumption import Consumption
 from tibber.types.home_consumption_connection import HomeConsumptionConnection
 from tibber.types.home_features import HomeFeatures
 from tibber.types.home_production_connection import HomeProductionConnection
 from tibber.types.legal_entity import LegalEntity
 from tibber.types.live_measurement import LiveMeasurement
 from tibber.types.metering_point_data import MeteringPointData
+from tibber.types.production import Production
 from tibber.types.subscription import Subscription
 
 # Import type checking modules
@@ -49,14 +57,12 @@ class NonDecoratedTibberHome:
         filter_empty_nodes: bool = False,
     ) -> HomeConsumptionConnection:
         """Consumption connection"""
-        consumption_query = QueryBuilder.consumption_query(
-            resolution, first, last, before, after, filter_empty_nodes
-        )
-        full_query = QueryBuilder.create_query(
-            "viewer", f'home(id: "{self.id}")', consumption_query
-        )
         unsanitized_data = self.tibber_client.execute_query(
-            self.tibber_client.token, full_query
+            self.tibber_client.token,
+            QueryBuilder.consumption_query(),
+            variable_values=self._page_variables(
+                resolution, first, last, before, after, filter_empty_nodes
+            ),
         )
 
         # The format should be correct, since we requested it this way and the request
@@ -64,6 +70,27 @@ class NonDecoratedTibberHome:
         data = unsanitized_data["viewer"]["home"]["consumption"]
         return HomeConsumptionConnection(resolution, data, self.tibber_client)
 
+    async def fetch_consumption_async(
+        self,
+        resolution: str,
+        first: int = None,
+        last: int = None,
+        before: str = None,
+        after: str = None,
+        filter_empty_nodes: bool = False,
+    ) -> HomeConsumptionConnection:
+        """Coroutine version of fetch_consumption()."""
+        unsanitized_data = await self.tibber_client.execute_async(
+            self.tibber_client.token,
+            QueryBuilder.consumption_query(),
+            variable_values=self._page_variables(
+                resolution, first, last, before, after, filter_empty_nodes
+            ),
+        )
+
+        data = unsanitized_data["viewer"]["home"]["consumption"]
+        return HomeConsumptionConnection(resolution, data, self.tibber_client)
+
     def fetch_production(
         self,
         resolution: str = None,
@@ -73,19 +100,250 @@ class NonDecoratedTibberHome:
         after: str = None,
         filter_empty_nodes: bool = False,
     ) -> HomeProductionConnection:
-        production_query = QueryBuilder.production_query(
-            resolution, first, last, before, after, filter_empty_nodes
-        )
-        full_query = QueryBuilder.create_query(
-            "viewer", f'home(id: "{self.id}")', production_query
-        )
         unsanitized_data = self.tibber_client.execute_query(
-            self.tibber_client.token, full_query
+            self.tibber_client.token,
+            QueryBuilder.production_query(),
+            variable_values=self._page_variables(
+                resolution, first, last, before, after, filter_empty_nodes
+            ),
         )
 
         data = unsanitized_data["viewer"]["home"]["production"]
         return HomeProductionConnection(resolution, data, self.tibber_client)
 
+    async def fetch_production_async(
+        self,
+        resolution: str = None,
+        first: int = None,
+        last: int = None,
+        before: str = None,
+        after: str = None,
+        filter_empty_nodes: bool = False,
+    ) -> HomeProductionConnection:
+        """Coroutine version of fetch_production()."""
+        unsanitized_data = await self.tibber_client.execute_async(
+            self.tibber_client.token,
+            QueryBuilder.production_query(),
+            variable_values=self._page_variables(
+                resolution, first, last, before, after, filter_empty_nodes
+            ),
+        )
+
+        data = unsanitized_data["viewer"]["home"]["production"]
+        return HomeProductionConnection(resolution, data, self.tibber_client)
+
+    def fetch_consumption_between(
+        self,
+        resolution: str,
+        since: Union[str, datetime],
+        until: Union[str, datetime],
+        chunk_size: int = 500,
+        concurrency: int = 4,
+        filter_empty_nodes: bool = False,
+    ) -> HomeConsumptionConnection:
+        """Fetches the consumption of a period, with several pages fetched at the same time.
+
+        The cursors of the pages are computed from the period, so the period is split into chunks
+        of chunk_size nodes up front and the chunks are fetched concurrently.
+
+        :param resolution: The resolution of the consumption, e.g. "HOURLY".
+        :param since: The start of the period (inclusive). Naive datetimes are assumed to be in the
+            local timezone.
+        :param until: The end of the period (exclusive).
+        :param chunk_size: The amount of nodes to fetch per query.
+        :param concurrency: The maximum amount of queries to run at the same time.
+        :param filter_empty_nodes: Whether to leave out nodes without consumption data.
+        :return: A connection with the nodes of the whole period, ordered by time.
+        """
+        return self.tibber_client.run_blocking(
+            self.fetch_consumption_between_async(
+                resolution, since, until, chunk_size, concurrency, filter_empty_nodes
+            )
+        )
+
+    async def fetch_consumption_between_async(
+        self,
+        resolution: str,
+        since: Union[str, datetime],
+        until: Union[str, datetime],
+        chunk_size: int = 500,
+        concurrency: int = 4,
+        filter_empty_nodes: bool = False,
+    ) -> HomeConsumptionConnection:
+        """Coroutine version of fetch_consumption_between()."""
+        data = await fetch_period(
+            functools.partial(
+                self.fetch_consumption_async,
+                resolution,
+                filter_empty_nodes=filter_empty_nodes,
+            ),
+            resolution,
+            since,
+            until,
+            "from",
+            chunk_size,
+            concurrency,
+        )
+        return HomeConsumptionConnection(resolution, data, self.tibber_client)
+
+    def fetch_production_between(
+        self,
+        resolution: str,
+        since: Union[str, datetime],
+        until: Union[str, datetime],
+        chunk_size: int = 500,
+        concurrency: int = 4,
+        filter_empty_nodes: bool = False,
+    ) -> HomeProductionConnection:
+        """Fetches the production of a period, with several pages fetched at the same time.
+        Takes the same arguments as fetch_consumption_between()."""
+        return self.tibber_client.run_blocking(
+            self.fetch_production_between_async(
+                resolution, since, until, chunk_size, concurrency, filter_empty_nodes
+            )
+        )
+
+    async def fetch_production_between_async(
+        self,
+        resolution: str,
+        since: Union[str, datetime],
+        until: Union[str, datetime],
+        chunk_size: int = 500,
+        concurrency: int = 4,
+        filter_empty_nodes: bool = False,
+    ) -> HomeProductionConnection:
+        """Coroutine version of fetch_production_between()."""
+        data = await fetch_period(
+            functools.partial(
+                self.fetch_production_async,
+                resolution,
+                filter_empty_nodes=filter_empty_nodes,
+            ),
+            resolution,
+            since,
+            until,
+            "from",
+            chunk_size,
+            concurrency,
+        )
+        return HomeProductionConnection(resolution, data, self.tibber_client)
+
+    def iter_consumption(
+        self,
+        resolution: str,
+        since: Union[str, datetime] = None,
+        until: Union[str, datetime] = None,
+        page_size: int = 100,
+        filter_empty_nodes: bool = False,
+    ) -> AsyncIterator[Consumption]:
+        """Iterates over the consumption of the home, following the page cursors.
+
+        Only one page is kept in memory at a time. The next page is fetched while the nodes of the
+        current one are consumed. Use it with `async for`.
+
+        :param resolution: The resolution of the consumption, e.g. "HOURLY".
+        :param since: Start with the node from this time. Starts with the oldest data by default.
+            Naive datetimes are assumed to be in the local timezone.
+        :param until: Stop before the node from this time. Continues until the last page by default.
+        :param page_size: The number of nodes to fetch per request.
+        :param filter_empty_nodes: Whether to leave out nodes without consumption data.
+        :throws ValueError: If page_size is less than 1.
+        """
+        return self._iter_history(
+            self.fetch_consumption_async,
+            resolution,
+            since,
+            until,
+            page_size,
+            filter_empty_nodes,
+        )
+
+    def iter_production(
+        self,
+        resolution: str,
+        since: Union[str, datetime] = None,
+        until: Union[str, datetime] = None,
+        page_size: int = 100,
+        filter_empty_nodes: bool = False,
+    ) -> AsyncIterator[Production]:
+        """Iterates over the production of the home, following the page cursors.
+        Takes the same arguments as iter_consumption()."""
+        return self._iter_history(
+            self.fetch_production_async,
+            resolution,
+            since,
+            until,
+            page_size,
+            filter_empty_nodes,
+        )
+
+    async def _iter_history(
+        self, fetch_page, resolution, since, until, page_size, filter_empty_nodes
+    ):
+        if page_size < 1:
+            raise ValueError("The page size must be at least 1.")
+        since = parse_timestamp(since) if since is not None else None
+        until = parse_timestamp(until) if until is not None else None
+
+        def prefetch(cursor):
+            # The task keeps the priority of the context it is created in.
+            with request_priority("bulk", override=False):
+                return asyncio.ensure_future(
+                    fetch_page(
+                        resolution,
+                        first=page_size,
+                        after=cursor,
+                        filter_empty_nodes=filter_empty_nodes,
+                    )
+                )
+
+        # A page starts after the time of its cursor, so a cursor just before since makes the
+        # first page start with the node from since.
+        cursor = encode_cursor(since - timedelta(milliseconds=1)) if since else None
+        next_page = prefetch(cursor)
+        last_time = None
+        try:
+            while next_page is not None:
+                page = await next_page
+                next_page = None
+                nodes = page.nodes
+                page_info = page.page_info
+
+                if (
+                    nodes
+                    and page_info.has_next_page
+                    and page_info.end_cursor not in (None, cursor)
+                    and (until is None or parse_timestamp(nodes[-1].from_time) < until)
+                ):
+                    cursor = page_info.end_cursor
+                    next_page = prefetch(cursor)
+
+                for node in nodes:
+                    time = parse_timestamp(node.from_time)
+                    # Skip nodes from before since and nodes that were on the previous page too.
+                    if (since and time < since) or (last_time and time <= last_time):
+                        continue
+                    if until and time >= until:
+                        return
+                    last_time = time
+                    yield node
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    def _page_variables(
+        self, resolution, first, last, before, after, filter_empty_nodes
+    ) -> dict:
+        return QueryBuilder.variables(
+            homeId=self.id,
+            resolution=resolution,
+            first=first,
+            last=last,
+            before=before,
+            after=after,
+            filterEmptyNodes=filter_empty_nodes,
+        )
+
     @property
     def id(self) -> str:
         return self.cache.get("id")
@@ -135,36 +393,38 @@ class NonDecoratedTibberHome:
         """The main fuse size"""
         return self.cache.get("mainFuseSize")
 
-    @property
+    @cached_view
     def owner(self) -> LegalEntity:
         """The registered owner of the house"""
         return LegalEntity(self.cache.get("owner"), self.tibber_client)
 
-    @property
+    @cached_view
     def metering_point_data(self) -> MeteringPointData:
         return MeteringPointData(
             self.cache.get("meteringPointData"), self.tibber_client
         )
 
-    @property
+    @cached_view
     def current_subscription(self) -> Subscription:
         """The current/latest subscription related to the home"""
-        return Subscription(self.cache.get("currentSubscription"), self.tibber_client)
+        return Subscription(
+            self.cache.get("currentSubscription"), self.tibber_client, self.id
+        )
 
-    @property
+    @cached_view
     def subscriptions(self) -> list:
         """All historic subscriptions related to the home"""
         return [
-            Subscription(sub, self.tibber_client)
+            Subscription(sub, self.tibber_client, self.id)
             for sub in self.cache.get("subscriptions", [])
         ]
 
-    @property
+    @cached_view
     def features(self):
         return HomeFeatures(self.cache.get("features"), self.tibber_client)
 
     # Support 1 to 1 Tibber API representation.
-    @property
+    @cached_view
     def address(self) -> Address:
         return Address(self.cache.get("address"), self.tibber_client)
 
@@ -210,12 +470,31 @@ class TibberHome(NonDecoratedTibberHome):
         super().__init__(*args, **kwargs)
         self._websocket_client = None
         self._callbacks = {"live_measurement": []}
-
-    def event(self, event_to_listen_for) -> Callable:
+        self._dispatcher = CallbackDispatcher()
+        # The open live measurement streams of the home, see live_measurements().
+        self._streams = []
+        self._live_feed_running = False
+        # The buffer of recent live measurements, see enable_live_buffer().
+        self.live_buffer = None
+
+    def event(
+        self,
+        event_to_listen_for,
+        policy: str = "queue",
+        maxsize: int = 100,
+        timeout: Union[float, int] = None,
+    ) -> Callable:
         """Returns a decorator that registers the function being
         decorated as a callback function for the given event
 
+        Each callback runs in its own task, so a slow callback does not delay other callbacks or
+        the websocket. Events that arrive while the callback is busy are queued for it.
+
         :param event_to_listen_for: The event the decorator should register the function as a callback for.
+        :param policy: How to queue events while the callback is busy. "queue" keeps up to maxsize
+            events and drops the oldest when full, "latest" only keeps the newest event.
+        :param maxsize: The maximum number of queued events with the "queue" policy.
+        :param timeout: The number of seconds a call may take before it is cancelled. None for no limit.
         """
 
         def decorator(callback):
@@ -232,23 +511,68 @@ class TibberHome(NonDecoratedTibberHome):
 
             # If the key is not found - the event is not a valid event!
             # Valid events will be added directly to the line where _callbacks is initialized.
-            try:
-                self._callbacks[event_to_listen_for].append(callback)
-            except KeyError:
+            if event_to_listen_for not in self._callbacks:
                 raise ValueError(
                     f"Could not recognize the event you want to listen for: {event_to_listen_for}"
                 )
+            self._dispatcher.register(callback, policy, maxsize, timeout)
+            self._callbacks[event_to_listen_for].append(callback)
 
             return callback
 
         return decorator
 
+    def live_measurements(
+        self,
+        maxsize: int = 100,
+        overflow: str = "drop_oldest",
+        fields: Union[str, Iterable[str]] = None,
+    ) -> LiveMeasurementStream:
+        """Returns an async iterator over the live measurements of the home.
+
+        The measurements are queued between the websocket and the consumer. Unless the live feed
+        of the home is already running on its LiveFeedHub, iterating starts it, and closing the
+        stream stops it. Use the stream as an async context manager to close it when done:
+
+            async with home.live_measurements(maxsize=10, overflow="block") as stream:
+                async for measurement in stream:
+                    print(measurement.power)
+
+        :param maxsize: The maximum number of measurements to queue.
+        :param overflow: What to do when the queue is full: "drop_oldest", "drop_newest" or
+            "block" (stop reading the websocket until the consumer catches up). The number of
+            dropped measurements is counted in the dropped attribute of the stream.
+        :param fields: The fields to subscribe to, see start_live_feed(). Only used if the stream
+            starts the live feed.
+        :throws ValueError: If maxsize is less than 1, or the overflow policy or a field is unknown.
+        """
+        return LiveMeasurementStream(self, maxsize, overflow, fields)
+
+    def enable_live_buffer(
+        self, capacity: int = 3600, fields: Iterable[str] = DEFAULT_FIELDS
+    ) -> LiveMeasurementBuffer:
+        """Keeps the most recent live measurements of the home in home.live_buffer, which answers
+        rolling queries like the mean power of the last minute. Replaces an existing buffer.
+
+        Example:
+            buffer = home.enable_live_buffer(capacity=3600)
+            ...
+            print(buffer.mean("power", seconds=60), buffer.percentile("power", 95, seconds=600))
+
+        :param capacity: The number of measurements to keep.
+        :param fields: The LiveMeasurement attributes to keep. Defaults to the power, voltage,
+            current and accumulated values.
+        """
+        self.live_buffer = LiveMeasurementBuffer(capacity, fields)
+        return self.live_buffer
+
     def start_live_feed(
         self,
         user_agent=None,
         exit_condition: Callable[[LiveMeasurement], bool] = None,
         retries: int = 3,
         retry_interval: Union[float, int] = 10,
+        fields: Union[str, Iterable[str]] = None,
         **kwargs,
     ) -> None:
         """Creates a websocket and starts pushing data out to registered callbacks.
@@ -257,11 +581,18 @@ class TibberHome(NonDecoratedTibberHome):
             If the function returns True, the websocket will be closed.
         :param retries: The number of times to retry connecting to the websocket if it fails.
         :param retry_interval: The interval in seconds to wait before retrying to connect to the websocket.
+        :param fields: The fields to subscribe to, as the name of a profile in
+            QueryBuilder.LIVE_MEASUREMENT_PROFILES (e.g. "power_only") or a list of profile names and
+            LiveMeasurement fields (e.g. ["power", "currentL1"]). Fields that are not subscribed to
+            are None. Defaults to all fields.
         :param kwargs: Additional arguments to pass to the websocket (gql.transport.WebsocketsTransport).
         """
         if not self.features.real_time_consumption_enabled:
             raise ValueError("The home does not have real time consumption enabled.")
 
+        # Raises a ValueError for unknown fields before connecting.
+        QueryBuilder.resolve_live_measurement_fields(fields)
+
         if not self.tibber_client.user_agent and not user_agent:
             raise ValueError(
                 'You must specify a user agent when starting the live feed. E.g. "Homey/10.0.0"'
@@ -278,11 +609,15 @@ class TibberHome(NonDecoratedTibberHome):
         try:
             if loop and loop.is_running():
                 loop.run_until_complete(
-                    self.start_websocket_loop(exit_condition, retries=retries, **kwargs)
+                    self.start_websocket_loop(
+                        exit_condition, retries=retries, fields=fields, **kwargs
+                    )
                 )
             else:
                 asyncio.run(
-                    self.start_websocket_loop(exit_condition, retries=retries, **kwargs)
+                    self.start_websocket_loop(
+                        exit_condition, retries=retries, fields=fields, **kwargs
+                    )
                 )
         except KeyboardInterrupt:
             _logger.info("Keyboard interrupt detected. Websocket should be closed now.")
@@ -292,6 +627,7 @@ class TibberHome(NonDecoratedTibberHome):
         exit_condition: Callable[[LiveMeasurement], bool] = None,
         retries: int = 3,
         retry_interval: Union[float, int] = 10,
+        fields: Union[str, Iterable[str]] = None,
         **kwargs,
     ) -> None:
         """Starts a websocket to subscribe for live measurements.
@@ -300,106 +636,74 @@ class TibberHome(NonDecoratedTibberHome):
             If the function returns True, the websocket will be closed.
         :param retries: The number of times to retry connecting to the websocket if it fails.
         :param retry_interval: The interval in seconds to wait before retrying to connect to the websocket.
+        :param fields: The fields to subscribe to, see start_live_feed(). Defaults to all fields.
         :param kwargs: Additional arguments to pass to the websocket (gql.transport.WebsocketsTransport).
         """
         if retry_interval < 1:
             raise ValueError("The retry interval must be at least 1 second.")
 
         # Create the websocket
-        transport = WebsocketsTransport(
-            **kwargs,
-            url=self.tibber_client.viewer.websocket_subscription_url,
-            subprotocols=[WebsocketsTransport.GRAPHQLWS_SUBPROTOCOL],
-            init_payload={"token": self.tibber_client.token},
-            headers={
-                "User-Agent": f"{self.tibber_client.user_agent} tibber.py/{__version__}"
-            },
-            ping_interval=10,
-            pong_timeout=10,
-        )
-
-        self._websocket_client = gql.Client(
-            transport=transport,
-            fetch_schema_from_transport=True,
-        )
-
-        retry_connect = backoff.on_exception(
-            backoff.expo,
-            [
-                gql.transport.exceptions.TransportClosed,
-                websockets.exceptions.ConnectionClosedError,
-            ],
-            max_value=100,
-            max_tries=retries,
-            on_backoff=lambda details: _logger.warning(
-                "Retrying to connect with backoff. Running {target} in {wait:.1f} seconds after {tries} tries.".format(
-                    **details
-                )
-            ),
-            jitter=backoff.full_jitter,
-            giveup=lambda e: isinstance(e, TransportQueryError)
-            or isinstance(e, ValueError),
-        )
-
-        retry_subscribe = backoff.on_exception(
-            backoff.expo,
-            Exception,
-            max_value=100,
-            max_tries=retries,
-            on_backoff=lambda details: _logger.warning(
-                "Retrying to subscribe with backoff. Running {target} in {wait:.1f} seconds after {tries} tries.".format(
-                    **details
-                )
-            ),
-            jitter=backoff.full_jitter,
-            giveup=lambda e: isinstance(e, TransportQueryError)
-            or isinstance(e, ValueError),
-        )
+        transport = websocket.create_websocket_transport(self.tibber_client, **kwargs)
+        self._websocket_client = gql.Client(transport=transport)
 
-        _logger.debug("connecting to websocket")
-        session = await self._websocket_client.connect_async(
-            reconnecting=True,
-            retry_connect=retry_connect,
-        )
-        _logger.info("Connected to websocket.")
-        await retry_subscribe(self.run_websocket_loop)(session, exit_condition)
+        self._live_feed_running = True
+        try:
+            _logger.debug("connecting to websocket")
+            session = await self._websocket_client.connect_async(
+                reconnecting=True,
+                retry_connect=websocket.retry_connect(retries),
+            )
+            _logger.info("Connected to websocket.")
+            await websocket.retry_subscribe(retries)(self.run_websocket_loop)(
+                session, exit_condition, fields
+            )
+        finally:
+            self._live_feed_running = False
+            self.end_streams()
 
-    async def run_websocket_loop(self, session, exit_condition) -> None:
+    async def run_websocket_loop(self, session, exit_condition, fields=None) -> None:
         # Check if real time consumption is enabled
         _logger.info(
             "Updating home information to check if real time consumption is enabled."
         )
-        await self.tibber_client.update_async()
+        with request_priority("live"):
+            await self.tibber_client.update_async(fields="live")
 
         if not self.features.real_time_consumption_enabled:
             raise ValueError("The home does not have real time consumption enabled.")
 
         # Subscribe to the websocket
-        query = QueryBuilder.live_measurement(self.id)
+        query = QueryBuilder.live_measurement(fields)
         _logger.debug(
             f"Connecting to live measurement data endpoint with query: {' '.join(query.split())}"
         )
-        document_node_query = parse(query)
+        document_node_query = document_cache.get(query)
 
         _logger.info("Subscribing to websocket.")
-        async for data in session.subscribe(document_node_query):
-            _logger.debug("real time data received.")
-
-            # Returns True if exit condition is met
-            exit_condition_met = await self.process_websocket_response(
-                data, exit_condition=exit_condition
-            )
-            if exit_condition_met:
-                _logger.info("Exit condition met. The live loop is now exiting.")
-                break
+        try:
+            async for data in gql_compat.subscribe(
+                session, document_node_query, variable_values={"homeId": self.id}
+            ):
+                _logger.debug("real time data received.")
+
+                # Returns True if exit condition is met
+                exit_condition_met = await self.process_websocket_response(
+                    data, exit_condition=exit_condition
+                )
+                if exit_condition_met:
+                    _logger.info("Exit condition met. The live loop is now exiting.")
+                    break
+        finally:
+            # Also stops the tasks of the callbacks when the websocket fails or the loop is cancelled.
+            await self.close_callbacks()
 
         await self.close_websocket_connection()
 
     async def process_websocket_response(
         self, data: dict, exit_condition: Callable[[LiveMeasurement], bool] = None
     ) -> bool:
-        """Processes a response with data from the live data websocket. This function will call all registered callbacks
-        before checking if the exit condition is met.
+        """Processes a response with data from the live data websocket. This function will queue the data for all
+        registered callbacks before checking if the exit condition is met. It does not wait for the callbacks.
 
         :param data: The data to process.
         :return: Returns True if exit condition was met. False otherwise.
@@ -407,7 +711,12 @@ class TibberHome(NonDecoratedTibberHome):
         # Broadcast the event
         # TODO: Differentiate between consumption data, production data and other data.
         cleaned_data = LiveMeasurement(data["liveMeasurement"], self.tibber_client)
-        await self.broadcast_event("live_measurement", cleaned_data)
+        if self.live_buffer is not None:
+            self.live_buffer.append(cleaned_data)
+        for stream in list(self._streams):
+            await stream.put(cleaned_data)
+        if self._callbacks["live_measurement"] or not self._streams:
+            await self.broadcast_event("live_measurement", cleaned_data)
 
         # Check if the exit condition is met
         if exit_condition and exit_condition(cleaned_data):
@@ -419,6 +728,7 @@ class TibberHome(NonDecoratedTibberHome):
             _logger.warning(
                 f'The event "{event}" was attempted emitted, but does not exist. Nothing was run.'
             )
+            return
 
         if len(self._callbacks[event]) == 0:
             _logger.warning(
@@ -426,7 +736,31 @@ class TibberHome(NonDecoratedTibberHome):
             )
             return
 
-        await asyncio.gather(*[c(data) for c in self._callbacks[event]])
+        self._dispatcher.dispatch(self._callbacks[event], data)
+
+    async def close_callbacks(self, drain: bool = True) -> None:
+        """Stops the tasks that run the callbacks. Done automatically when the live feed ends.
+
+        :param drain: Whether to wait for the callbacks to handle the queued events first.
+        """
+        await self._dispatcher.close(drain)
+
+    def end_streams(self) -> None:
+        """Ends the live measurement streams of the home after their queued measurements. Done
+        automatically when the live feed ends."""
+        for stream in list(self._streams):
+            stream.end()
+
+    @property
+    def live_feed_running(self) -> bool:
+        """Returns True while the home runs its own live feed (see start_live_feed())."""
+        return self._live_feed_running
+
+    @property
+    def callback_metrics(self) -> dict:
+        """The number of queued, delivered, dropped, failed and timed out events by callback.
+        Each entry also has the name of the callback."""
+        return self._dispatcher.metrics
 
     async def close_websocket_connection(self) -> None:
         _logger.debug("attempting to close websocket connection")
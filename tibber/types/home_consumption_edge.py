@@ -3,6 +3,7 @@ from __future__ import annotations
 """A class representing the HomeConsumptionEdge type from the GraphQL Tibber API."""
 from typing import TYPE_CHECKING
 
+from tibber.types.cached_view import cached_view
 from tibber.types.consumption import Consumption
 
 # Import type checking modules
@@ -22,6 +23,6 @@ class HomeConsumptionEdge:
     def cursor(self) -> str:
         return self.cache.get("cursor")
 
-    @property
+    @cached_view
     def node(self) -> Consumption:
         return Consumption(self.cache.get("node"), self.tibber_client)
@@ -3,6 +3,8 @@ from __future__ import annotations
 """A class representing the HomeProductionConnection type from the GraphQL Tibber API."""
 from typing import TYPE_CHECKING
 
+from tibber.types import columnar
+from tibber.types.cached_view import cached_view
 from tibber.types.home_production_edge import HomeProductionEdge
 from tibber.types.home_production_page_info import HomeProductionPageInfo
 from tibber.types.production import Production
@@ -15,29 +17,65 @@ if TYPE_CHECKING:
 class HomeProductionConnection:
     """A class containing household electricity production information for a time period."""
 
+    # The columns created by to_arrays, mapped to the GraphQL fields of the nodes.
+    TIME_COLUMNS = {"from_time": "from", "to_time": "to"}
+    FLOAT_COLUMNS = {
+        "unit_price": "unitPrice",
+        "unit_price_vat": "unitPriceVAT",
+        "production": "production",
+        "profit": "profit",
+    }
+
     def __init__(self, resolution: str, data: dict, tibber_client: "Account"):
         self.resolution = resolution
         self.cache: dict = data or {}
         self.tibber_client: "Account" = tibber_client
 
-    @property
+    @cached_view
     def page_info(self) -> str:
         return HomeProductionPageInfo(
             self.resolution, self.cache.get("pageInfo"), self.tibber_client
         )
 
-    @property
+    @cached_view
     def nodes(self) -> list:
         return [
             Production(node, self.tibber_client) for node in self.cache.get("nodes")
         ]
 
-    @property
+    @cached_view
     def edges(self) -> list:
         return [
             HomeProductionEdge(self.resolution, edge, self.tibber_client)
             for edge in self.cache.get("edges")
         ]
 
+    def to_arrays(self) -> dict:
+        """Converts the nodes into aligned NumPy arrays, one per column.
+
+        Timestamps become datetime64[ms] arrays in UTC, parsed all at once, and the other columns
+        float64 arrays with NaN for missing values. Requires numpy.
+
+        :return: A dict with the arrays for TIME_COLUMNS and FLOAT_COLUMNS.
+        :throws ImportError: If numpy is not installed.
+        """
+        return columnar.nodes_to_arrays(
+            self.cache.get("nodes"), self.TIME_COLUMNS, self.FLOAT_COLUMNS
+        )
+
+    def to_numpy(self):
+        """Converts the nodes into a NumPy structured array with the columns of to_arrays.
+
+        :throws ImportError: If numpy is not installed.
+        """
+        return columnar.arrays_to_records(self.to_arrays())
+
+    def to_dataframe(self):
+        """Converts the nodes into a pandas DataFrame indexed by from_time (UTC).
+
+        :throws ImportError: If numpy or pandas is not installed.
+        """
+        return columnar.arrays_to_dataframe(self.to_arrays(), index="from_time")
+
     def __iter__(self):
         return iter(self.nodes)
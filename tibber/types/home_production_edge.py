@@ -3,6 +3,7 @@ from __future__ import annotations
 """A class representing the HomeProductionEdge type from the GraphQL Tibber API."""
 from typing import TYPE_CHECKING
 
+from tibber.types.cached_view import cached_view
 from tibber.types.production import Production
 
 # Import type checking modules
@@ -22,6 +23,6 @@ class HomeProductionEdge:
     def cursor(self) -> str:
         return self.cache.get("cursor")
 
-    @property
+    @cached_view
     def node(self) -> Production:
         return Production(self.cache.get("node"), self.tibber_client)
@@ -4,6 +4,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from tibber.types.address import Address
+from tibber.types.cached_view import cached_view
 from tibber.types.contact_info import ContactInfo
 
 # Import type checking modules
@@ -57,12 +58,12 @@ class LegalEntity:
         """The primary language of the entity"""
         return self.cache.get("language")  # pragma: no cover
 
-    @property
+    @cached_view
     def contact_info(self) -> ContactInfo:
         """Contact information of the entity"""
         return ContactInfo(self.cache.get("contactInfo"), self.tibber_client)
 
-    @property
+    @cached_view
     def address(self) -> Address:
         """Address information for the entity"""
         return Address(
@@ -1,169 +1,107 @@
 from __future__ import annotations
 
 """A class representing the LiveMeasurement type from the GraphQL Tibber API."""
-from typing import TYPE_CHECKING
-
-# Import type checking modules
-if TYPE_CHECKING:
-    from tibber.account import Account
-
-
-class LiveMeasurement:
-    """A class containing the live household electricity information."""
-
-    def __init__(self, data: dict, tibber_client: "Account"):
-        self.cache: dict = data or {}
-        self.tibber_client: "Account" = tibber_client
-
-    @property
-    def timestamp(self) -> str:
-        """Timestamp when usage occurred"""
-        return self.cache.get("timestamp")
-
-    @property
-    def power(self) -> float:
-        """Consumption at the moment (Watt)"""
-        return self.cache.get("power")
-
-    @property
-    def last_meter_consumption(self) -> float:
-        """Last meter active import register state (kWh)"""
-        return self.cache.get("lastMeterConsumption")
-
-    @property
-    def accumulated_consumption(self) -> float:
-        """kWh consumed since midnight"""
-        return self.cache.get("accumulatedConsumption")
-
-    @property
-    def accumulated_production(self) -> float:
-        """net kWh produced since midnight"""
-        return self.cache.get("accumulatedProduction")
-
-    @property
-    def accumulated_consumption_last_hour(self) -> float:
-        """kWh consumed since since last hour shift"""
-        return self.cache.get("accumulatedConsumptionLastHour")
-
-    @property
-    def accumulated_production_last_hour(self) -> float:
-        """net kWh produced since last hour shift"""
-        return self.cache.get("accumulatedProductionLastHour")
-
-    @property
-    def accumulated_cost(self) -> float:
-        """Accumulated cost since midnight; requires active Tibber power deal"""
-        return self.cache.get("accumulatedCost")
-
-    @property
-    def accumulated_reward(self) -> float:
-        """Accumulated reward since midnight; requires active Tibber power deal"""
-        return self.cache.get("accumulatedReward")
-
-    @property
-    def currency(self) -> str:
-        """Currency of displayed cost; requires active Tibber power deal"""
-        return self.cache.get("currency")
-
-    @property
-    def min_power(self) -> float:
-        """Min consumption since midnight (Watt)"""
-        return self.cache.get("minPower")
-
-    @property
-    def average_power(self) -> float:
-        """Average consumption since midnight (Watt)"""
-        return self.cache.get("averagePower")
-
-    @property
-    def max_power(self) -> float:
-        """Peak consumption since midnight (Watt)"""
-        return self.cache.get("maxPower")
-
-    @property
-    def power_production(self) -> float:
-        """Net production (A-) at the moment (Watt)"""
-        return self.cache.get("powerProduction")
-
-    @property
-    def power_reactive(self) -> float:
-        """Reactive consumption (Q+) at the moment (kVAr)"""
-        return self.cache.get("powerReactive")
-
-    @property
-    def power_production_reactive(self) -> float:
-        """Net reactive production (Q-) at the moment (kVAr)"""
-        return self.cache.get("powerProductionReactive")
-
-    @property
-    def min_power_production(self) -> float:
-        """Min net production since midnight (Watt)"""
-        return self.cache.get("minPowerProduction")
-
-    @property
-    def max_power_production(self) -> float:
-        """Max net production since midnight (Watt)"""
-        return self.cache.get("maxPowerProduction")
-
-    @property
-    def last_meter_production(self) -> float:
-        """Last meter active export register state (kWh)"""
-        return self.cache.get("lastMeterProduction")
-
-    @property
-    def power_factor(self) -> float:
-        """Power factor (active power / apparent power)"""
-        return self.cache.get("powerFactor")
-
-    @property
-    def voltage_phase_1(self) -> float:
-        """Voltage on phase 1; on Kaifa and Aidon meters the value is not part
-        of every HAN data frame therefore the value is null at timestamps with
-        second value other than 0, 10, 20, 30, 40, 50. There can be other deviations
-        based on concrete meter firmware."""
-        return self.cache.get("voltagePhase1")
-
-    @property
-    def voltage_phase_2(self) -> float:
-        """Voltage on phase 2; on Kaifa and Aidon meters the value is not part
-        of every HAN data frame therefore the value is null at timestamps with
-        second value other than 0, 10, 20, 30, 40, 50. There can be other deviations
-        based on concrete meter firmware."""
-        return self.cache.get("voltagePhase2")
-
-    @property
-    def voltage_phase_3(self) -> float:
-        """Voltage on phase 3; on Kaifa and Aidon meters the value is not part
-        of every HAN data frame therefore the value is null at timestamps with
-        second value other than 0, 10, 20, 30, 40, 50. There can be other deviations
-        based on concrete meter firmware."""
-        return self.cache.get("voltagePhase3")
-
-    @property
-    def currentL1(self) -> float:
-        """Current on L1; on Kaifa and Aidon meters the value is not part of
-        every HAN data frame therefore the value is null at timestamps with
-        second value other than 0, 10, 20, 30, 40, 50. There can be other deviations
-        based on concrete meter firmware."""
-        return self.cache.get("currentL1")
-
-    @property
-    def currentL2(self) -> float:
-        """Current on L2; on Kaifa and Aidon meters the value is not part of
-        every HAN data frame therefore the value is null at timestamps with
-        second value other than 0, 10, 20, 30, 40, 50. There can be other deviations
-        based on concrete meter firmware."""
-        return self.cache.get("currentL2")
-
-    @property
-    def currentL3(self) -> float:
-        """Current on L3; on Kaifa and Aidon meters the value is not part of
-        every HAN data frame therefore the value is null at timestamps with
-        second value other than 0, 10, 20, 30, 40, 50. There can be other deviations
-        based on concrete meter firmware."""
-        return self.cache.get("currentL3")
-
-    @property
-    def signal_strength(self) -> int:  # pragma: no cover
-        """Device signal strength (Pulse - dB; Watty - percent)"""
-        return self.cache.get("signalStrength")
+from tibber.types.record import Record
+
+
+class LiveMeasurement(Record):
+    """A class containing the live household electricity information.
+
+    The voltage_phase_* and currentL* values are not part of every HAN data frame on Kaifa and
+    Aidon meters, so they are None at timestamps with a second value other than 0, 10, 20, 30, 40
+    and 50. There can be other deviations based on concrete meter firmware.
+
+    Fields that were left out of the subscription (see QueryBuilder.LIVE_MEASUREMENT_PROFILES)
+    are None as well.
+    """
+
+    FIELDS = (
+        ("timestamp", "timestamp", "Timestamp when usage occurred"),
+        ("power", "power", "Consumption at the moment (Watt)"),
+        (
+            "last_meter_consumption",
+            "lastMeterConsumption",
+            "Last meter active import register state (kWh)",
+        ),
+        (
+            "accumulated_consumption",
+            "accumulatedConsumption",
+            "kWh consumed since midnight",
+        ),
+        (
+            "accumulated_production",
+            "accumulatedProduction",
+            "net kWh produced since midnight",
+        ),
+        (
+            "accumulated_consumption_last_hour",
+            "accumulatedConsumptionLastHour",
+            "kWh consumed since since last hour shift",
+        ),
+        (
+            "accumulated_production_last_hour",
+            "accumulatedProductionLastHour",
+            "net kWh produced since last hour shift",
+        ),
+        (
+            "accumulated_cost",
+            "accumulatedCost",
+            "Accumulated cost since midnight; requires active Tibber power deal",
+        ),
+        (
+            "accumulated_reward",
+            "accumulatedReward",
+            "Accumulated reward since midnight; requires active Tibber power deal",
+        ),
+        (
+            "currency",
+            "currency",
+            "Currency of displayed cost; requires active Tibber power deal",
+        ),
+        ("min_power", "minPower", "Min consumption since midnight (Watt)"),
+        ("average_power", "averagePower", "Average consumption since midnight (Watt)"),
+        ("max_power", "maxPower", "Peak consumption since midnight (Watt)"),
+        (
+            "power_production",
+            "powerProduction",
+            "Net production (A-) at the moment (Watt)",
+        ),
+        (
+            "power_reactive",
+            "powerReactive",
+            "Reactive consumption (Q+) at the moment (kVAr)",
+        ),
+        (
+            "power_production_reactive",
+            "powerProductionReactive",
+            "Net reactive production (Q-) at the moment (kVAr)",
+        ),
+        (
+            "min_power_production",
+            "minPowerProduction",
+            "Min net production since midnight (Watt)",
+        ),
+        (
+            "max_power_production",
+            "maxPowerProduction",
+            "Max net production since midnight (Watt)",
+        ),
+        (
+            "last_meter_production",
+            "lastMeterProduction",
+            "Last meter active export register state (kWh)",
+        ),
+        ("power_factor", "powerFactor", "Power factor (active power / apparent power)"),
+        ("voltage_phase_1", "voltagePhase1", "Voltage on phase 1"),
+        ("voltage_phase_2", "voltagePhase2", "Voltage on phase 2"),
+        ("voltage_phase_3", "voltagePhase3", "Voltage on phase 3"),
+        ("currentL1", "currentL1", "Current on L1"),
+        ("currentL2", "currentL2", "Current on L2"),
+        ("currentL3", "currentL3", "Current on L3"),
+        (
+            "signal_strength",
+            "signalStrength",
+            "Device signal strength (Pulse - dB; Watty - percent)",
+        ),
+    )
+    __slots__ = {attribute: doc for attribute, _, doc in FIELDS}
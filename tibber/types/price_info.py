@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 """A class representing the PriceInfo type from the GraphQL Tibber API."""
-from typing import TYPE_CHECKING, Optional
+import functools
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional, Union
 
+from tibber.networking.chunked_fetch import fetch_period
 from tibber.networking.query_builder import QueryBuilder
+from tibber.types.cached_view import cached_view
 from tibber.types.price import Price
 
 from tibber.types.subscription_price_connection import (  # isort: skip
@@ -18,21 +22,30 @@ if TYPE_CHECKING:
 class PriceInfo:
     """A class to get price info."""
 
-    def __init__(self, data: dict, tibber_client: "Account"):
+    def __init__(
+        self, data: dict, tibber_client: "Account", home_id: Optional[str] = None
+    ):
+        """
+        :param data: The cached price info data.
+        :param tibber_client: The account the price info belongs to.
+        :param home_id: The id of the home the price info belongs to. Price ranges are only
+            fetched for this home.
+        """
         self.cache: dict = data or {}
         self.tibber_client: "Account" = tibber_client
+        self.home_id: Optional[str] = home_id
 
-    @property
+    @cached_view
     def current(self) -> Price:
         """The energy price right now"""
         return Price(self.cache.get("current"), self.tibber_client)
 
-    @property
+    @cached_view
     def today(self) -> list[Price]:
         """The hourly prices of the current day"""
         return [Price(hour, self.tibber_client) for hour in self.cache.get("today", [])]
 
-    @property
+    @cached_view
     def tomorrow(self) -> list[Price]:
         """The hourly prices of the upcoming day"""
         return [
@@ -48,29 +61,123 @@ class PriceInfo:
         after: Optional[str] = None,
         home_id: Optional[str] = None,
     ) -> SubscriptionPriceConnection:
-        """Fetch the price range.
+        """Fetch the price range of the current subscription of a home.
 
-        The before and after arguments are Base64 encoded ISO 8601 datetimes."""
-        range_query_dict = QueryBuilder.range_query(
-            resolution, first, last, before, after
-        )
+        The before and after arguments are Base64 encoded ISO 8601 datetimes.
 
-        range_query = QueryBuilder.create_query(
-            "viewer", "homes", "currentSubscription", "priceInfo", range_query_dict
-        )
+        :param home_id: The home to fetch the price range of. Defaults to the home this price info
+            belongs to. If no home is known, the ranges of all homes are fetched and the range
+            of the first home is returned.
+        """
+        home_id = home_id or self.home_id
         full_data = self.tibber_client.execute_query(
-            self.tibber_client.token, range_query
+            self.tibber_client.token,
+            self._range_query(home_id),
+            variable_values=self._range_variables(
+                resolution, first, last, before, after, home_id
+            ),
         )
+        return self._range_connection(full_data)
 
-        home = full_data["viewer"]["homes"][0]
-        if home_id:
-            home_of_id = [
-                home for home in full_data["viewer"]["homes"] if home["id"] == home_id
-            ][0]
+    async def fetch_range_async(
+        self,
+        resolution: str,
+        first: Optional[str] = None,
+        last: Optional[str] = None,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+        home_id: Optional[str] = None,
+    ) -> SubscriptionPriceConnection:
+        """Coroutine version of fetch_range()."""
+        home_id = home_id or self.home_id
+        full_data = await self.tibber_client.execute_async(
+            self.tibber_client.token,
+            self._range_query(home_id),
+            variable_values=self._range_variables(
+                resolution, first, last, before, after, home_id
+            ),
+        )
+        return self._range_connection(full_data)
 
-            if home_of_id:
-                home = home_of_id
+    def fetch_range_between(
+        self,
+        resolution: str,
+        since: Union[str, datetime],
+        until: Union[str, datetime],
+        home_id: Optional[str] = None,
+        chunk_size: int = 500,
+        concurrency: int = 4,
+    ) -> SubscriptionPriceConnection:
+        """Fetches the prices of a period, with several pages fetched at the same time.
+
+        :param resolution: HOURLY or DAILY.
+        :param since: The start of the period (inclusive). Naive datetimes are assumed to be in the
+            local timezone.
+        :param until: The end of the period (exclusive).
+        :param home_id: The home to fetch the prices of, see fetch_range().
+        :param chunk_size: The amount of prices to fetch per query.
+        :param concurrency: The maximum amount of queries to run at the same time.
+        :return: A connection with the prices of the whole period, ordered by time.
+        """
+        return self.tibber_client.run_blocking(
+            self.fetch_range_between_async(
+                resolution, since, until, home_id, chunk_size, concurrency
+            )
+        )
+
+    async def fetch_range_between_async(
+        self,
+        resolution: str,
+        since: Union[str, datetime],
+        until: Union[str, datetime],
+        home_id: Optional[str] = None,
+        chunk_size: int = 500,
+        concurrency: int = 4,
+    ) -> SubscriptionPriceConnection:
+        """Coroutine version of fetch_range_between()."""
+        data = await fetch_period(
+            functools.partial(self.fetch_range_async, resolution, home_id=home_id),
+            resolution,
+            since,
+            until,
+            "startsAt",
+            chunk_size,
+            concurrency,
+        )
+        return SubscriptionPriceConnection(data, self.tibber_client)
 
-        return SubscriptionPriceConnection(
-            home["currentSubscription"]["priceInfo"]["range"], self.tibber_client
+    @staticmethod
+    def _range_query(home_id: Optional[str]) -> str:
+        if home_id:
+            return QueryBuilder.home_range_query()
+        return QueryBuilder.range_query()
+
+    @staticmethod
+    def _range_variables(resolution, first, last, before, after, home_id=None) -> dict:
+        # first and last have historically been accepted as strings as well.
+        return QueryBuilder.variables(
+            homeId=home_id,
+            resolution=resolution,
+            first=int(first) if first is not None else None,
+            last=int(last) if last is not None else None,
+            before=before,
+            after=after,
         )
+
+    def _range_connection(self, full_data: dict) -> SubscriptionPriceConnection:
+        viewer = full_data["viewer"]
+        if "home" in viewer:
+            home = viewer["home"]
+        else:
+            # The query for all homes is only sent without a home id, so the range of the first
+            # home is used like before.
+            homes = viewer["homes"]
+            home = homes[0] if homes else None
+        return SubscriptionPriceConnection(self.range_data(home), self.tibber_client)
+
+    @staticmethod
+    def range_data(home: Optional[dict]) -> Optional[dict]:
+        """Returns the price range of the current subscription in the data of a home from a
+        price range query, or None if the home has no current subscription."""
+        subscription = (home or {}).get("currentSubscription") or {}
+        return (subscription.get("priceInfo") or {}).get("range")
@@ -3,6 +3,7 @@ from __future__ import annotations
 """A class representing the PriceRating type from the GraphQL Tibber API."""
 from typing import TYPE_CHECKING
 
+from tibber.types.cached_view import cached_view
 from tibber.types.price_rating_type import PriceRatingType
 
 from tibber.types.price_rating_threshold_percentages import (  # isort:skip
@@ -21,24 +22,24 @@ class PriceRating:
         self.cache: dict = data or {}
         self.tibber_client: "Account" = tibber_client
 
-    @property
+    @cached_view
     def threshold_percentages(self) -> dict:
         """The different 'high'/'low' price breakpoints (market dependent)"""
         return PriceRatingThresholdPercentages(
             self.cache.get("thresholdPercentages"), self.tibber_client
         )
 
-    @property
+    @cached_view
     def hourly(self) -> dict:
         """The hourly prices of today, the previous 7 days, and tomorrow"""
         return PriceRatingType(self.cache.get("hourly"), self.tibber_client)
 
-    @property
+    @cached_view
     def daily(self) -> dict:
         """The daily prices of today and the previous 30 days"""
         return PriceRatingType(self.cache.get("daily"), self.tibber_client)
 
-    @property
+    @cached_view
     def monthly(self) -> dict:
         """The monthly prices of this month and the previous 31 months"""
         return PriceRatingType(self.cache.get("monthly"), self.tibber_client)
@@ -3,6 +3,7 @@ from __future__ import annotations
 """A class representing the PriceRatingType type from the GraphQL Tibber API."""
 from typing import TYPE_CHECKING, List
 
+from tibber.types.cached_view import cached_view
 from tibber.types.price_rating_entry import PriceRatingEntry
 
 # Import type checking modules
@@ -42,7 +43,7 @@ class PriceRatingType:
         """The price currency"""
         return self.cache.get("currency")
 
-    @property
+    @cached_view
     def entries(self) -> List[PriceRatingEntry]:
         """The individual price entries aggregated by hourly/daily/monthly values"""
         return [
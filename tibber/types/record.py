@@ -0,0 +1,73 @@
+"""A base class for the compact record types of tibber.py."""
+
+
+class Record:
+    """A read-only record with one slot per field of a GraphQL type.
+
+    Records are used for types which can occur hundreds of thousands of times, like consumption
+    nodes or prices. Instead of keeping the response dict and reading it for every attribute access,
+    the values are copied into slots once, so a record has no instance __dict__ and keeps no
+    reference to the response. Like the other tibber.py types, a record has a tibber_client
+    attribute with the account it was created for. The account is not part of comparisons or
+    pickles.
+
+    Subclasses list their fields in FIELDS as (attribute name, GraphQL field name, description)
+    triples, and declare the slots with the descriptions as their docstrings, so help() and
+    autodoc document the attributes:
+
+        __slots__ = {attribute: doc for attribute, _, doc in FIELDS}
+
+    Fields missing from the response are None.
+    """
+
+    __slots__ = {
+        "tibber_client": "The account the record belongs to, None for unpickled records."
+    }
+    FIELDS: tuple = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._KEYS = {attribute: key for attribute, key, _ in cls.FIELDS}
+
+    def __init__(self, data: dict, tibber_client=None):
+        """
+        :param data: The response data for this type.
+        :param tibber_client: The account the record belongs to.
+        """
+        object.__setattr__(self, "tibber_client", tibber_client)
+        data = data or {}
+        for attribute, key in self._KEYS.items():
+            object.__setattr__(self, attribute, data.get(key))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} objects are read-only.")
+
+    @property
+    def cache(self) -> dict:
+        """The values of the record as a dict keyed by the GraphQL field names."""
+        return {key: getattr(self, attribute) for attribute, key in self._KEYS.items()}
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, attribute) == getattr(other, attribute)
+            for attribute in self._KEYS
+        )
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, attribute) for attribute in self._KEYS))
+
+    def __repr__(self):
+        values = ", ".join(
+            f"{attribute}={getattr(self, attribute)!r}" for attribute in self._KEYS
+        )
+        return f"{type(self).__name__}({values})"
+
+    def __getstate__(self):
+        return tuple(getattr(self, attribute) for attribute in self._KEYS)
+
+    def __setstate__(self, state):
+        object.__setattr__(self, "tibber_client", None)
+        for attribute, value in zip(self._KEYS, state):
+            object.__setattr__(self, attribute, value)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 """A class representing the Subscription type from the GraphQL Tibber API."""
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
+from tibber.types.cached_view import cached_view
 from tibber.types.legal_entity import LegalEntity
 from tibber.types.price_info import PriceInfo
 from tibber.types.price_rating import PriceRating
@@ -15,15 +16,18 @@ if TYPE_CHECKING:
 class Subscription:
     """A class to get information about the subscription of a TibberHome."""
 
-    def __init__(self, data: dict, tibber_client: "Account"):
+    def __init__(
+        self, data: dict, tibber_client: "Account", home_id: Optional[str] = None
+    ):
         self.cache: dict = data or {}
         self.tibber_client: "Account" = tibber_client
+        self.home_id: Optional[str] = home_id
 
     @property
     def id(self) -> str:
         return self.cache.get("id")
 
-    @property
+    @cached_view
     def subscriber(self) -> LegalEntity:
         """The owner of the subscription"""
         return LegalEntity(self.cache.get("subscriber"), self.tibber_client)
@@ -43,12 +47,12 @@ class Subscription:
         """The current status of the subscription"""
         return self.cache.get("status")
 
-    @property
+    @cached_view
     def price_info(self) -> PriceInfo:
         """Price information related to the subscription"""
-        return PriceInfo(self.cache.get("priceInfo"), self.tibber_client)
+        return PriceInfo(self.cache.get("priceInfo"), self.tibber_client, self.home_id)
 
-    @property
+    @cached_view
     def price_rating(self) -> PriceRating:
         """Price information related to the subscription"""
         return PriceRating(self.cache.get("priceRating"), self.tibber_client)
@@ -3,6 +3,8 @@ from __future__ import annotations
 """A class representing the SubscriptionPriceConnection type from the GraphQL Tibber API."""
 from typing import TYPE_CHECKING
 
+from tibber.types import columnar
+from tibber.types.cached_view import cached_view
 from tibber.types.price import Price
 from tibber.types.subscription_price_edge import SubscriptionPriceEdge
 
@@ -17,24 +19,55 @@ if TYPE_CHECKING:
 class SubscriptionPriceConnection:
     """A class to get subscription price connection."""
 
+    # The columns created by to_arrays, mapped to the GraphQL fields of the nodes.
+    TIME_COLUMNS = {"starts_at": "startsAt"}
+    FLOAT_COLUMNS = {"total": "total", "energy": "energy", "tax": "tax"}
+
     def __init__(self, data: dict, tibber_client: "Account"):
         self.cache: dict = data or {}
         self.tibber_client: "Account" = tibber_client
 
-    @property
+    @cached_view
     def edges(self) -> list[SubscriptionPriceEdge]:
         return [
             SubscriptionPriceEdge(edge, self.tibber_client)
             for edge in self.cache.get("edges", [])
         ]
 
-    @property
+    @cached_view
     def page_info(self) -> SubscriptionPriceConnectionPageInfo:
         return SubscriptionPriceConnectionPageInfo(
             self.cache.get("pageInfo"), self.tibber_client
         )
 
-    @property
+    @cached_view
     def nodes(self) -> list[Price]:
         """List of Price objects from the executed range query."""
         return [Price(node, self.tibber_client) for node in self.cache.get("nodes", [])]
+
+    def to_arrays(self) -> dict:
+        """Converts the nodes into aligned NumPy arrays, one per column.
+
+        Timestamps become datetime64[ms] arrays in UTC, parsed all at once, and the other columns
+        float64 arrays with NaN for missing values. Requires numpy.
+
+        :return: A dict with the arrays for TIME_COLUMNS and FLOAT_COLUMNS.
+        :throws ImportError: If numpy is not installed.
+        """
+        return columnar.nodes_to_arrays(
+            self.cache.get("nodes"), self.TIME_COLUMNS, self.FLOAT_COLUMNS
+        )
+
+    def to_numpy(self):
+        """Converts the nodes into a NumPy structured array with the columns of to_arrays.
+
+        :throws ImportError: If numpy is not installed.
+        """
+        return columnar.arrays_to_records(self.to_arrays())
+
+    def to_dataframe(self):
+        """Converts the nodes into a pandas DataFrame indexed by starts_at (UTC).
+
+        :throws ImportError: If numpy or pandas is not installed.
+        """
+        return columnar.arrays_to_dataframe(self.to_arrays(), index="starts_at")
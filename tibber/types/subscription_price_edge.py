@@ -3,6 +3,7 @@ from __future__ import annotations
 """A class representing the SubscriptionPriceEdge type from the GraphQL Tibber API."""
 from typing import TYPE_CHECKING
 
+from tibber.types.cached_view import cached_view
 from tibber.types.price import Price
 
 if TYPE_CHECKING:
@@ -18,6 +19,6 @@ class SubscriptionPriceEdge:
     def cursor(self) -> str:
         return self.cache.get("cursor")
 
-    @property
+    @cached_view
     def node(self) -> Price:
         return Price(self.cache.get("node"), self.tibber_client)
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 """A class representing the Viewer type from the GraphQL Tibber API."""
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
-from tibber.types.home import TibberHome
+from tibber.types.cached_view import cached_view
 
 # Import type checking modules
 if TYPE_CHECKING:
     from tibber.account import Account
+    from tibber.types.home import TibberHome
 
 
 class Viewer:
@@ -33,16 +34,23 @@ class Viewer:
         """The type of account for the logged-in user."""
         return self.cache.get("accountType")
 
-    @property
+    @cached_view
     def homes(self):
         """All homes visible to the logged-in user"""
         return [
-            TibberHome(home, self.tibber_client) for home in self.cache.get("homes", [])
+            self.tibber_client.home_for_data(home)
+            for home in self.cache.get("homes", [])
         ]
 
+    def home(self, home_id: str) -> Optional["TibberHome"]:
+        """The home with the given id, or None if it is not cached. Use Account.fetch_home to
+        fetch a single home from the API."""
+        for home in self.homes:
+            if home.id == home_id:
+                return home
+        return None
+
     @property
     def websocket_subscription_url(self):
         """The URL to use for websocket subscriptions"""
         return self.cache.get("websocketSubscriptionUrl")
-
-    # TODO: Implement home(id: ID!): Home! method. (get_home and fetch_home)